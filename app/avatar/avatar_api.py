@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Header, HTTPException, Response, status
+
+from app.avatar.avatar_exceptions import AvatarNotFound
+from app.avatar.avatar_factory import get_avatar_service
+from app.avatar.avatar_service import DEFAULT_CONTENT_TYPE, IMAGE_SIGNATURES
+
+# avatars are addressed by a hash of their content, so a response never changes
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+router = APIRouter(prefix="/avatar", tags=["avatar"])
+
+
+@router.get("/{avatar_id}")
+async def get_avatar(avatar_id: str, if_none_match: str | None = Header(default=None)) -> Response:
+    etag = f'"{avatar_id}"'
+    headers = {"Cache-Control": CACHE_CONTROL, "ETag": etag, "X-Content-Type-Options": "nosniff"}
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    avatar_service = get_avatar_service()
+    try:
+        avatar = await avatar_service.get(avatar_id=avatar_id)
+    except AvatarNotFound:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="avatar not found")
+    # avatars stored before their type was checked may have any type, never let a browser render those
+    media_type = avatar.content_type if avatar.content_type in IMAGE_SIGNATURES.values() else DEFAULT_CONTENT_TYPE
+    return Response(content=avatar.data, media_type=media_type, headers=headers)
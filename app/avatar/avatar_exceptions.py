@@ -0,0 +1,12 @@
+from app.core.exceptions import NotFoundException
+
+
+class InvalidAvatar(Exception):
+    def __init__(self, msg: str) -> None:
+        self.msg = msg
+
+
+class AvatarNotFound(NotFoundException):
+    def __init__(self, msg: str, avatar_id: str) -> None:
+        self.msg = msg
+        self.avatar_id = avatar_id
@@ -0,0 +1,11 @@
+from app.avatar.avatar_repository import AbstractAvatarRepository
+from app.avatar.avatar_service import AvatarService
+from app.container import get_container
+
+
+def get_avatar_repository() -> AbstractAvatarRepository:
+    return get_container().avatar_repository
+
+
+def get_avatar_service() -> AvatarService:
+    return get_container().avatar_service
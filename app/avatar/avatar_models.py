@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from beanie import Document, Indexed
+
+
+class Avatar(Document):
+    avatar_id: Indexed(str, unique=True)  # type: ignore
+    content_type: str
+    data: bytes
+    created_at: datetime
+
+    class Collection:
+        name = "avatar"
@@ -0,0 +1,35 @@
+import abc
+
+from omnibus.database.repository import AbstractRepository
+from pymongo.errors import DuplicateKeyError
+
+from app.avatar.avatar_exceptions import AvatarNotFound
+from app.avatar.avatar_models import Avatar
+
+
+class AbstractAvatarRepository(AbstractRepository[Avatar]):
+    @abc.abstractmethod
+    async def add(self, avatar: Avatar):
+        raise NotImplementedError
+
+
+class AvatarRepository(AbstractAvatarRepository):
+    async def add(self, avatar: Avatar):
+        # avatars are keyed by their content, so storing the same avatar twice is a no-op
+        try:
+            await Avatar.get_motor_collection().update_one(
+                {"avatar_id": avatar.avatar_id},
+                {"$setOnInsert": avatar.dict(exclude={"id", "revision_id"})},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            pass
+
+    async def get(self, id_: str) -> Avatar:
+        avatar = await Avatar.find_one(Avatar.avatar_id == id_)
+        if avatar is None:
+            raise AvatarNotFound(msg="avatar not found", avatar_id=id_)
+        return avatar
+
+    async def remove(self, id_: str):
+        return await super().remove(id_)
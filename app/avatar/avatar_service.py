@@ -0,0 +1,59 @@
+import base64
+import binascii
+import hashlib
+from datetime import datetime
+
+from app.avatar.avatar_exceptions import InvalidAvatar
+from app.avatar.avatar_models import Avatar
+from app.avatar.avatar_repository import AbstractAvatarRepository
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+IMAGE_SIGNATURES = {
+    b"\x89PNG\r\n\x1a\n": "image/png",
+    b"\xff\xd8\xff": "image/jpeg",
+    b"GIF87a": "image/gif",
+    b"GIF89a": "image/gif",
+}
+
+
+class AvatarService:
+    def __init__(self, avatar_repository: AbstractAvatarRepository, maximum_size_in_bytes: int = 500_000) -> None:
+        self.avatar_repository = avatar_repository
+        self.maximum_size_in_bytes = maximum_size_in_bytes
+
+    async def add(self, avatar: bytes) -> str:
+        content_type, data = self._decode(avatar)
+        avatar_id = hashlib.sha256(data).hexdigest()
+        await self.avatar_repository.add(
+            Avatar(avatar_id=avatar_id, content_type=content_type, data=data, created_at=datetime.now())
+        )
+        return avatar_id
+
+    async def get(self, avatar_id: str) -> Avatar:
+        return await self.avatar_repository.get(avatar_id)
+
+    def _decode(self, avatar: bytes) -> tuple[str, bytes]:
+        # avatars are served from this origin, so the type comes from the data itself and never from the client
+        if avatar.startswith(b"data:"):
+            _, _, avatar = avatar.partition(b",")
+
+        # clients usually send avatars base64 encoded, but raw bytes are also accepted
+        try:
+            data = base64.b64decode(avatar, validate=True)
+        except binascii.Error:
+            data = avatar
+
+        if len(data) > self.maximum_size_in_bytes:
+            raise InvalidAvatar(f"avatar must be at most {self.maximum_size_in_bytes} bytes")
+
+        content_type = self._sniff_content_type(data)
+        if content_type is None:
+            raise InvalidAvatar("avatar must be a PNG, JPEG or GIF image")
+        return content_type, data
+
+    @staticmethod
+    def _sniff_content_type(data: bytes) -> str | None:
+        for signature, content_type in IMAGE_SIGNATURES.items():
+            if data.startswith(signature):
+                return content_type
+        return None
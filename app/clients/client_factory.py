@@ -0,0 +1,31 @@
+from functools import lru_cache
+
+from httpx import Limits, Timeout
+
+from app.clients.management_api.api_client import ApiClient
+from app.core.config import get_settings
+from app.core.metrics_listeners import ManagementApiTimer
+
+
+@lru_cache
+def get_management_api_client() -> ApiClient:
+    settings = get_settings()
+    limits = Limits(
+        max_connections=settings.MANAGEMENT_API_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.MANAGEMENT_API_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.MANAGEMENT_API_KEEPALIVE_EXPIRY_IN_SECONDS,
+    )
+    timeout = Timeout(
+        settings.MANAGEMENT_API_TIMEOUT_IN_SECONDS, connect=settings.MANAGEMENT_API_CONNECT_TIMEOUT_IN_SECONDS
+    )
+    api_client = ApiClient(
+        host=settings.get_management_url(), limits=limits, timeout=timeout, http2=settings.MANAGEMENT_API_HTTP2
+    )
+    api_client.add_middleware(ManagementApiTimer())
+    return api_client
+
+
+async def close_management_api_client():
+    if get_management_api_client.cache_info().currsize:
+        await get_management_api_client().aclose()
+        get_management_api_client.cache_clear()
@@ -69,7 +69,7 @@ class ApiClient:
         if path_params is None:
             path_params = {}
         url = (self.host or "") + url.format(**path_params)
-        request = Request(method, url, **kwargs)
+        request = self._async_client.build_request(method, url, **kwargs)
         return await self.send(request, type_)
 
     @overload
@@ -102,6 +102,9 @@ class ApiClient:
             raise ResponseHandlingException(e)
         return response
 
+    async def aclose(self) -> None:
+        await self._async_client.aclose()
+
     def add_middleware(self, middleware: MiddlewareT) -> None:
         current_middleware = self.middleware
 
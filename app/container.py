@@ -0,0 +1,130 @@
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from app.avatar.avatar_repository import AbstractAvatarRepository, AvatarRepository
+from app.avatar.avatar_service import AvatarService
+from app.clients.client_factory import (
+    close_management_api_client,
+    get_management_api_client,
+)
+from app.clients.management_api.api.games_api import AsyncGamesApi
+from app.clients.management_api.api.questions_api import AsyncQuestionsApi
+from app.core.config import get_settings
+from app.core.room_ownership import get_room_router
+from app.core.snapshot import Snapshotter
+from app.game_state.action_timer import get_action_timer
+from app.game_state.game_state_memory_repository import InMemoryGameStateRepository
+from app.game_state.game_state_redis_repository import RedisGameStateRepository
+from app.game_state.game_state_repository import (
+    AbstractGameStateRepository,
+    GameStateRepository,
+)
+from app.game_state.game_state_service import GameStateService
+from app.game_state.question_pool import QuestionPool
+from app.player.player_service import PlayerService
+from app.room.lobby.lobby_service import LobbyService
+from app.room.room_cache import RoomCache
+from app.room.room_memory_repository import InMemoryRoomRepository
+from app.room.room_repository import RoomRepository
+from app.room.room_service import RoomService
+
+
+class Container:
+    def __init__(self) -> None:
+        settings = get_settings()
+        api_client = get_management_api_client()
+        self.game_api = AsyncGamesApi(api_client=api_client)
+        self.question_api = AsyncQuestionsApi(api_client=api_client)
+        self.question_pool = QuestionPool(
+            question_client=self.question_api,
+            pool_size=settings.QUESTION_POOL_SIZE,
+            request_timeout_in_seconds=settings.QUESTIONS_REQUEST_TIMEOUT_IN_SECONDS,
+        )
+
+        self.avatar_repository: AbstractAvatarRepository = AvatarRepository()
+        self.redis: Redis | None = None
+        self.game_state_repository: AbstractGameStateRepository = GameStateRepository()
+        if settings.GAME_STATE_BACKEND == "redis":
+            self.redis = Redis.from_url(settings.get_redis_uri(), decode_responses=True)
+            self.game_state_repository = RedisGameStateRepository(redis=self.redis)
+        elif settings.GAME_STATE_BACKEND == "memory":
+            self.game_state_repository = InMemoryGameStateRepository()
+
+        self.room_cache: RoomCache | None = None
+        self.room_repository: RoomRepository
+        if settings.ROOM_BACKEND == "memory":
+            self.room_repository = InMemoryRoomRepository(game_state_repository=self.game_state_repository)
+        else:
+            if settings.ROOM_CACHE_MAX_ENTRIES:
+                self.room_cache = RoomCache(
+                    max_entries=settings.ROOM_CACHE_MAX_ENTRIES,
+                    ttl_in_seconds=settings.ROOM_CACHE_TTL_IN_SECONDS,
+                    redis_uri=settings.get_redis_uri(),
+                )
+            self.room_repository = RoomRepository(
+                room_cache=self.room_cache,
+                game_state_repository=None if settings.GAME_STATE_BACKEND == "mongo" else self.game_state_repository,
+            )
+
+        self.snapshotter: Snapshotter | None = None
+        self.in_memory_repositories: list[InMemoryRoomRepository | InMemoryGameStateRepository] = [
+            repository
+            for repository in (self.room_repository, self.game_state_repository)
+            if isinstance(repository, (InMemoryRoomRepository, InMemoryGameStateRepository))
+        ]
+        if self.in_memory_repositories and settings.MEMORY_SNAPSHOT_INTERVAL_IN_SECONDS:
+            self.snapshotter = Snapshotter(
+                repositories=self.in_memory_repositories,
+                interval_in_seconds=settings.MEMORY_SNAPSHOT_INTERVAL_IN_SECONDS,
+            )
+
+        self.avatar_service = AvatarService(
+            avatar_repository=self.avatar_repository, maximum_size_in_bytes=settings.MAXIMUM_AVATAR_SIZE_IN_BYTES
+        )
+        room_router = get_room_router()
+        self.room_service = RoomService(
+            room_repository=self.room_repository, is_owner=room_router.is_owner if room_router else None
+        )
+        self.player_service = PlayerService(room_repository=self.room_repository, avatar_service=self.avatar_service)
+        self.game_state_service = GameStateService(
+            game_state_repository=self.game_state_repository,
+            question_client=self.question_api,
+            action_timer=get_action_timer(),
+            question_pool=self.question_pool,
+        )
+        self.lobby_service = LobbyService(
+            room_service=self.room_service,
+            game_state_service=self.game_state_service,
+            player_service=self.player_service,
+        )
+
+    async def start(self):
+        if self.room_cache:
+            self.room_cache.start()
+        if self.snapshotter:
+            # with room affinity, a node loads the rooms it owns once it joins the ring
+            if get_room_router() is None:
+                await self.snapshotter.restore()
+            self.snapshotter.start()
+
+    async def close(self):
+        if self.room_cache:
+            await self.room_cache.stop()
+        if self.snapshotter:
+            await self.snapshotter.stop()
+        await self.question_pool.close()
+        if self.redis:
+            await self.redis.close()
+        await close_management_api_client()
+
+
+@lru_cache
+def get_container() -> Container:
+    return Container()
+
+
+async def close_container():
+    if get_container.cache_info().currsize:
+        await get_container().close()
+        get_container.cache_clear()
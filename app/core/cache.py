@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class CacheStats(BaseModel):
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0
+
+
+class LRUCache(Generic[T]):
+    def __init__(self, max_entries: int, ttl_in_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_in_seconds = ttl_in_seconds
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._stats.misses += 1
+            self._stats.evictions += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(self, key: str, value: T):
+        self._entries[key] = (time.monotonic() + self.ttl_in_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats.copy(update={"size": len(self._entries)})
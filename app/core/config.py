@@ -1,7 +1,8 @@
 from functools import lru_cache
-from typing import TypedDict
+from typing import Literal, TypedDict
 
 from omnibus.config.settings import OmnibusSettings
+from pydantic import root_validator
 
 
 class IgnoreAttributes(TypedDict):
@@ -11,14 +12,54 @@ class IgnoreAttributes(TypedDict):
 class Settings(OmnibusSettings):
     MANAGEMENT_API_URL: str
     MANAGEMENT_API_PORT: int | None
+    MANAGEMENT_API_MAX_CONNECTIONS: int = 100
+    MANAGEMENT_API_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    MANAGEMENT_API_KEEPALIVE_EXPIRY_IN_SECONDS: float = 30
+    MANAGEMENT_API_TIMEOUT_IN_SECONDS: float = 5
+    MANAGEMENT_API_CONNECT_TIMEOUT_IN_SECONDS: float = 2
+    MANAGEMENT_API_HTTP2: bool = False
     DISCONNECT_TIMER_IN_SECONDS: int = 300
+    MAXIMUM_PLAYERS_PER_ROOM: int = 10
+    MAXIMUM_AVATAR_SIZE_IN_BYTES: int = 500_000
+    DISCONNECTED_PLAYER_SWEEP_INTERVAL_IN_SECONDS: int = 30
+    DISCONNECTED_PLAYER_SWEEP_BATCH_SIZE: int = 100
+    # other nodes only drop their cached copy once they get the invalidation, so they can briefly read stale rooms
+    ROOM_CACHE_MAX_ENTRIES: int = 0
+    ROOM_CACHE_TTL_IN_SECONDS: float = 60
+    LOOP_LAG_SAMPLE_INTERVAL_IN_SECONDS: float = 0.5
+    LOOP_LAG_WINDOW_SIZE: int = 20
+    LOAD_SHEDDING_MAX_LOOP_LAG_IN_SECONDS: float = 0.5
+    LOAD_SHEDDING_MAX_EVENTS_IN_FLIGHT: int = 1000
 
     MESSAGE_QUEUE_HOST: str
     MESSAGE_QUEUE_PORT: int | None
     MESSAGE_QUEUE_PASSWORD: str | None
+    ROOM_BACKEND: Literal["mongo", "memory"] = "mongo"
+    GAME_STATE_BACKEND: Literal["mongo", "redis", "memory"] = "mongo"
+    MEMORY_SNAPSHOT_INTERVAL_IN_SECONDS: float = 0
+    SOCKET_JSON_ENCODER: Literal["json", "orjson"] = "json"
+    SOCKET_PACKET_SERIALIZER: Literal["default", "msgpack"] = "default"
 
     QUESTIONS_PER_ROUND: int = 3
-    LOG_RESPONSE_EXCLUDE_ATTR: IgnoreAttributes = {"list": {"players": {"avatar"}}}
+    QUESTION_POOL_SIZE: int = 30
+    QUESTIONS_REQUEST_TIMEOUT_IN_SECONDS: float = 2
+    START_GAME_QUESTIONS_TIMEOUT_IN_SECONDS: float = 5
+    ROOM_EVENT_MAX_BATCH_SIZE: int = 20
+    ROOM_AFFINITY_ENABLED: bool = False
+    ROOM_AFFINITY_HEARTBEAT_INTERVAL_IN_SECONDS: float = 2
+    ROOM_AFFINITY_NODE_TTL_IN_SECONDS: float = 6
+    LOG_RESPONSE_EXCLUDE_ATTR: IgnoreAttributes = {"list": {}}
+    LOG_RESPONSE_SAMPLE_RATE: int = 1
+    LOG_QUEUE_MAX_SIZE: int = 10_000
+    LOG_BATCH_SIZE: int = 100
+
+    @root_validator(skip_on_failure=True)
+    def memory_backend_needs_room_affinity(cls, values):
+        # each node only holds its own rooms in memory, so every event for a room has to reach the node holding it
+        memory_backends = [name for name in ("ROOM_BACKEND", "GAME_STATE_BACKEND") if values.get(name) == "memory"]
+        if memory_backends and not values.get("ROOM_AFFINITY_ENABLED"):
+            raise ValueError(f"{' and '.join(memory_backends)} set to memory needs ROOM_AFFINITY_ENABLED")
+        return values
 
     class Config:
         env_prefix = "BANTER_BUS_CORE_API_"
@@ -0,0 +1,64 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from structlog import get_logger
+
+from app.core.config import get_settings
+from app.event_models import EventModel
+
+if TYPE_CHECKING:
+    from pydantic.typing import MappingIntStrAny
+
+
+class LazyEventLog:
+    # only rendered if a log line is actually written, e.g. not when the log level is above debug
+    __slots__ = ("response", "exclude")
+
+    def __init__(self, response: EventModel, exclude: "MappingIntStrAny | None") -> None:
+        self.response = response
+        self.exclude = exclude
+
+    def render(self) -> dict[str, Any]:
+        return self.response.dict(exclude=self.exclude)
+
+    def __structlog__(self) -> dict[str, Any]:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return repr(self.render())
+
+
+class EventLogSampler:
+    def __init__(self, sample_rate: int) -> None:
+        self.sample_rate = max(sample_rate, 1)
+        self._seen: dict[str, int] = {}
+
+    def should_log(self, event_name: str) -> bool:
+        seen = self._seen.get(event_name, 0)
+        self._seen[event_name] = seen + 1
+        return seen % self.sample_rate == 0
+
+
+@lru_cache(maxsize=None)
+def get_exclude_plan(model: type[EventModel]) -> "MappingIntStrAny | None":
+    settings = get_settings()
+    plan: MappingIntStrAny = {
+        attribute: {"__all__": ignore_fields}
+        for attribute, ignore_fields in settings.LOG_RESPONSE_EXCLUDE_ATTR["list"].items()
+        if attribute in model.__fields__
+    }
+    return plan or None
+
+
+@lru_cache
+def get_event_log_sampler() -> EventLogSampler:
+    settings = get_settings()
+    return EventLogSampler(sample_rate=settings.LOG_RESPONSE_SAMPLE_RATE)
+
+
+def log_response(response: EventModel):
+    if not get_event_log_sampler().should_log(response.event_name):
+        return
+
+    logger = get_logger()
+    logger.debug(response.event_name, data=LazyEventLog(response, exclude=get_exclude_plan(type(response))))
@@ -0,0 +1,77 @@
+import asyncio
+import contextlib
+from collections import deque
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.core.metrics import get_metrics
+
+LAG_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class LoopLagMonitor:
+    def __init__(self, interval_in_seconds: float, window_size: int) -> None:
+        self.interval_in_seconds = interval_in_seconds
+        self._lags: deque[float] = deque(maxlen=window_size)
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def record(self, lag_in_seconds: float):
+        self._lags.append(lag_in_seconds)
+
+    def percentile(self, quantile: float) -> float:
+        if not self._lags:
+            return 0
+        lags = sorted(self._lags)
+        return lags[min(int(quantile * len(lags)), len(lags) - 1)]
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval_in_seconds)
+            # anything past the interval is time the loop was busy running something else
+            self.record(max(loop.time() - start - self.interval_in_seconds, 0))
+
+
+class AdmissionController:
+    def __init__(self, lag_monitor: LoopLagMonitor, max_loop_lag_in_seconds: float, max_events_in_flight: int) -> None:
+        self.lag_monitor = lag_monitor
+        self.max_loop_lag_in_seconds = max_loop_lag_in_seconds
+        self.max_events_in_flight = max_events_in_flight
+
+    def should_admit(self) -> bool:
+        if self.max_loop_lag_in_seconds and self.lag_monitor.percentile(0.9) > self.max_loop_lag_in_seconds:
+            return False
+
+        metrics = get_metrics()
+        if self.max_events_in_flight and metrics.events_in_flight.total() > self.max_events_in_flight:
+            return False
+        return True
+
+
+@lru_cache
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    settings = get_settings()
+    return LoopLagMonitor(
+        interval_in_seconds=settings.LOOP_LAG_SAMPLE_INTERVAL_IN_SECONDS, window_size=settings.LOOP_LAG_WINDOW_SIZE
+    )
+
+
+@lru_cache
+def get_admission_controller() -> AdmissionController:
+    settings = get_settings()
+    return AdmissionController(
+        lag_monitor=get_loop_lag_monitor(),
+        max_loop_lag_in_seconds=settings.LOAD_SHEDDING_MAX_LOOP_LAG_IN_SECONDS,
+        max_events_in_flight=settings.LOAD_SHEDDING_MAX_EVENTS_IN_FLIGHT,
+    )
@@ -0,0 +1,120 @@
+import queue
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, TextIO
+
+import structlog
+from structlog.types import EventDict, Processor, WrappedLogger
+
+from app.core.config import get_settings
+from app.core.metrics import get_metrics
+
+
+class QueuedLogSink:
+    def __init__(
+        self, processors: list[Processor], max_queue_size: int, batch_size: int, stream: TextIO | None = None
+    ) -> None:
+        self.processors = processors
+        self.batch_size = batch_size
+        self.stream = stream or sys.stdout
+        self.dropped = 0
+        self._queue: queue.Queue[tuple[str, EventDict] | None] = queue.Queue(maxsize=max_queue_size)
+        self._thread: threading.Thread | None = None
+        self._reported_dropped = 0
+        self._previous_processors: list[Processor] | None = None
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        if event_dict.get("exc_info") is True:
+            # the formatting thread has no exception of its own to look up
+            event_dict["exc_info"] = sys.exc_info()
+
+        try:
+            self._queue.put_nowait((method_name, event_dict))
+        except queue.Full:
+            self.dropped += 1
+            get_metrics().log_records_dropped.inc()
+        raise structlog.DropEvent
+
+    def start(self, previous_processors: list[Processor]):
+        self._previous_processors = previous_processors
+        self._thread = threading.Thread(target=self._run, name="log-sink", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread:
+            # anything logged after this is written straight away again
+            structlog.configure(processors=self._previous_processors)
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [record for record in batch if record is not None]
+            self._write(records)
+            if len(records) < len(batch):
+                return
+
+    def _write(self, records: list[tuple[str, EventDict]]):
+        rendered = (self._render(method_name, event_dict) for method_name, event_dict in records)
+        lines = [line for line in rendered if line]
+        if self.dropped > self._reported_dropped:
+            lines.append(f"dropped {self.dropped - self._reported_dropped} log records, log queue was full")
+            self._reported_dropped = self.dropped
+
+        if lines:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+
+    def _render(self, method_name: str, event_dict: EventDict) -> str:
+        rendered: Any = event_dict
+        try:
+            for processor in self.processors:
+                rendered = processor(None, method_name, rendered)
+        except structlog.DropEvent:
+            return ""
+        except Exception as e:
+            return f"failed to render log record {event_dict.get('event')!r}: {e!r}"
+        return rendered if isinstance(rendered, str) else repr(rendered)
+
+
+def install_log_sink(max_queue_size: int, batch_size: int) -> QueuedLogSink:
+    processors = structlog.get_config()["processors"]
+    # exception and renderer formatting is the slow part, everything before it, like timestamps, runs on the caller
+    split_at = next(
+        (
+            index
+            for index, processor in enumerate(processors)
+            if processor is structlog.processors.format_exc_info
+            or isinstance(processor, structlog.processors.ExceptionPrettyPrinter)
+        ),
+        len(processors) - 1,
+    )
+    log_sink = QueuedLogSink(processors[split_at:], max_queue_size=max_queue_size, batch_size=batch_size)
+    log_sink.start(previous_processors=processors)
+    structlog.configure(processors=[*processors[:split_at], log_sink])
+    return log_sink
+
+
+@lru_cache
+def get_log_sink() -> QueuedLogSink | None:
+    settings = get_settings()
+    if not settings.LOG_QUEUE_MAX_SIZE:
+        return None
+    return install_log_sink(max_queue_size=settings.LOG_QUEUE_MAX_SIZE, batch_size=settings.LOG_BATCH_SIZE)
+
+
+def close_log_sink():
+    if get_log_sink.cache_info().currsize:
+        log_sink = get_log_sink()
+        if log_sink:
+            log_sink.stop()
+        get_log_sink.cache_clear()
@@ -0,0 +1,190 @@
+import bisect
+import threading
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 65536)
+
+
+def estimate_size(value: Any) -> int:
+    # roughly the size of the value encoded as JSON, without encoding it, strings are usually most of a payload
+    if isinstance(value, (str, bytes)):
+        return len(value) + 2
+    elif isinstance(value, dict):
+        return sum(estimate_size(key) + estimate_size(item) + 2 for key, item in value.items()) + 2
+    elif isinstance(value, (list, tuple)):
+        return sum(estimate_size(item) + 1 for item in value) + 2
+    return 8
+
+
+class Metric:
+    type_ = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        # metrics are also recorded from pymongo's monitoring threads
+        self._lock = threading.Lock()
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_}"
+        yield from self._render_samples()
+
+    def _render_samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def _label_values(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[label_name]) for label_name in self.label_names)
+
+    def _format_labels(self, label_values: tuple[str, ...], extra: dict[str, str] | None = None) -> str:
+        labels = {**dict(zip(self.label_names, label_values)), **(extra or {})}
+        if not labels:
+            return ""
+
+        formatted = ",".join(f'{name}="{self._escape(value)}"' for name, value in labels.items())
+        return f"{{{formatted}}}"
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Counter(Metric):
+    type_ = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, value: float, **labels: str):
+        # totals already counted elsewhere, like cache hits, are copied in rather than incremented
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def total(self) -> float:
+        with self._lock:
+            return sum(self._values.values())
+
+    def _render_samples(self) -> Iterator[str]:
+        with self._lock:
+            values = dict(self._values)
+        for label_values, value in values.items():
+            yield f"{self.name}{self._format_labels(label_values)} {value}"
+
+
+class Gauge(Counter):
+    type_ = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    type_ = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = buckets
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._label_values(labels)
+        # the last slot counts observations above every bucket, i.e. +Inf
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0) + value
+
+    def _render_samples(self) -> Iterator[str]:
+        with self._lock:
+            counts = {key: list(value) for key, value in self._counts.items()}
+            sums = dict(self._sums)
+
+        for label_values, bucket_counts in counts.items():
+            cumulative = 0
+            for bucket, count in zip([*self.buckets, "+Inf"], bucket_counts):
+                cumulative += count
+                labels = self._format_labels(label_values, extra={"le": str(bucket)})
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{self._format_labels(label_values)} {sums[label_values]}"
+            yield f"{self.name}_count{self._format_labels(label_values)} {cumulative}"
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.event_duration = Histogram(
+            "banter_bus_event_duration_seconds", "Time taken to handle a socket event.", ("event_name",)
+        )
+        self.event_payload_size = Histogram(
+            "banter_bus_event_payload_bytes",
+            "Approximate size of socket event payloads, encoded as JSON.",
+            ("event_name",),
+            buckets=SIZE_BUCKETS,
+        )
+        self.events_in_flight = Gauge(
+            "banter_bus_events_in_flight", "Socket events currently being handled.", ("event_name",)
+        )
+        self.event_errors = Counter(
+            "banter_bus_event_errors_total", "Socket events that failed or returned an error.", ("event_name", "error")
+        )
+        self.mongo_command_duration = Histogram(
+            "banter_bus_mongo_command_duration_seconds", "Time taken by MongoDB commands.", ("command", "status")
+        )
+        self.management_api_request_duration = Histogram(
+            "banter_bus_management_api_request_duration_seconds",
+            "Time taken by requests to the management API.",
+            ("method", "status_code"),
+        )
+        self.event_loop_lag = Gauge(
+            "banter_bus_event_loop_lag_seconds", "Recent event loop lag percentiles.", ("quantile",)
+        )
+        self.log_records_dropped = Counter(
+            "banter_bus_log_records_dropped_total", "Log records dropped because the log queue was full."
+        )
+        self.room_cache_size = Gauge("banter_bus_room_cache_size", "Rooms in the room cache.")
+        self.room_cache_lookups = Counter(
+            "banter_bus_room_cache_lookups_total", "Room cache lookups, by whether they hit.", ("result",)
+        )
+        self.room_cache_evictions = Counter(
+            "banter_bus_room_cache_evictions_total", "Rooms evicted from the room cache as they expired or it filled."
+        )
+        self.question_pool_size = Gauge("banter_bus_question_pool_size", "Questions in each question pool.", ("pool",))
+        self.question_pool_lookups = Counter(
+            "banter_bus_question_pool_lookups_total",
+            "Question pool lookups, by whether the pool had enough questions.",
+            ("pool", "result"),
+        )
+        self.question_pool_refill_duration = Histogram(
+            "banter_bus_question_pool_refill_duration_seconds",
+            "Time taken to refill a question pool from the management API.",
+            ("pool",),
+        )
+
+    def __iter__(self) -> Iterator[Metric]:
+        return (metric for metric in vars(self).values() if isinstance(metric, Metric))
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self for line in metric.render()) + "\n"
+
+
+@lru_cache
+def get_metrics() -> Metrics:
+    return Metrics()
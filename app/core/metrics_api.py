@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Response
+
+from app.container import get_container
+from app.core.load_shedding import LAG_QUANTILES, get_loop_lag_monitor
+from app.core.metrics import Metrics, get_metrics
+from app.game_state.question_pool import get_pool_name
+
+# https://prometheus.io/docs/instrumenting/exposition_formats/#text-based-format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics")
+async def get_metrics_text() -> Response:
+    metrics = get_metrics()
+    _collect_stats(metrics)
+    return Response(content=metrics.render(), media_type=CONTENT_TYPE)
+
+
+def _collect_stats(metrics: Metrics):
+    lag_monitor = get_loop_lag_monitor()
+    for quantile in LAG_QUANTILES:
+        metrics.event_loop_lag.set(lag_monitor.percentile(quantile), quantile=str(quantile))
+
+    container = get_container()
+    if container.room_cache:
+        room_cache_stats = container.room_cache.stats
+        metrics.room_cache_size.set(room_cache_stats.size)
+        metrics.room_cache_lookups.set(room_cache_stats.hits, result="hit")
+        metrics.room_cache_lookups.set(room_cache_stats.misses, result="miss")
+        metrics.room_cache_evictions.set(room_cache_stats.evictions)
+
+    # refill latency is recorded as a histogram when the pool is refilled
+    for key, stats in container.question_pool.stats().items():
+        pool = get_pool_name(key)
+        metrics.question_pool_size.set(stats.size, pool=pool)
+        metrics.question_pool_lookups.set(stats.hits, pool=pool, result="hit")
+        metrics.question_pool_lookups.set(stats.misses, pool=pool, result="miss")
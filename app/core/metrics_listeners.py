@@ -0,0 +1,40 @@
+import time
+
+from httpx import Request, Response
+from pymongo import monitoring
+
+from app.clients.management_api.api_client import BaseMiddleware, Send
+from app.core.metrics import get_metrics
+
+
+class MongoCommandTimer(monitoring.CommandListener):
+    def started(self, event: monitoring.CommandStartedEvent):
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._observe(event, status="succeeded")
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._observe(event, status="failed")
+
+    @staticmethod
+    def _observe(event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent, status: str):
+        metrics = get_metrics()
+        metrics.mongo_command_duration.observe(
+            event.duration_micros / 1_000_000, command=event.command_name, status=status
+        )
+
+
+class ManagementApiTimer(BaseMiddleware):
+    async def __call__(self, request: Request, call_next: Send) -> Response:
+        status_code = "error"
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+            status_code = str(response.status_code)
+            return response
+        finally:
+            metrics = get_metrics()
+            metrics.management_api_request_duration.observe(
+                time.perf_counter() - start, method=request.method, status_code=status_code
+            )
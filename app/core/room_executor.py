@@ -0,0 +1,98 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, TypeVar, Union
+
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+BatchResults = Sequence[Union[Any, Exception]]
+
+
+@dataclass
+class _Job:
+    future: asyncio.Future[Any]
+    run: Callable[[], Awaitable[Any]] | None = None
+    batch_key: str | None = None
+    item: Any = None
+    apply_batch: Callable[[list[Any]], Awaitable[BatchResults]] | None = None
+
+
+class RoomExecutor:
+    def __init__(self, max_batch_size: int) -> None:
+        self.max_batch_size = max_batch_size
+        self._mailboxes: dict[str, deque[_Job]] = {}
+        self._workers: set[asyncio.Task[None]] = set()
+
+    async def run(self, room_id: str, func: Callable[[], Awaitable[T]]) -> T:
+        job = _Job(future=asyncio.get_running_loop().create_future(), run=func)
+        return await self._submit(room_id, job)
+
+    async def run_batched(
+        self, room_id: str, batch_key: str, item: Any, apply_batch: Callable[[list[Any]], Awaitable[BatchResults]]
+    ) -> Any:
+        # queued jobs with the same key are applied together, apply_batch returns a result or an exception per item
+        job = _Job(
+            future=asyncio.get_running_loop().create_future(), batch_key=batch_key, item=item, apply_batch=apply_batch
+        )
+        return await self._submit(room_id, job)
+
+    async def _submit(self, room_id: str, job: _Job) -> Any:
+        mailbox = self._mailboxes.get(room_id)
+        if mailbox is None:
+            mailbox = self._mailboxes[room_id] = deque()
+            worker = asyncio.create_task(self._drain(room_id, mailbox))
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+        mailbox.append(job)
+        return await job.future
+
+    async def _drain(self, room_id: str, mailbox: deque[_Job]):
+        try:
+            while mailbox:
+                job = mailbox.popleft()
+                jobs = [job]
+                while (
+                    job.batch_key
+                    and mailbox
+                    and mailbox[0].batch_key == job.batch_key
+                    and len(jobs) < self.max_batch_size
+                ):
+                    jobs.append(mailbox.popleft())
+                await self._execute(jobs)
+        finally:
+            # rooms without pending events don't keep a mailbox around
+            del self._mailboxes[room_id]
+            for job in mailbox:
+                self._set_result(job, RuntimeError("room executor stopped"))
+
+    async def _execute(self, jobs: list[_Job]):
+        try:
+            if jobs[0].run:
+                results: BatchResults = [await jobs[0].run()]
+            else:
+                results = await jobs[0].apply_batch([job.item for job in jobs])  # type: ignore
+        except Exception as e:
+            results = [e] * len(jobs)
+
+        for job, result in zip(jobs, results):
+            self._set_result(job, result)
+
+    @staticmethod
+    def _set_result(job: _Job, result: Any):
+        if job.future.done():
+            return
+        elif isinstance(result, Exception):
+            job.future.set_exception(result)
+        else:
+            job.future.set_result(result)
+
+
+@lru_cache
+def get_room_executor() -> RoomExecutor:
+    settings = get_settings()
+    return RoomExecutor(max_batch_size=settings.ROOM_EVENT_MAX_BATCH_SIZE)
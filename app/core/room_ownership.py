@@ -0,0 +1,215 @@
+import asyncio
+import bisect
+import contextlib
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Optional
+
+from omnibus.log.logger import get_logger
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+
+NODES_KEY = "banter_bus_core_api:nodes"
+NODE_CHANNEL = "banter_bus_core_api:node"
+
+Dispatch = Callable[[str, str, Any], Awaitable[None]]
+OwnershipChanged = Callable[["HashRing", "HashRing"], Awaitable[None]]
+HandedOver = Callable[[list[str]], Awaitable[None]]
+# a [start, end) range of ring positions, with no end the range runs to the end of the ring
+RingRange = tuple[str, Optional[str]]
+
+# set while handling an event forwarded by another node, so it's never forwarded again
+_forwarded: ContextVar[bool] = ContextVar("forwarded", default=False)
+
+
+class HashRing:
+    def __init__(self, nodes: Iterable[str], replicas: int = 100) -> None:
+        self.nodes = frozenset(nodes)
+        self._ring = sorted(
+            (self._hash(f"{node}:{replica}"), node) for node in self.nodes for replica in range(replicas)
+        )
+        self._hashes = [hash_ for hash_, _ in self._ring]
+
+    def owner(self, key: str) -> str | None:
+        return self._owner_at(self._hash(key))
+
+    def gained_ranges(self, previous_ring: "HashRing", node_id: str) -> list[RingRange]:
+        # no ring hashes fall between two neighbouring boundaries, so each ring has one owner between them
+        boundaries = sorted({0, *self._hashes, *previous_ring._hashes})
+        ranges: list[tuple[int, int | None]] = []
+        for start, end in zip(boundaries, [*boundaries[1:], None]):
+            if self._owner_at(start) != node_id or previous_ring._owner_at(start) == node_id:
+                continue
+            elif ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        return [(self._to_position(start), None if end is None else self._to_position(end)) for start, end in ranges]
+
+    def _owner_at(self, hash_: int) -> str | None:
+        if not self._ring:
+            return None
+        index = bisect.bisect(self._hashes, hash_) % len(self._ring)
+        return self._ring[index][1]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+    @staticmethod
+    def _to_position(hash_: int) -> str:
+        # fixed width hex sorts the same way as the hashes, and unlike them fits in the database
+        return f"{hash_:016x}"
+
+
+def ring_position(key: str) -> str:
+    return HashRing._to_position(HashRing._hash(key))
+
+
+def ring_range_query(ranges: Iterable[RingRange]) -> dict[str, Any]:
+    # documents written by snapshots store their position on the ring, so a node can load only the rooms it owns
+    conditions = []
+    for start, end in ranges:
+        position = {"$gte": start} if end is None else {"$gte": start, "$lt": end}
+        conditions.append({"ring_position": position})
+    return {"$or": conditions}
+
+
+class RoomRouter:
+    def __init__(self, redis: Redis, heartbeat_interval_in_seconds: float, node_ttl_in_seconds: float) -> None:
+        self.redis = redis
+        self.node_id = uuid.uuid4().hex
+        self.heartbeat_interval_in_seconds = heartbeat_interval_in_seconds
+        self.node_ttl_in_seconds = node_ttl_in_seconds
+        # empty until the first heartbeat, so joining the ring gains this node all the rooms it owns
+        self.ring = HashRing([])
+        self._dispatch: Dispatch | None = None
+        self._ownership_listeners: list[OwnershipChanged] = []
+        self._handover_listeners: list[HandedOver] = []
+        self._tasks: list[asyncio.Task[None]] = []
+        self._forwarded_events: set[asyncio.Task[None]] = set()
+
+    def add_ownership_listener(self, listener: OwnershipChanged):
+        self._ownership_listeners.append(listener)
+
+    def add_handover_listener(self, listener: HandedOver):
+        self._handover_listeners.append(listener)
+
+    def is_owner(self, room_id: str) -> bool:
+        return _forwarded.get() or self.ring.owner(room_id) in (None, self.node_id)
+
+    async def forward(self, room_id: str, event_name: str, sid: str, data: Any) -> bool:
+        if self.is_owner(room_id):
+            return False
+
+        owner = self.ring.owner(room_id)
+        message = json.dumps({"event_name": event_name, "sid": sid, "data": data}, default=str)
+        receivers = await self.redis.publish(f"{NODE_CHANNEL}:{owner}", message)
+        # the owner is gone but its heartbeat hasn't expired yet, better to handle it here than drop it
+        return receivers > 0
+
+    async def hand_over(self, room_ids: Iterable[str]):
+        # tells the new owners these rooms are in the database, so they load them rather than use older copies
+        room_ids_by_owner: dict[str, list[str]] = {}
+        for room_id in room_ids:
+            owner = self.ring.owner(room_id)
+            if owner and owner != self.node_id:
+                room_ids_by_owner.setdefault(owner, []).append(room_id)
+
+        for owner, owned_room_ids in room_ids_by_owner.items():
+            await self.redis.publish(f"{NODE_CHANNEL}:{owner}", json.dumps({"handed_over": owned_room_ids}))
+
+    async def start(self, dispatch: Dispatch):
+        self._dispatch = dispatch
+        await self._heartbeat()
+        self._tasks = [asyncio.create_task(self._run_heartbeat()), asyncio.create_task(self._listen())]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        # leave straight away, rather than waiting for the heartbeat to expire, so rooms are handed over quickly
+        await self.redis.zrem(NODES_KEY, self.node_id)
+        await self.redis.close()
+
+    async def _run_heartbeat(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval_in_seconds)
+            try:
+                await self._heartbeat()
+            except Exception:
+                logger = get_logger()
+                logger.exception("failed to send room router heartbeat", node_id=self.node_id)
+
+    async def _heartbeat(self):
+        now = time.time()
+        pipeline = self.redis.pipeline()
+        pipeline.zadd(NODES_KEY, {self.node_id: now})
+        pipeline.zremrangebyscore(NODES_KEY, 0, now - self.node_ttl_in_seconds)
+        pipeline.zrange(NODES_KEY, 0, -1)
+        *_, nodes = await pipeline.execute()
+
+        if set(nodes) != self.ring.nodes:
+            previous_ring, self.ring = self.ring, HashRing(nodes)
+            logger = get_logger()
+            logger.info("room owners changed", node_id=self.node_id, nodes=sorted(self.ring.nodes))
+            for listener in self._ownership_listeners:
+                await listener(previous_ring, self.ring)
+
+    async def _listen(self):
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(f"{NODE_CHANNEL}:{self.node_id}")
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+
+                        data = json.loads(message["data"])
+                        if "handed_over" in data:
+                            self._handle_handover(data["handed_over"])
+                        else:
+                            self._handle_forwarded(data)
+            except Exception:
+                logger = get_logger()
+                logger.exception("room router lost its subscription", node_id=self.node_id)
+                await asyncio.sleep(1)
+
+    def _handle_forwarded(self, message: dict[str, Any]):
+        if self._dispatch is None:
+            return
+
+        token = _forwarded.set(True)
+        try:
+            task = asyncio.create_task(self._dispatch(message["event_name"], message["sid"], message["data"]))
+        finally:
+            _forwarded.reset(token)
+        self._forwarded_events.add(task)
+        task.add_done_callback(self._forwarded_events.discard)
+
+    def _handle_handover(self, room_ids: list[str]):
+        for listener in self._handover_listeners:
+            task = asyncio.create_task(listener(room_ids))
+            self._forwarded_events.add(task)
+            task.add_done_callback(self._forwarded_events.discard)
+
+
+@lru_cache
+def get_room_router() -> RoomRouter | None:
+    settings = get_settings()
+    if not settings.ROOM_AFFINITY_ENABLED:
+        return None
+
+    return RoomRouter(
+        redis=Redis.from_url(settings.get_redis_uri(), decode_responses=True),
+        heartbeat_interval_in_seconds=settings.ROOM_AFFINITY_HEARTBEAT_INTERVAL_IN_SECONDS,
+        node_ttl_in_seconds=settings.ROOM_AFFINITY_NODE_TTL_IN_SECONDS,
+    )
@@ -0,0 +1,66 @@
+import asyncio
+import contextlib
+from collections.abc import Sequence
+from typing import Any, Protocol
+
+from beanie import Document
+from beanie.odm.utils.encoder import Encoder
+from omnibus.log.logger import get_logger
+
+from app.core.room_ownership import ring_position
+
+
+class Snapshottable(Protocol):
+    async def restore(self):
+        ...
+
+    async def snapshot(self):
+        ...
+
+
+class Snapshotter:
+    def __init__(self, repositories: Sequence[Snapshottable], interval_in_seconds: float) -> None:
+        self.repositories = repositories
+        self.interval_in_seconds = interval_in_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    async def restore(self):
+        for repository in self.repositories:
+            await repository.restore()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            await self.snapshot()
+
+    async def snapshot(self):
+        for repository in self.repositories:
+            try:
+                await repository.snapshot()
+            except Exception:
+                logger = get_logger()
+                logger.exception("failed to snapshot repository", repository=type(repository).__name__)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_in_seconds)
+            await self.snapshot()
+
+
+async def write_snapshot(model: type[Document], key: str, documents: Sequence[Document], removed: set[str]):
+    collection = model.get_motor_collection()
+    if removed:
+        await collection.delete_many({key: {"$in": list(removed)}})
+
+    for document in documents:
+        encoded: dict[str, Any] = Encoder(to_db=True).encode(document)
+        encoded.pop("_id", None)
+        encoded.pop("revision_id", None)
+        encoded["ring_position"] = ring_position(encoded[key])
+        await collection.replace_one({key: encoded[key]}, encoded, upsert=True)
@@ -0,0 +1,26 @@
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_or_cancel(*aws: Awaitable[T], timeout: float | None = None) -> list[T]:
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return []
+
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.exception():
+                task.result()
+
+        if pending:
+            raise asyncio.TimeoutError(f"{len(pending)} tasks did not finish within {timeout}s")
+        return [task.result() for task in tasks]
+    finally:
+        pending_tasks = [task for task in tasks if not task.done()]
+        for task in pending_tasks:
+            task.cancel()
+        await asyncio.gather(*pending_tasks, return_exceptions=True)
@@ -0,0 +1,57 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class UnitOfWork:
+    def __init__(self) -> None:
+        self.identity_map: dict[tuple[type, str], Any] = {}
+        self.round_trips = 0
+
+    def get(self, model: type[T], key: str) -> T | None:
+        return self.identity_map.get((model, key))
+
+    def find(self, model: type[T], predicate: Callable[[T], bool]) -> T | None:
+        for (cached_model, _), document in self.identity_map.items():
+            if cached_model is model and predicate(document):
+                return document
+        return None
+
+    def add(self, key: str, document: Any):
+        self.identity_map[(type(document), key)] = document
+
+    def evict(self, key: str | None = None):
+        if key is None:
+            self.identity_map.clear()
+            return
+
+        for identity in [identity for identity in self.identity_map if identity[1] == key]:
+            del self.identity_map[identity]
+
+
+_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar("unit_of_work", default=None)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    work = UnitOfWork()
+    token = _unit_of_work.set(work)
+    try:
+        yield work
+    finally:
+        _unit_of_work.reset(token)
+
+
+def get_unit_of_work() -> UnitOfWork:
+    # every entry point (events, background tasks, startup) opens its own, so round trips are never lost
+    work = _unit_of_work.get()
+    if work is None:
+        raise RuntimeError("repositories used outside of a unit of work, wrap the caller in `unit_of_work()`")
+    return work
+
+
+def record_round_trip():
+    get_unit_of_work().round_trips += 1
@@ -1,9 +1,15 @@
-from collections.abc import Callable, Coroutine
-from typing import Any
+import time
+from collections.abc import Callable, Coroutine, Sequence
+from functools import wraps
+from typing import Any, Optional, Union
 
 from structlog import get_logger
 
-from app.core.config import get_settings
+from app.core.event_log import log_response
+from app.core.metrics import estimate_size, get_metrics
+from app.core.room_executor import get_room_executor
+from app.core.room_ownership import get_room_router
+from app.core.unit_of_work import unit_of_work
 from app.event_models import ERROR, Error
 from app.main import sio
 from app.room.room_events_models import EventModel, EventResponse
@@ -14,7 +20,9 @@ def error_handler(exception: type[Exception], error_callback: Callable[[str], Co
         async def inner(sid: str, data: EventModel):
             try:
                 return await func(sid, data)
-            except exception:
+            except exception as e:
+                metrics = get_metrics()
+                metrics.event_errors.inc(event_name=func.__name__.upper(), error=type(e).__name__)
                 return await error_callback(sid)
 
         return inner
@@ -22,50 +30,92 @@ def error_handler(exception: type[Exception], error_callback: Callable[[str], Co
     return outer
 
 
-def event_handler(input_model: type[EventModel]):
-    def outer(func: Callable[[str, Any], Coroutine[Any, Any, tuple[list[EventResponse] | EventModel, str | None]]]):
+HandlerResult = tuple[Union[list[EventResponse], EventModel], Optional[str]]
+BatchHandler = Callable[[list[tuple[str, Any]]], Coroutine[Any, Any, Sequence[Union[HandlerResult, Exception]]]]
+
+
+def event_handler(input_model: type[EventModel], batch_handler: BatchHandler | None = None):
+    def outer(func: Callable[[str, Any], Coroutine[Any, Any, HandlerResult]]):
+        # handlers are named after the event they handle, e.g. join_room handles JOIN_ROOM
+        event_name = func.__name__.upper()
+
+        @wraps(func)
         async def inner(sid: str, data: dict[Any, Any]):
+            # only the node that owns the room handles its events, every other node forwards them
+            room_router = get_room_router()
+            room_code = data.get("room_code") if isinstance(data, dict) else None
+            if room_router and room_code and await room_router.forward(room_code, event_name, sid, data):
+                return
+
+            metrics = get_metrics()
+            metrics.events_in_flight.inc(event_name=event_name)
+            metrics.event_payload_size.observe(estimate_size(data), event_name=event_name)
+            start = time.perf_counter()
+            try:
+                await handle_event(sid, data)
+            finally:
+                metrics.event_duration.observe(time.perf_counter() - start, event_name=event_name)
+                metrics.events_in_flight.dec(event_name=event_name)
+
+        async def handle_event(sid: str, data: dict[Any, Any]):
             model = input_model(**data)  # type: ignore
 
             logger = get_logger()
             logger.debug(model.event_name)
 
-            response, room = await func(sid, model)
+            # events for the same room run one at a time, in the order they arrived
+            room_code: str | None = getattr(model, "room_code", None)
+            room_executor = get_room_executor()
+            if room_code is None:
+                response, room = await run_handler(sid, model)
+            elif batch_handler:
+                response, room = await room_executor.run_batched(
+                    room_code, batch_key=event_name, item=(sid, model), apply_batch=run_batch_handler
+                )
+            else:
+                response, room = await room_executor.run(room_code, lambda: run_handler(sid, model))
+
             if isinstance(response, Error):
+                metrics = get_metrics()
+                metrics.event_errors.inc(event_name=event_name, error=response.code)
                 await sio.emit(ERROR, response.dict(), room=room)
             else:
                 if isinstance(response, list) and isinstance(response[0], EventResponse):
                     for r in response:
-                        await sio.emit(r.response_data.event_name, r.response_data.dict(), room=r.send_to)
-                        _log_resonse(r.response_data)
+                        await sio.emit(
+                            r.response_data.event_name, r.response_data.dict(), room=r.send_to, skip_sid=r.skip_sid
+                        )
+                        log_response(r.response_data)
                 elif isinstance(response, EventModel):
                     await sio.emit(response.event_name, response.dict(), room=room)
-                    _log_resonse(response)
+                    log_response(response)
 
-        def _log_resonse(response: EventModel):
-            exclude = {}
-            settings = get_settings()
-            for attribute, ignore_fields in settings.LOG_RESPONSE_EXCLUDE_ATTR["list"].items():
-                if hasattr(response, attribute):
-                    list_ = len(getattr(response, attribute))
-                    exclude_index = {index: ignore_fields for index in range(list_)}
-                    exclude[attribute] = exclude_index
+        async def run_handler(sid: str, model: EventModel) -> HandlerResult:
+            with unit_of_work() as work:
+                result = await func(sid, model)
+            logger = get_logger()
+            logger.debug("Database round trips", event_name=event_name, round_trips=work.round_trips)
+            return result
 
+        async def run_batch_handler(events: list[tuple[str, Any]]) -> Sequence[HandlerResult | Exception]:
+            with unit_of_work() as work:
+                results = await batch_handler(events)  # type: ignore
             logger = get_logger()
-            logger.debug(response.event_name, data=response.dict(exclude=exclude))
+            logger.debug("Database round trips", event_name=event_name, round_trips=work.round_trips, batch=len(events))
+            return results
 
         return inner
 
     return outer
 
 
-async def publish_event(event_name: str, event_body: EventModel, room: str | None = None):
-    await sio.emit(event_name, event_body.dict(), room=room)
+async def publish_event(event_name: str, event_body: EventModel, room: str | None = None, skip_sid: str | None = None):
+    await sio.emit(event_name, event_body.dict(), room=room, skip_sid=skip_sid)
 
 
-def enter_room(sid: str, room: str):
-    sio.enter_room(sid, room)
+async def enter_room(sid: str, room: str):
+    await sio.enter_room_on_any_node(sid, room)
 
 
-def leave_room(sid: str, room: str):
-    sio.leave_room(sid, room)
+async def leave_room(sid: str, room: str):
+    await sio.leave_room_on_any_node(sid, room)
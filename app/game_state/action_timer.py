@@ -0,0 +1,85 @@
+import asyncio
+import contextlib
+import heapq
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from functools import lru_cache
+
+from omnibus.log.logger import get_logger
+
+ActionExpired = Callable[[str, datetime], Awaitable[None]]
+
+
+class ActionTimer:
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime, str]] = []
+        self._deadlines: dict[str, datetime] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._running: set[asyncio.Task[None]] = set()
+        self._on_expired: ActionExpired | None = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, room_id: str, fire_at: datetime):
+        if self._deadlines.get(room_id) == fire_at:
+            return
+
+        self._deadlines[room_id] = fire_at
+        heapq.heappush(self._heap, (fire_at, room_id))
+        if self._heap[0] == (fire_at, room_id):
+            self._wakeup.set()
+
+    def cancel(self, room_id: str):
+        self._deadlines.pop(room_id, None)
+
+    def start(self, on_expired: ActionExpired):
+        self._on_expired = on_expired
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            timeout = None
+            if self._heap:
+                timeout = max((self._heap[0][0] - datetime.now()).total_seconds(), 0)
+
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            self._fire_expired()
+
+    def _fire_expired(self):
+        now = datetime.now()
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, room_id = heapq.heappop(self._heap)
+            # rescheduling a room leaves its old deadline in the heap, skip it
+            if self._deadlines.get(room_id) != fire_at:
+                continue
+
+            del self._deadlines[room_id]
+            task = asyncio.create_task(self._expire(room_id, fire_at))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _expire(self, room_id: str, fire_at: datetime):
+        if self._on_expired is None:
+            return
+
+        try:
+            await self._on_expired(room_id, fire_at)
+        except Exception:
+            logger = get_logger()
+            logger.exception("failed to complete expired action", room_id=room_id, completed_by=fire_at)
+
+
+@lru_cache
+def get_action_timer() -> ActionTimer:
+    return ActionTimer()
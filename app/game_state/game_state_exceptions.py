@@ -55,3 +55,9 @@ class ActionTimedOut(Exception):
 
 class ActionNotTimedOut(Exception):
     pass
+
+
+class QuestionsTimedOut(Exception):
+    def __init__(self, msg: str, timeout_in_seconds: float | None) -> None:
+        self.msg = msg
+        self.timeout_in_seconds = timeout_in_seconds
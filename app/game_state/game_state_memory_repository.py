@@ -0,0 +1,152 @@
+from collections.abc import Callable, Iterable, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from app.core.room_ownership import RingRange, ring_range_query
+from app.core.snapshot import write_snapshot
+from app.game_state.game_state_exceptions import (
+    GameStateExistsException,
+    GameStateNotFound,
+)
+from app.game_state.game_state_models import (
+    DrawlossuemActions,
+    DrawlossuemState,
+    FibbingActions,
+    FibbingItState,
+    GamePaused,
+    GameState,
+    QuiblyActions,
+    QuiblyState,
+)
+from app.game_state.game_state_repository import AbstractGameStateRepository
+
+
+class InMemoryGameStateRepository(AbstractGameStateRepository):
+    def __init__(self) -> None:
+        self._game_states: dict[str, GameState] = {}
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+
+    async def add(self, game_state: GameState):
+        if game_state.room_id in self._game_states:
+            raise GameStateExistsException(f"game state {game_state.room_id=} already exists")
+        self._store(game_state)
+
+    async def remove(self, id_: str):
+        self._game_states.pop(id_, None)
+        self._dirty.discard(id_)
+        self._removed.add(id_)
+
+    async def get(self, id_: str) -> GameState:
+        return self._get_stored(id_).copy(deep=True)
+
+    async def update_state(
+        self, game_state: GameState, state: FibbingItState | QuiblyState | DrawlossuemState
+    ) -> GameState:
+        game_state.state = state
+        self._store(game_state)
+        return game_state
+
+    async def update_next_action(
+        self,
+        game_state: GameState,
+        timer_in_seconds: int,
+        next_action: FibbingActions | QuiblyActions | DrawlossuemActions,
+    ) -> GameState:
+        game_state.action_completed_by = datetime.now() + timedelta(seconds=timer_in_seconds)
+        game_state.action = next_action
+        self._store(game_state)
+        return game_state
+
+    async def update_paused(self, game_state: GameState, game_paused: GamePaused) -> GameState:
+        game_state.paused = game_paused
+        self._store(game_state)
+        return game_state
+
+    async def add_answers(self, room_id: str, answers: dict[str, str]) -> GameState:
+        game_state = await self.get(id_=room_id)
+        self.check_action_is_open(game_state=game_state, action=FibbingActions.submit_answers, now=datetime.now())
+        game_state.state.questions.current_answers.update(answers)  # type: ignore
+        self._store(game_state)
+        return game_state
+
+    async def add_vote(self, room_id: str, nickname: str) -> GameState:
+        game_state = await self.get(id_=room_id)
+        self.check_action_is_open(game_state=game_state, action=FibbingActions.vote_on_fibber, now=datetime.now())
+        votes = game_state.state.questions.votes  # type: ignore
+        votes[nickname] = votes.get(nickname, 0) + 1
+        self._store(game_state)
+        return game_state
+
+    async def claim_expired_action(
+        self, room_id: str, action: FibbingActions | QuiblyActions | DrawlossuemActions, now: datetime
+    ) -> bool:
+        game_state = self._game_states.get(room_id)
+        if (
+            game_state is None
+            or game_state.action != action
+            or not game_state.action_completed_by
+            or game_state.action_completed_by > now
+        ):
+            return False
+
+        game_state.action_completed_by = None
+        self._dirty.add(room_id)
+        return True
+
+    async def get_pending_actions(self) -> list[tuple[str, datetime]]:
+        return [
+            (room_id, game_state.action_completed_by)
+            for room_id, game_state in self._game_states.items()
+            if game_state.action_completed_by
+        ]
+
+    async def restore(self):
+        await self.load(owns=lambda _: True)
+
+    async def load(
+        self,
+        owns: Callable[[str], bool],
+        room_ids: Iterable[str] | None = None,
+        ranges: Sequence[RingRange] | None = None,
+    ):
+        query: dict[str, Any] = {}
+        if room_ids is not None:
+            query = {"room_id": {"$in": list(room_ids)}}
+        elif ranges is not None:
+            if not ranges:
+                return
+            query = ring_range_query(ranges)
+
+        async for game_state in GameState.find(query):
+            if owns(game_state.room_id) and game_state.room_id not in self._dirty:
+                self._store(game_state, dirty=False)
+
+    def evict(self, keep: Callable[[str], bool]) -> set[str]:
+        evicted = {room_id for room_id in self._game_states if not keep(room_id) and room_id not in self._dirty}
+        for room_id in evicted:
+            del self._game_states[room_id]
+        return evicted
+
+    async def snapshot(self):
+        dirty, self._dirty = self._dirty, set()
+        removed, self._removed = self._removed, set()
+        try:
+            game_states = [self._game_states[room_id] for room_id in dirty if room_id in self._game_states]
+            await write_snapshot(GameState, key="room_id", documents=game_states, removed=removed)
+        except Exception:
+            self._dirty |= dirty
+            self._removed |= removed - self._game_states.keys()
+            raise
+
+    def _get_stored(self, room_id: str) -> GameState:
+        game_state = self._game_states.get(room_id)
+        if game_state is None:
+            raise GameStateNotFound(msg="game state not found", room_identifier=room_id)
+        return game_state
+
+    def _store(self, game_state: GameState, dirty: bool = True):
+        self._game_states[game_state.room_id] = game_state.copy(deep=True)
+        if dirty:
+            self._dirty.add(game_state.room_id)
+        self._removed.discard(game_state.room_id)
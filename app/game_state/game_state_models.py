@@ -3,6 +3,7 @@ from enum import Enum
 
 from beanie import Document, Indexed
 from pydantic.main import BaseModel
+from pymongo import ASCENDING, IndexModel
 
 
 class UpdateQuestionRoundState(BaseModel):
@@ -86,3 +87,8 @@ class GameState(Document):
 
     class Collection:
         name = "game_state"
+        indexes = [
+            IndexModel([("action_completed_by", ASCENDING)]),
+            # only set by snapshots of in-memory game states, see write_snapshot
+            IndexModel([("ring_position", ASCENDING)], sparse=True),
+        ]
@@ -0,0 +1,284 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import Any
+
+from omnibus.log.logger import get_logger
+from redis.asyncio import Redis
+
+from app.core.unit_of_work import get_unit_of_work, record_round_trip
+from app.game_state.game_state_exceptions import (
+    ActionTimedOut,
+    GameStateExistsException,
+    GameStateNotFound,
+)
+from app.game_state.game_state_models import (
+    DrawlossuemActions,
+    DrawlossuemState,
+    FibbingActions,
+    FibbingItState,
+    GamePaused,
+    GameState,
+    QuiblyActions,
+    QuiblyState,
+)
+from app.game_state.game_state_repository import AbstractGameStateRepository
+
+PENDING_ACTIONS_KEY = "game_state:pending_actions"
+
+# KEYS: game state, answers, votes. ARGV: action, now, "answers" or "votes", then field and value pairs
+ADD_DURING_ACTION = """
+local action = redis.call("HMGET", KEYS[1], "action", "action_completed_by")
+if not action[1] then
+    return {-1}
+end
+if action[1] ~= ARGV[1] or action[2] == "" or tonumber(action[2]) <= tonumber(ARGV[2]) then
+    return {0}
+end
+for i = 4, #ARGV, 2 do
+    if ARGV[3] == "votes" then
+        redis.call("HINCRBY", KEYS[3], ARGV[i], ARGV[i + 1])
+    else
+        redis.call("HSET", KEYS[2], ARGV[i], ARGV[i + 1])
+    end
+end
+return {1, redis.call("HGETALL", KEYS[1]), redis.call("HGETALL", KEYS[2]), redis.call("HGETALL", KEYS[3])}
+"""
+
+# KEYS: game state, pending actions. ARGV: action, now, room id
+CLAIM_EXPIRED_ACTION = """
+local action = redis.call("HMGET", KEYS[1], "action", "action_completed_by")
+if action[1] ~= ARGV[1] or not action[2] or action[2] == "" or tonumber(action[2]) > tonumber(ARGV[2]) then
+    return 0
+end
+redis.call("HSET", KEYS[1], "action_completed_by", "")
+redis.call("ZREM", KEYS[2], ARGV[3])
+return 1
+"""
+
+
+class RedisGameStateRepository(AbstractGameStateRepository):
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+        self._add_during_action = redis.register_script(ADD_DURING_ACTION)
+        self._claim_expired_action = redis.register_script(CLAIM_EXPIRED_ACTION)
+        self._archiving: set[asyncio.Task[None]] = set()
+
+    async def add(self, game_state: GameState):
+        keys = self._keys(game_state.room_id)
+        record_round_trip()
+        if not await self.redis.hsetnx(keys[0], "room_id", game_state.room_id):
+            raise GameStateExistsException(f"game state {game_state.room_id=} already exists")
+
+        fields, answers, votes = self._to_hashes(game_state)
+        pipeline = self.redis.pipeline()
+        pipeline.hset(keys[0], mapping=fields)
+        self._write_answers_and_votes(pipeline, room_id=game_state.room_id, answers=answers, votes=votes)
+        if game_state.action_completed_by:
+            pipeline.zadd(PENDING_ACTIONS_KEY, {game_state.room_id: game_state.action_completed_by.timestamp()})
+        record_round_trip()
+        await pipeline.execute()
+        get_unit_of_work().add(game_state.room_id, game_state)
+
+    async def remove(self, id_: str):
+        get_unit_of_work().evict(id_)
+        pipeline = self.redis.pipeline()
+        pipeline.delete(*self._keys(id_))
+        pipeline.zrem(PENDING_ACTIONS_KEY, id_)
+        record_round_trip()
+        await pipeline.execute()
+
+    async def get(self, id_: str) -> GameState:
+        unit_of_work = get_unit_of_work()
+        game_state = unit_of_work.get(GameState, id_)
+        if game_state is None:
+            game_state = await self._get(id_)
+
+        unit_of_work.add(id_, game_state)
+        return game_state
+
+    async def _get(self, room_id: str) -> GameState:
+        pipeline = self.redis.pipeline(transaction=False)
+        for key in self._keys(room_id):
+            pipeline.hgetall(key)
+        record_round_trip()
+        fields, answers, votes = await pipeline.execute()
+        if fields:
+            return self._from_hashes(fields=fields, answers=answers, votes=votes)
+
+        # finished games only live in mongo
+        record_round_trip()
+        game_state = await GameState.find_one(GameState.room_id == room_id)
+        if game_state is None:
+            raise GameStateNotFound(msg="game state not found", room_identifier=room_id)
+        return game_state
+
+    async def update_state(
+        self, game_state: GameState, state: FibbingItState | QuiblyState | DrawlossuemState
+    ) -> GameState:
+        game_state.state = state
+        fields, answers, votes = self._to_hashes(game_state)
+        pipeline = self.redis.pipeline()
+        pipeline.hset(self._keys(game_state.room_id)[0], "state", fields["state"])
+        self._write_answers_and_votes(pipeline, room_id=game_state.room_id, answers=answers, votes=votes)
+        record_round_trip()
+        await pipeline.execute()
+        get_unit_of_work().add(game_state.room_id, game_state)
+        return game_state
+
+    async def update_next_action(
+        self,
+        game_state: GameState,
+        timer_in_seconds: int,
+        next_action: FibbingActions | QuiblyActions | DrawlossuemActions,
+    ) -> GameState:
+        game_state.action_completed_by = datetime.now() + timedelta(seconds=timer_in_seconds)
+        game_state.action = next_action
+        completed_by = game_state.action_completed_by.timestamp()
+        pipeline = self.redis.pipeline()
+        pipeline.hset(
+            self._keys(game_state.room_id)[0],
+            mapping={"action": next_action.value, "action_completed_by": repr(completed_by)},
+        )
+        pipeline.zadd(PENDING_ACTIONS_KEY, {game_state.room_id: completed_by})
+        record_round_trip()
+        await pipeline.execute()
+        get_unit_of_work().add(game_state.room_id, game_state)
+        return game_state
+
+    async def update_paused(self, game_state: GameState, game_paused: GamePaused) -> GameState:
+        game_state.paused = game_paused
+        record_round_trip()
+        await self.redis.hset(self._keys(game_state.room_id)[0], "paused", game_paused.json())
+        get_unit_of_work().add(game_state.room_id, game_state)
+        return game_state
+
+    async def add_answers(self, room_id: str, answers: dict[str, str]) -> GameState:
+        return await self._update_during_action(
+            room_id=room_id, action=FibbingActions.submit_answers, target="answers", values=answers
+        )
+
+    async def add_vote(self, room_id: str, nickname: str) -> GameState:
+        return await self._update_during_action(
+            room_id=room_id, action=FibbingActions.vote_on_fibber, target="votes", values={nickname: 1}
+        )
+
+    async def _update_during_action(
+        self, room_id: str, action: FibbingActions, target: str, values: dict[str, str] | dict[str, int]
+    ) -> GameState:
+        now = datetime.now()
+        unit_of_work = get_unit_of_work()
+        unit_of_work.evict(room_id)
+        record_round_trip()
+        result = await self._add_during_action(
+            keys=self._keys(room_id),
+            args=[action.value, repr(now.timestamp()), target, *(item for pair in values.items() for item in pair)],
+        )
+        if result[0] == -1:
+            raise GameStateNotFound(msg="game state not found", room_identifier=room_id)
+        elif result[0] == 0:
+            game_state = await self.get(id_=room_id)
+            self.check_action_is_open(game_state=game_state, action=action, now=now)
+            raise ActionTimedOut(
+                msg="action changed while completing it", now=now, completed_by=game_state.action_completed_by or now
+            )
+
+        fields, answers, votes = (self._pairs_to_dict(hash_) for hash_ in result[1:])
+        game_state = self._from_hashes(fields=fields, answers=answers, votes=votes)
+        unit_of_work.add(room_id, game_state)
+        return game_state
+
+    async def claim_expired_action(
+        self, room_id: str, action: FibbingActions | QuiblyActions | DrawlossuemActions, now: datetime
+    ) -> bool:
+        get_unit_of_work().evict(room_id)
+        record_round_trip()
+        claimed = await self._claim_expired_action(
+            keys=[self._keys(room_id)[0], PENDING_ACTIONS_KEY], args=[action.value, repr(now.timestamp()), room_id]
+        )
+        return claimed == 1
+
+    async def get_pending_actions(self) -> list[tuple[str, datetime]]:
+        record_round_trip()
+        pending_actions = await self.redis.zrange(PENDING_ACTIONS_KEY, 0, -1, withscores=True)
+        return [(room_id, datetime.fromtimestamp(completed_by)) for room_id, completed_by in pending_actions]
+
+    async def archive(self, game_state: GameState):
+        task = asyncio.create_task(self._archive(game_state.copy(deep=True)))
+        self._archiving.add(task)
+        task.add_done_callback(self._archiving.discard)
+
+    async def _archive(self, game_state: GameState):
+        try:
+            await game_state.save()
+            await self.remove(game_state.room_id)
+        except Exception:
+            logger = get_logger()
+            logger.exception("failed to archive game state", room_id=game_state.room_id)
+
+    @staticmethod
+    def _keys(room_id: str) -> list[str]:
+        key = f"game_state:{room_id}"
+        return [key, f"{key}:answers", f"{key}:votes"]
+
+    def _write_answers_and_votes(
+        self, pipeline: Any, room_id: str, answers: dict[str, str], votes: dict[str, int]
+    ) -> None:
+        # answers and votes are only ever added or cleared, so adding to the stored hashes rather than replacing
+        # them keeps the ones submitted since the game state was read
+        _, answers_key, votes_key = self._keys(room_id)
+        for key, values in ((answers_key, answers), (votes_key, votes)):
+            if values:
+                pipeline.hset(key, mapping=values)
+            else:
+                pipeline.delete(key)
+
+    @classmethod
+    def _to_hashes(cls, game_state: GameState) -> tuple[dict[str, str], dict[str, str], dict[str, int]]:
+        state = game_state.state.dict() if game_state.state else None
+        questions = state.get("questions") if state else None
+        answers = questions.pop("current_answers", {}) if questions else {}
+        votes = questions.pop("votes", {}) if questions else {}
+        fields = {
+            "room_id": game_state.room_id,
+            "game_name": game_state.game_name,
+            "player_scores": json.dumps([player_score.dict() for player_score in game_state.player_scores]),
+            "state": json.dumps(state),
+            "answers_expected_by_time": cls._to_timestamp(game_state.answers_expected_by_time),
+            "action": game_state.action.value,
+            "action_completed_by": cls._to_timestamp(game_state.action_completed_by),
+            "paused": game_state.paused.json(),
+        }
+        return fields, answers, votes
+
+    @classmethod
+    def _from_hashes(cls, fields: dict[str, str], answers: dict[str, str], votes: dict[str, str]) -> GameState:
+        state = json.loads(fields["state"])
+        if state and "questions" in state:
+            state["questions"]["current_answers"] = answers
+            state["questions"]["votes"] = {nickname: int(count) for nickname, count in votes.items()}
+
+        return GameState.parse_obj(
+            {
+                "room_id": fields["room_id"],
+                "game_name": fields["game_name"],
+                "player_scores": json.loads(fields["player_scores"]),
+                "state": state,
+                "answers_expected_by_time": cls._from_timestamp(fields["answers_expected_by_time"]),
+                "action": fields["action"],
+                "action_completed_by": cls._from_timestamp(fields["action_completed_by"]),
+                "paused": json.loads(fields["paused"]),
+            }
+        )
+
+    @staticmethod
+    def _to_timestamp(value: datetime | None) -> str:
+        return repr(value.timestamp()) if value else ""
+
+    @staticmethod
+    def _from_timestamp(value: str) -> datetime | None:
+        return datetime.fromtimestamp(float(value)) if value else None
+
+    @staticmethod
+    def _pairs_to_dict(pairs: list[str]) -> dict[str, str]:
+        return dict(zip(pairs[::2], pairs[1::2]))
@@ -1,12 +1,18 @@
 import abc
 from datetime import datetime, timedelta
+from typing import Any, NoReturn
 
+from beanie.odm.utils.encoder import Encoder
 from omnibus.database.repository import AbstractRepository
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 
+from app.core.unit_of_work import get_unit_of_work, record_round_trip
 from app.game_state.game_state_exceptions import (
+    ActionTimedOut,
     GameStateExistsException,
     GameStateNotFound,
+    InvalidGameState,
 )
 from app.game_state.game_state_models import (
     DrawlossuemActions,
@@ -18,6 +24,7 @@ from app.game_state.game_state_models import (
     QuiblyActions,
     QuiblyState,
 )
+from app.game_state.games.exceptions import InvalidAction
 
 
 class AbstractGameStateRepository(AbstractRepository[GameState]):
@@ -39,29 +46,75 @@ class AbstractGameStateRepository(AbstractRepository[GameState]):
     async def update_paused(self, game_state: GameState, game_paused: GamePaused) -> GameState:
         raise NotImplementedError
 
+    async def add_answer(self, room_id: str, player_id: str, answer: str) -> GameState:
+        return await self.add_answers(room_id=room_id, answers={player_id: answer})
+
+    @abc.abstractmethod
+    async def add_answers(self, room_id: str, answers: dict[str, str]) -> GameState:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def add_vote(self, room_id: str, nickname: str) -> GameState:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def claim_expired_action(
+        self, room_id: str, action: FibbingActions | QuiblyActions | DrawlossuemActions, now: datetime
+    ) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_pending_actions(self) -> list[tuple[str, datetime]]:
+        raise NotImplementedError
+
+    async def archive(self, game_state: GameState):
+        # mongo already holds the latest state, only stores that keep it elsewhere need to archive it
+        pass
+
+    @staticmethod
+    def check_action_is_open(game_state: GameState, action: FibbingActions, now: datetime):
+        if game_state.action != action:
+            raise InvalidAction(f"expected action to be {action.value}, current action {game_state.action.value}")
+        elif not game_state.action_completed_by:
+            # the deadline is cleared once the expired action has been claimed
+            raise ActionTimedOut(msg="cannot complete action once it has expired", now=now, completed_by=now)
+        elif game_state.action_completed_by <= now:
+            raise ActionTimedOut(
+                msg="cannot complete action out of time", now=now, completed_by=game_state.action_completed_by
+            )
+
 
 class GameStateRepository(AbstractGameStateRepository):
     async def add(self, game_state: GameState):
         try:
+            record_round_trip()
             await GameState.insert(game_state)
         except DuplicateKeyError:
             raise GameStateExistsException(f"game state {game_state.room_id=} already exists")
+        get_unit_of_work().add(game_state.room_id, game_state)
 
     async def remove(self, id_: str):
+        get_unit_of_work().evict(id_)
+        record_round_trip()
         return await super().remove(id_)
 
     async def get(self, id_: str) -> GameState:
-        game_state = await GameState.find_one(GameState.room_id == id_)
+        unit_of_work = get_unit_of_work()
+        game_state = unit_of_work.get(GameState, id_)
+        if game_state is None:
+            record_round_trip()
+            game_state = await GameState.find_one(GameState.room_id == id_)
         if game_state is None:
             raise GameStateNotFound(msg="game state not found", room_identifier=id_)
+
+        unit_of_work.add(id_, game_state)
         return game_state
 
     async def update_state(
         self, game_state: GameState, state: FibbingItState | QuiblyState | DrawlossuemState
     ) -> GameState:
         game_state.state = state
-        await game_state.save()
-        return game_state
+        return await self._set(game_state, "state")
 
     async def update_next_action(
         self,
@@ -71,10 +124,114 @@ class GameStateRepository(AbstractGameStateRepository):
     ) -> GameState:
         game_state.action_completed_by = datetime.now() + timedelta(seconds=timer_in_seconds)
         game_state.action = next_action
-        await game_state.save()
-        return game_state
+        return await self._set(game_state, "action", "action_completed_by")
 
     async def update_paused(self, game_state: GameState, game_paused: GamePaused) -> GameState:
         game_state.paused = game_paused
-        await game_state.save()
+        return await self._set(game_state, "paused")
+
+    @staticmethod
+    async def _set(game_state: GameState, *fields: str) -> GameState:
+        # saving the whole document would undo answers and votes added since the game state was read
+        encoded: dict[str, Any] = Encoder(to_db=True).encode(game_state)
+        record_round_trip()
+        await GameState.get_motor_collection().update_one(
+            {"room_id": game_state.room_id}, {"$set": {field: encoded[field] for field in fields}}
+        )
+        get_unit_of_work().add(game_state.room_id, game_state)
         return game_state
+
+    async def claim_expired_action(
+        self, room_id: str, action: FibbingActions | QuiblyActions | DrawlossuemActions, now: datetime
+    ) -> bool:
+        get_unit_of_work().evict(room_id)
+        record_round_trip()
+        result = await GameState.get_motor_collection().update_one(
+            {"room_id": room_id, "action": action.value, "action_completed_by": {"$lte": now}},
+            {"$set": {"action_completed_by": None}},
+        )
+        return result.modified_count == 1
+
+    async def get_pending_actions(self) -> list[tuple[str, datetime]]:
+        record_round_trip()
+        cursor = GameState.get_motor_collection().find(
+            {"action_completed_by": {"$gt": datetime.min}},
+            projection={"_id": 0, "room_id": 1, "action_completed_by": 1},
+        )
+        return [(game_state["room_id"], game_state["action_completed_by"]) async for game_state in cursor]
+
+    async def add_answers(self, room_id: str, answers: dict[str, str]) -> GameState:
+        return await self._update_during_action(
+            room_id=room_id,
+            action=FibbingActions.submit_answers,
+            update={
+                "$set": {
+                    f"state.questions.current_answers.{player_id}": answer for player_id, answer in answers.items()
+                }
+            },
+        )
+
+    async def add_vote(self, room_id: str, nickname: str) -> GameState:
+        if self._is_valid_field_name(nickname):
+            return await self._update_during_action(
+                room_id=room_id,
+                action=FibbingActions.vote_on_fibber,
+                update={"$inc": {f"state.questions.votes.{nickname}": 1}},
+            )
+        return await self._add_vote_with_compare_and_set(room_id=room_id, nickname=nickname)
+
+    async def _update_during_action(self, room_id: str, action: FibbingActions, update: dict[str, Any]) -> GameState:
+        now = datetime.now()
+        unit_of_work = get_unit_of_work()
+        unit_of_work.evict(room_id)
+        record_round_trip()
+        game_state = await GameState.get_motor_collection().find_one_and_update(
+            {"room_id": room_id, "action": action.value, "action_completed_by": {"$gt": now}},
+            update,
+            return_document=ReturnDocument.AFTER,
+        )
+        if game_state is None:
+            await self._raise_action_is_closed(room_id=room_id, action=action, now=now)
+
+        updated_game_state = GameState.parse_obj(game_state)
+        unit_of_work.add(room_id, updated_game_state)
+        return updated_game_state
+
+    async def _add_vote_with_compare_and_set(self, room_id: str, nickname: str, retries: int = 3) -> GameState:
+        # Nicknames containing "." or starting with "$" cannot be used in an update path, so swap in the whole
+        # votes map only if nobody else has voted since we read it.
+        for _ in range(retries):
+            now = datetime.now()
+            get_unit_of_work().evict(room_id)
+            game_state = await self.get(id_=room_id)
+            self.check_action_is_open(game_state=game_state, action=FibbingActions.vote_on_fibber, now=now)
+
+            state = FibbingItState(**game_state.state.dict())  # type: ignore
+            current_votes = dict(state.questions.votes)
+            state.questions.votes[nickname] = state.questions.votes.get(nickname, 0) + 1
+            record_round_trip()
+            result = await GameState.get_motor_collection().update_one(
+                {
+                    "room_id": room_id,
+                    "action": FibbingActions.vote_on_fibber.value,
+                    "state.questions.votes": current_votes,
+                },
+                {"$set": {"state.questions.votes": state.questions.votes}},
+            )
+            if result.modified_count:
+                game_state.state = state
+                return game_state
+
+        raise InvalidGameState(f"votes for {room_id=} kept changing, unable to submit vote")
+
+    async def _raise_action_is_closed(self, room_id: str, action: FibbingActions, now: datetime) -> NoReturn:
+        get_unit_of_work().evict(room_id)
+        game_state = await self.get(id_=room_id)
+        self.check_action_is_open(game_state=game_state, action=action, now=now)
+        raise ActionTimedOut(
+            msg="action changed while completing it", now=now, completed_by=game_state.action_completed_by or now
+        )
+
+    @staticmethod
+    def _is_valid_field_name(name: str) -> bool:
+        return bool(name) and "." not in name and not name.startswith("$")
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from pydantic import parse_obj_as
 
 from app.clients.management_api.api.questions_api import AsyncQuestionsApi
+from app.game_state.action_timer import ActionTimer
 from app.game_state.game_state_exceptions import (
     GameIsPaused,
     GameStateAlreadyPaused,
@@ -26,17 +27,28 @@ from app.game_state.game_state_models import (
 )
 from app.game_state.game_state_repository import AbstractGameStateRepository
 from app.game_state.games.game import get_game
+from app.game_state.question_pool import QuestionPool
 from app.player.player_models import Player
 
 
 class GameStateService:
-    def __init__(self, game_state_repository: AbstractGameStateRepository, question_client: AsyncQuestionsApi) -> None:
+    def __init__(
+        self,
+        game_state_repository: AbstractGameStateRepository,
+        question_client: AsyncQuestionsApi,
+        action_timer: ActionTimer | None = None,
+        question_pool: QuestionPool | None = None,
+    ) -> None:
         self.game_state_repository = game_state_repository
         self.question_client = question_client
+        self.action_timer = action_timer
+        self.question_pool = question_pool
 
     async def create(self, room_id: str, players: list[Player], game_name: str) -> GameState:
         game = get_game(game_name=game_name)
-        state = await game.get_starting_state(players=players, question_client=self.question_client)
+        state = await game.get_starting_state(
+            players=players, question_client=self.question_client, question_pool=self.question_pool
+        )
         player_scores = parse_obj_as(list[PlayerScore], players)
         game_state = GameState(
             game_name=game_name,
@@ -51,8 +63,12 @@ class GameStateService:
 
     # TODO: move to fibbing it
     # TODO: adjust actions so it changes at correct time
-    async def get_next_question(self, game_state: GameState) -> NextQuestion:
-        current_action = game_state.action
+    async def get_next_question(
+        self,
+        game_state: GameState,
+        current_action: FibbingActions | QuiblyActions | DrawlossuemActions | None = None,
+    ) -> NextQuestion:
+        current_action = current_action or game_state.action
         now = datetime.now()
         if (
             game_state.paused.is_paused
@@ -69,8 +85,8 @@ class GameStateService:
         updated_round_state = await self._update_question_state(game_state=game_state)
         game = get_game(game_name=game_state.game_name)
         next_question = game.get_next_question(current_state=game_state.state)  # type: ignore
-        timer = game.get_timer(current_round=game_state.state.current_round, action=game_state.action)  # type: ignore
-        next_action = game.get_next_action(current_action=game_state.action.value)
+        timer = game.get_timer(current_round=game_state.state.current_round, action=current_action)  # type: ignore
+        next_action = game.get_next_action(current_action=current_action.value)
         game_state = await self.update_next_action(next_action=next_action, timer=timer, game_state=game_state)
         next_question_data = NextQuestion(
             updated_round=updated_round_state, next_question=next_question, timer_in_seconds=timer
@@ -83,12 +99,25 @@ class GameStateService:
         game_state = await self.game_state_repository.update_state(game_state=game_state, state=state)
         return game_state
 
+    async def submit_answer(self, room_id: str, player_id: str, answer: str) -> GameState:
+        game_state = await self.game_state_repository.add_answer(room_id=room_id, player_id=player_id, answer=answer)
+        return game_state
+
+    async def submit_answers(self, room_id: str, answers: dict[str, str]) -> GameState:
+        game_state = await self.game_state_repository.add_answers(room_id=room_id, answers=answers)
+        return game_state
+
+    async def submit_vote(self, room_id: str, nickname: str) -> GameState:
+        game_state = await self.game_state_repository.add_vote(room_id=room_id, nickname=nickname)
+        return game_state
+
     async def _update_question_state(self, game_state: GameState) -> UpdateQuestionRoundState:
         old_round = game_state.state.current_round  # type: ignore
         game = get_game(game_name=game_state.game_name)
 
         updated_question_state = await game.update_question_state(current_state=game_state.state)  # type: ignore
         if updated_question_state is None:
+            await self.game_state_repository.archive(game_state=game_state)
             raise GameStateIsNoneError("expected question state to not be none")
 
         game_state = await self.game_state_repository.update_state(game_state=game_state, state=updated_question_state)
@@ -108,8 +137,27 @@ class GameStateService:
         new_game_state = await self.game_state_repository.update_next_action(
             game_state=game_state, timer_in_seconds=timer, next_action=next_action
         )
+        if self.action_timer is not None and new_game_state.action_completed_by:
+            self.action_timer.schedule(room_id=new_game_state.room_id, fire_at=new_game_state.action_completed_by)
         return new_game_state
 
+    async def claim_expired_action(self, game_state: GameState) -> bool:
+        claimed = await self.game_state_repository.claim_expired_action(
+            room_id=game_state.room_id, action=game_state.action, now=datetime.now()
+        )
+        if claimed:
+            game_state.action_completed_by = None
+        return claimed
+
+    async def schedule_pending_actions(self) -> int:
+        if self.action_timer is None:
+            return 0
+
+        pending_actions = await self.game_state_repository.get_pending_actions()
+        for room_id, action_completed_by in pending_actions:
+            self.action_timer.schedule(room_id=room_id, fire_at=action_completed_by)
+        return len(pending_actions)
+
     async def get_game_state_by_room_id(self, room_id) -> GameState:
         game_state = await self.game_state_repository.get(room_id)
         if game_state.state is None:
@@ -154,6 +202,9 @@ class GameStateService:
         else:
             game_paused = GamePaused()
         await self.game_state_repository.update_paused(game_state=game_state, game_paused=game_paused)
+
+        if self.action_timer is not None and not game_paused.is_paused and game_state.action_completed_by:
+            self.action_timer.schedule(room_id=room_id, fire_at=game_state.action_completed_by)
         return game_paused
 
     def _remove_waiting_for_players(self, game_state: GameState, player_reconnected: str | None = None):
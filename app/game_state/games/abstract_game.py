@@ -10,13 +10,14 @@ from app.game_state.game_state_models import (
     QuiblyActions,
     QuiblyState,
 )
+from app.game_state.question_pool import QuestionPool
 from app.player.player_models import Player
 
 
 class AbstractGame(abc.ABC):
     @abc.abstractmethod
     async def get_starting_state(
-        self, question_client: AsyncQuestionsApi, players: list[Player]
+        self, question_client: AsyncQuestionsApi, players: list[Player], question_pool: QuestionPool | None = None
     ) -> FibbingItState | QuiblyState | DrawlossuemState:
         raise NotImplementedError
 
@@ -19,14 +19,19 @@ from app.game_state.game_state_models import (
 from app.game_state.games.exceptions import InvalidAction, InvalidAnswer
 from app.game_state.games.fibbing_it.get_questions import GetQuestions
 from app.game_state.games.game import AbstractGame
+from app.game_state.question_pool import QuestionPool
 from app.player.player_models import Player
 
 
 class FibbingIt(AbstractGame):
     def __init__(
-        self, questions_per_round: int = 3, rounds_timer_map: dict[FibbingActions, dict[str, int]] | None = None
+        self,
+        questions_per_round: int = 3,
+        rounds_timer_map: dict[FibbingActions, dict[str, int]] | None = None,
+        questions_timeout_in_seconds: float | None = None,
     ) -> None:
         self.questions_per_round_index = questions_per_round - 1
+        self.questions_timeout_in_seconds = questions_timeout_in_seconds
         self.rounds = ["opinion", "likely", "free_form"]
         self.rounds_with_groups = ["opinion", "free_form"]
 
@@ -37,10 +42,16 @@ class FibbingIt(AbstractGame):
                 FibbingActions.vote_on_fibber: {"likely": 60, "opinion": 60, "free_form": 60},
             }
 
-    async def get_starting_state(self, question_client: AsyncQuestionsApi, players: list[Player]) -> FibbingItState:
+    async def get_starting_state(
+        self, question_client: AsyncQuestionsApi, players: list[Player], question_pool: QuestionPool | None = None
+    ) -> FibbingItState:
         first_fibber = random.choice(players)
         get_questions = GetQuestions(
-            question_client=question_client, players=players, questions_per_round=self.questions_per_round_index + 1
+            question_client=question_client,
+            players=players,
+            questions_per_round=self.questions_per_round_index + 1,
+            question_pool=question_pool,
+            timeout_in_seconds=self.questions_timeout_in_seconds,
         )
         questions = await get_questions()
         return FibbingItState(
@@ -113,6 +124,11 @@ class FibbingIt(AbstractGame):
     def submit_answers(
         self, game_state: GameState, player_ids: list[str], player_id: str, answer: str
     ) -> FibbingItState:
+        state = self.validate_answer(game_state=game_state, player_ids=player_ids, answer=answer)
+        state.questions.current_answers[player_id] = answer
+        return state
+
+    def validate_answer(self, game_state: GameState, player_ids: list[str], answer: str) -> FibbingItState:
         if not game_state.state or not game_state.action == FibbingActions.submit_answers:
             raise InvalidAction(
                 f"expected action to be {FibbingActions.submit_answers.value}, current action {game_state.action.value}"
@@ -136,7 +152,6 @@ class FibbingIt(AbstractGame):
         elif state.current_round == "likely" and answer not in player_ids:
             raise InvalidAnswer("invalid answer for round likely")
 
-        state.questions.current_answers[player_id] = answer
         return state
 
     def select_random_answer(self, game_state: GameState, player_ids: list[str]) -> FibbingItState:
@@ -152,6 +167,9 @@ class FibbingIt(AbstractGame):
             raise ActionNotTimedOut("cannot complete action is not yet out of time")
 
         state = FibbingItState(**game_state.state.dict())
+        return self.fill_missing_answers(state=state, player_ids=player_ids)
+
+    def fill_missing_answers(self, state: FibbingItState, player_ids: list[str]) -> FibbingItState:
         player_answers = state.questions.current_answers
         for player_id in player_ids:
             if not player_answers.get(player_id):
@@ -170,6 +188,15 @@ class FibbingIt(AbstractGame):
         return player_answers
 
     def submit_vote(self, game_state: GameState, nickname: str) -> FibbingItState:
+        state = self.validate_vote(game_state=game_state)
+        votes = state.questions.votes
+        if nickname not in votes:
+            votes[nickname] = 0
+
+        votes[nickname] += 1
+        return state
+
+    def validate_vote(self, game_state: GameState) -> FibbingItState:
         if not game_state.state or not game_state.action == FibbingActions.vote_on_fibber:
             raise InvalidAction(
                 f"expected action to be {FibbingActions.vote_on_fibber.value}, current action {game_state.action.value}"
@@ -183,10 +210,4 @@ class FibbingIt(AbstractGame):
                 msg="cannot complete action out of time", now=now, completed_by=game_state.action_completed_by
             )
 
-        state = FibbingItState(**game_state.state.dict())
-        votes = state.questions.votes
-        if nickname not in votes:
-            votes[nickname] = 0
-
-        votes[nickname] += 1
-        return state
+        return FibbingItState(**game_state.state.dict())
@@ -2,22 +2,34 @@ import asyncio
 import random
 
 from app.clients.management_api.api.questions_api import AsyncQuestionsApi
+from app.core.tasks import gather_or_cancel
+from app.game_state.game_state_exceptions import QuestionsTimedOut
 from app.game_state.game_state_models import (
     FibbingItQuestion,
     FibbingItQuestionsState,
     FibbingItRounds,
 )
 from app.game_state.games.exceptions import InvalidGameRound
+from app.game_state.question_pool import QuestionPool
 from app.player.player_models import Player
 
 
 class GetQuestions:
-    def __init__(self, question_client: AsyncQuestionsApi, players: list[Player], questions_per_round: int = 3) -> None:
+    def __init__(
+        self,
+        question_client: AsyncQuestionsApi,
+        players: list[Player],
+        questions_per_round: int = 3,
+        question_pool: QuestionPool | None = None,
+        timeout_in_seconds: float | None = None,
+    ) -> None:
         self.question_client = question_client
+        self.question_pool = question_pool or QuestionPool(question_client=question_client)
         self.players = players
         self.rounds = ["opinion", "likely", "free_form"]
         self.rounds_with_groups = ["opinion", "free_form"]
         self.questions_per_round = questions_per_round
+        self.timeout_in_seconds = timeout_in_seconds
 
     async def __call__(self) -> FibbingItQuestionsState:
         rounds_dict = await self._get_rounds()
@@ -25,12 +37,15 @@ class GetQuestions:
         return FibbingItQuestionsState(rounds=rounds, current_answers={})
 
     async def _get_rounds(self) -> dict[str, list[FibbingItQuestion]]:
-        rounds_questions_map: dict[str, list[FibbingItQuestion]] = {"opinion": [], "likely": [], "free_form": []}
-        for round_ in self.rounds:
-            questions_in_round = await self._get_questions_for_round(round_)
-
-            rounds_questions_map[round_] = questions_in_round
-        return rounds_questions_map
+        try:
+            questions_in_rounds = await gather_or_cancel(
+                *[self._get_questions_for_round(round_) for round_ in self.rounds], timeout=self.timeout_in_seconds
+            )
+        except asyncio.TimeoutError as e:
+            raise QuestionsTimedOut(
+                msg="timed out getting questions", timeout_in_seconds=self.timeout_in_seconds
+            ) from e
+        return dict(zip(self.rounds, questions_in_rounds))
 
     async def _get_questions_for_round(self, round_: str) -> list[FibbingItQuestion]:
         if round_ not in self.rounds_with_groups:
@@ -39,15 +54,8 @@ class GetQuestions:
 
     async def _get_questions_for_rounds_with_groups(self, round_: str) -> list[FibbingItQuestion]:
         questions_in_round: list[FibbingItQuestion] = []
-        random_groups = await self.question_client.get_random_groups(
-            game_name="fibbing_it", round=round_, limit=self.questions_per_round
-        )
-        # TODO: fix typing
-        questions_in_group = await asyncio.gather(
-            *[
-                self.question_client.get_random_questions(game_name="fibbing_it", round=round_, group_name=random_group)
-                for random_group in random_groups.groups
-            ]
+        questions_in_group = await self.question_pool.take(
+            game_name="fibbing_it", round_=round_, count=self.questions_per_round, grouped=True
         )
 
         for question_group in questions_in_group:
@@ -71,10 +79,10 @@ class GetQuestions:
 
     async def _get_questions_for_rounds_without_group(self, round_: str) -> list[FibbingItQuestion]:
         questions_in_round: list[FibbingItQuestion] = []
-        random_questions = await self.question_client.get_random_questions(
-            game_name="fibbing_it", round=round_, limit=self.questions_per_round
+        random_questions = await self.question_pool.take(
+            game_name="fibbing_it", round_=round_, count=self.questions_per_round, grouped=False
         )
-        for question in random_questions:
+        for (question,) in random_questions:
             player_names = [player.nickname for player in self.players]
             fibbing_it_question = FibbingItQuestion(fibber_question="", question=question.content, answers=player_names)
             questions_in_round.append(fibbing_it_question)
@@ -8,6 +8,9 @@ def get_game(game_name: str) -> AbstractGame:
     settings = get_settings()
 
     if game_name == "fibbing_it":
-        return FibbingIt(questions_per_round=settings.QUESTIONS_PER_ROUND)
+        return FibbingIt(
+            questions_per_round=settings.QUESTIONS_PER_ROUND,
+            questions_timeout_in_seconds=settings.START_GAME_QUESTIONS_TIMEOUT_IN_SECONDS,
+        )
     else:
         raise GameNotFound(f"game {game_name} not found")
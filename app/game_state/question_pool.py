@@ -0,0 +1,128 @@
+import asyncio
+import contextlib
+import random
+import time
+from typing import Optional
+
+from omnibus.log.logger import get_logger
+from pydantic import BaseModel
+
+from app.clients.management_api.api.questions_api import AsyncQuestionsApi
+from app.clients.management_api.models import QuestionSimpleOut
+from app.core.metrics import get_metrics
+from app.core.tasks import gather_or_cancel
+
+PoolKey = tuple[str, str, Optional[str]]
+
+
+def get_pool_name(key: PoolKey) -> str:
+    return ":".join(filter(None, key))
+
+
+class QuestionPoolStats(BaseModel):
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    refill_latency_in_seconds: float | None = None
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0
+
+
+class QuestionPool:
+    def __init__(
+        self,
+        question_client: AsyncQuestionsApi,
+        pool_size: int = 0,
+        request_timeout_in_seconds: float | None = None,
+    ) -> None:
+        self.question_client = question_client
+        self.pool_size = pool_size
+        self.request_timeout_in_seconds = request_timeout_in_seconds
+        self._pools: dict[PoolKey, list[list[QuestionSimpleOut]]] = {}
+        self._stats: dict[PoolKey, QuestionPoolStats] = {}
+        self._refills: dict[PoolKey, asyncio.Task[None]] = {}
+
+    async def take(
+        self, game_name: str, round_: str, count: int, grouped: bool, language_code: str | None = None
+    ) -> list[list[QuestionSimpleOut]]:
+        key = (game_name, round_, language_code)
+        pool = self._pools.setdefault(key, [])
+        stats = self._stats.setdefault(key, QuestionPoolStats())
+
+        if len(pool) >= count:
+            stats.hits += 1
+            questions = [pool.pop(random.randrange(len(pool))) for _ in range(count)]
+        else:
+            stats.misses += 1
+            questions = await self._fetch(key=key, count=count, grouped=grouped)
+
+        stats.size = len(pool)
+        if len(pool) < self.pool_size // 2 and key not in self._refills:
+            task = asyncio.create_task(self.refill(game_name, round_, grouped, language_code))
+            self._refills[key] = task
+            task.add_done_callback(lambda _: self._refills.pop(key, None))
+        return questions
+
+    async def refill(self, game_name: str, round_: str, grouped: bool, language_code: str | None = None):
+        key = (game_name, round_, language_code)
+        pool = self._pools.setdefault(key, [])
+        stats = self._stats.setdefault(key, QuestionPoolStats())
+        missing = self.pool_size - len(pool)
+        if missing <= 0:
+            return
+
+        start = time.perf_counter()
+        try:
+            questions = await self._fetch(key=key, count=missing, grouped=grouped)
+        except Exception:
+            logger = get_logger()
+            logger.exception("failed to refill question pool", game_name=game_name, round=round_)
+            return
+
+        pooled_ids = {question[0].question_id for question in pool if question}
+        pool.extend(question for question in questions if question and question[0].question_id not in pooled_ids)
+        stats.size = len(pool)
+        stats.refill_latency_in_seconds = time.perf_counter() - start
+        metrics = get_metrics()
+        metrics.question_pool_refill_duration.observe(stats.refill_latency_in_seconds, pool=get_pool_name(key))
+        logger = get_logger()
+        logger.debug("refilled question pool", game_name=game_name, round=round_, **stats.dict())
+
+    def stats(self) -> dict[PoolKey, QuestionPoolStats]:
+        return self._stats
+
+    async def close(self):
+        for task in list(self._refills.values()):
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _fetch(self, key: PoolKey, count: int, grouped: bool) -> list[list[QuestionSimpleOut]]:
+        game_name, round_, language_code = key
+        timeout = self.request_timeout_in_seconds
+        if not grouped:
+            questions = await asyncio.wait_for(
+                self.question_client.get_random_questions(
+                    game_name=game_name, round=round_, language_code=language_code, limit=count
+                ),
+                timeout=timeout,
+            )
+            return [[question] for question in questions]
+
+        random_groups = await asyncio.wait_for(
+            self.question_client.get_random_groups(game_name=game_name, round=round_, limit=count), timeout=timeout
+        )
+        return await gather_or_cancel(
+            *[
+                asyncio.wait_for(
+                    self.question_client.get_random_questions(
+                        game_name=game_name, round=round_, language_code=language_code, group_name=random_group
+                    ),
+                    timeout=timeout,
+                )
+                for random_group in random_groups.groups
+            ]
+        )
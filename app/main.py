@@ -1,16 +1,34 @@
 from fastapi import FastAPI
 from omnibus.app import setup_app
 from omnibus.operation_id import use_route_names_as_operation_ids
+from pymongo import monitoring
 
+from app.avatar.avatar_api import router as avatar_router
+from app.avatar.avatar_models import Avatar
+from app.container import close_container, get_container
 from app.core.config import get_settings
 from app.core.exception_handlers import log_uncaught_exceptions
+from app.core.log_sink import close_log_sink, get_log_sink
+from app.core.metrics_api import router as metrics_router
+from app.core.metrics_listeners import MongoCommandTimer
 from app.game_state.game_state_models import GameState
 from app.healthcheck import db_healthcheck
 from app.room.room_models import Room
 from app.socket_manager import SocketManager
 
 application = FastAPI(title="banter-bus-core-api")
-sio = SocketManager(app=application, redis_uri=get_settings().get_redis_uri())
+settings = get_settings()
+sio = SocketManager(
+    app=application,
+    redis_uri=settings.get_redis_uri(),
+    json_encoder=settings.SOCKET_JSON_ENCODER,
+    serializer=settings.SOCKET_PACKET_SERIALIZER,
+    room_affinity=settings.ROOM_AFFINITY_ENABLED,
+)
+application.include_router(avatar_router)
+application.include_router(metrics_router)
+# listeners only apply to clients created afterwards, the mongo client is created on startup
+monitoring.register(MongoCommandTimer())
 
 
 @application.on_event("startup")
@@ -18,8 +36,17 @@ async def startup():
     await setup_app(
         app=application,
         get_settings=get_settings,
-        document_models=[Room, GameState],
+        document_models=[Room, GameState, Avatar],
         healthcheck=db_healthcheck,
     )
+    # installed after omnibus has configured structlog, so it wraps that config
+    get_log_sink()
     application.add_exception_handler(Exception, log_uncaught_exceptions)
     use_route_names_as_operation_ids(application)
+    await get_container().start()
+
+
+@application.on_event("shutdown")
+async def shutdown():
+    await close_container()
+    close_log_sink()
@@ -1,11 +1,11 @@
+from app.container import get_container
 from app.player.player_service import PlayerService
 from app.room.room_repository import RoomRepository
 
 
 def get_room_repository() -> RoomRepository:
-    return RoomRepository()
+    return get_container().room_repository
 
 
 def get_player_service() -> PlayerService:
-    room_repository = get_room_repository()
-    return PlayerService(room_repository=room_repository)
+    return get_container().player_service
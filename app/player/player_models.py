@@ -9,13 +9,16 @@ class NewPlayer(BaseModel):
     latest_sid: str
 
 
-class Player(BaseModel):
+class PlayerSummary(BaseModel):
     player_id: str
-    avatar: bytes
     nickname: str
     disconnected_at: datetime | None = None
     latest_sid: str
 
+
+class Player(PlayerSummary):
+    avatar_id: str
+
     class Collection:
         name = "player"
 
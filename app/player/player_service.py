@@ -1,23 +1,39 @@
 from datetime import datetime, timedelta
 from uuid import uuid4
 
-from app.player.player_models import NewPlayer, Player
-from app.room.room_models import Room
+from app.avatar.avatar_service import AvatarService
+from app.player.player_models import NewPlayer, Player, PlayerSummary
+from app.room.room_models import Room, RoomSummary
 from app.room.room_repository import RoomRepository
 
 
 class PlayerService:
-    def __init__(self, room_repository: RoomRepository) -> None:
+    def __init__(self, room_repository: RoomRepository, avatar_service: AvatarService) -> None:
         self.room_repository = room_repository
+        self.avatar_service = avatar_service
 
     async def create(self, room: Room, new_player: NewPlayer) -> Player:
-        player = Player(
-            player_id=str(uuid4()),
-            **new_player.dict(),
-        )
+        player = await self._new_player(new_player=new_player)
         await self.room_repository.add_player(room, player)
         return player
 
+    async def join_room(
+        self, room_id: str, new_player: NewPlayer, maximum_players: int | None = None
+    ) -> tuple[Player, Room]:
+        player = await self._new_player(new_player=new_player)
+        room = await self.room_repository.add_player_if_joinable(
+            room_id=room_id, player=player, maximum_players=maximum_players
+        )
+        return player, room
+
+    async def _new_player(self, new_player: NewPlayer) -> Player:
+        avatar_id = await self.avatar_service.add(avatar=new_player.avatar)
+        return Player(
+            player_id=str(uuid4()),
+            avatar_id=avatar_id,
+            **new_player.dict(exclude={"avatar"}),
+        )
+
     async def get(self, player_id: str) -> Player:
         player = await self.room_repository.get_player(player_id=player_id)
         return player
@@ -29,7 +45,7 @@ class PlayerService:
     async def get_all_in_room(self, room_id: str) -> list[Player]:
         return await self.room_repository.get_all_players(room_id=room_id)
 
-    async def remove_from_room(self, room: Room, nickname: str) -> Player:
+    async def remove_from_room(self, room: Room | RoomSummary, nickname: str) -> Player:
         return await self.room_repository.remove_player(room=room, nickname=nickname)
 
     async def update_disconnected_time(self, sid: str, disconnected_at: datetime | None = None):
@@ -49,3 +65,11 @@ class PlayerService:
                 await self.remove_from_room(nickname=player.nickname, room=room)
 
         return player
+
+    async def remove_disconnected_players(
+        self, disconnect_timer_in_seconds: int, batch_size: int
+    ) -> dict[str, list[PlayerSummary]]:
+        disconnected_before = datetime.now() - timedelta(seconds=disconnect_timer_in_seconds)
+        return await self.room_repository.remove_disconnected_players(
+            disconnected_before=disconnected_before, limit=batch_size
+        )
@@ -0,0 +1,90 @@
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from functools import lru_cache, partial
+
+from omnibus.log.logger import get_logger
+
+from app.core.config import get_settings
+from app.core.room_ownership import get_room_router
+from app.core.unit_of_work import unit_of_work
+from app.player.player_factory import get_player_service
+from app.player.player_models import PlayerSummary
+
+PlayersRemoved = Callable[[str, list[PlayerSummary]], Awaitable[None]]
+SWEEPER_KEY = "disconnected_player_sweeper"
+
+
+class DisconnectedPlayerSweeper:
+    def __init__(
+        self,
+        disconnect_timer_in_seconds: int,
+        interval_in_seconds: int,
+        batch_size: int,
+        should_sweep: Callable[[], bool] | None = None,
+    ) -> None:
+        self.disconnect_timer_in_seconds = disconnect_timer_in_seconds
+        self.interval_in_seconds = interval_in_seconds
+        self.batch_size = batch_size
+        self.should_sweep = should_sweep
+        self._task: asyncio.Task[None] | None = None
+        self._on_removed: PlayersRemoved | None = None
+
+    def start(self, on_removed: PlayersRemoved):
+        self._on_removed = on_removed
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def sweep(self) -> int:
+        if self.should_sweep and not self.should_sweep():
+            return 0
+
+        player_service = get_player_service()
+        with unit_of_work() as work:
+            removed_players = await player_service.remove_disconnected_players(
+                disconnect_timer_in_seconds=self.disconnect_timer_in_seconds, batch_size=self.batch_size
+            )
+            for room_id, players in removed_players.items():
+                if self._on_removed:
+                    await self._on_removed(room_id, players)
+
+        logger = get_logger()
+        logger.debug("Database round trips", task="sweep_disconnected_players", round_trips=work.round_trips)
+        return len(removed_players)
+
+    async def _run(self):
+        logger = get_logger()
+        while True:
+            try:
+                rooms_swept = await self.sweep()
+            except Exception:
+                logger.exception("failed to sweep disconnected players")
+                rooms_swept = 0
+
+            # a full batch means there are probably more players to remove, so don't wait
+            if rooms_swept < self.batch_size:
+                await asyncio.sleep(self.interval_in_seconds)
+
+
+@lru_cache
+def get_disconnected_player_sweeper() -> DisconnectedPlayerSweeper:
+    config = get_settings()
+    room_router = get_room_router()
+    # rooms kept in memory are only held by their owner, so every node sweeps its own, but rooms in the database are
+    # shared and a single node sweeps them so players aren't reported as removed by every node
+    should_sweep = None
+    if room_router and config.ROOM_BACKEND != "memory":
+        should_sweep = partial(room_router.is_owner, SWEEPER_KEY)
+
+    return DisconnectedPlayerSweeper(
+        disconnect_timer_in_seconds=config.DISCONNECT_TIMER_IN_SECONDS,
+        interval_in_seconds=config.DISCONNECTED_PLAYER_SWEEP_INTERVAL_IN_SECONDS,
+        batch_size=config.DISCONNECTED_PLAYER_SWEEP_BATCH_SIZE,
+        should_sweep=should_sweep,
+    )
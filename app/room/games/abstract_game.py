@@ -1,11 +1,24 @@
 import abc
 
 from app.game_state.game_state_models import GameState, NextQuestion
-from app.player.player_models import Player
-from app.room.room_events_models import GotNextQuestion
+from app.player.player_models import PlayerSummary
+from app.room.room_events_models import EventResponse, GotNextQuestion
 
 
 class AbstractGame(abc.ABC):
     @abc.abstractmethod
-    def got_next_question(self, player: Player, game_state: GameState, next_question: NextQuestion) -> GotNextQuestion:
+    def got_next_question(
+        self, player: PlayerSummary, game_state: GameState, next_question: NextQuestion
+    ) -> GotNextQuestion:
         raise NotImplementedError
+
+    def got_next_question_responses(
+        self, room_id: str, players: list[PlayerSummary], game_state: GameState, next_question: NextQuestion
+    ) -> list[EventResponse]:
+        event_responses: list[EventResponse] = []
+        for player in players:
+            got_next_question = self.got_next_question(
+                player=player, game_state=game_state, next_question=next_question
+            )
+            event_responses.append(EventResponse(send_to=player.latest_sid, response_data=got_next_question))
+        return event_responses
@@ -5,14 +5,20 @@ from app.game_state.game_state_models import (
     NextQuestion,
     UpdateQuestionRoundState,
 )
-from app.player.player_models import Player
+from app.player.player_models import PlayerSummary
 from app.room.games.abstract_game import AbstractGame
 from app.room.games.exceptions import UnexpectedGameStateType
-from app.room.room_events_models import GotNextQuestion, GotQuestionFibbingIt
+from app.room.room_events_models import (
+    EventResponse,
+    GotNextQuestion,
+    GotQuestionFibbingIt,
+)
 
 
 class FibbingIt(AbstractGame):
-    def got_next_question(self, player: Player, game_state: GameState, next_question: NextQuestion) -> GotNextQuestion:
+    def got_next_question(
+        self, player: PlayerSummary, game_state: GameState, next_question: NextQuestion
+    ) -> GotNextQuestion:
         if not isinstance(game_state.state, FibbingItState):
             raise UnexpectedGameStateType("expected `game_state.state` to be of type `FibbingItState`")
 
@@ -20,6 +26,26 @@ class FibbingIt(AbstractGame):
         got_next_question = self._get_got_next_question(is_player_fibber, next_question)
         return got_next_question
 
+    def got_next_question_responses(
+        self, room_id: str, players: list[PlayerSummary], game_state: GameState, next_question: NextQuestion
+    ) -> list[EventResponse]:
+        if not isinstance(game_state.state, FibbingItState):
+            raise UnexpectedGameStateType("expected `game_state.state` to be of type `FibbingItState`")
+
+        # every player except the fibber gets the same question, so send it to the room once
+        got_next_question = self._get_got_next_question(is_player_fibber=False, next_question=next_question)
+        for player in players:
+            if player.player_id == game_state.state.current_fibber_id:
+                break
+        else:
+            return [EventResponse(send_to=room_id, response_data=got_next_question)]
+
+        got_next_question_fibber = self._get_got_next_question(is_player_fibber=True, next_question=next_question)
+        return [
+            EventResponse(send_to=room_id, response_data=got_next_question, skip_sid=player.latest_sid),
+            EventResponse(send_to=player.latest_sid, response_data=got_next_question_fibber),
+        ]
+
     @staticmethod
     def _get_got_next_question(is_player_fibber: bool, next_question: NextQuestion) -> GotNextQuestion:
         if not isinstance(next_question.next_question, FibbingItQuestion):
@@ -1,14 +1,17 @@
+from typing import Union
+
 from omnibus.log.logger import get_logger
 
-from app.event_manager import error_handler, event_handler
+from app.event_manager import error_handler, event_handler, publish_event
 from app.event_models import Error
 from app.exception_handlers import handle_error
 from app.game_state.game_state_exceptions import ActionTimedOut
 from app.game_state.game_state_factory import get_game_state_service
-from app.game_state.game_state_models import FibbingActions, FibbingItState
+from app.game_state.game_state_models import FibbingActions, FibbingItState, GameState
 from app.game_state.games.fibbing_it.fibbing_it import FibbingIt
-from app.player.player_factory import get_player_service
+from app.room.lobby.lobby_event_helpers import get_next_question_responses
 from app.room.room_events_models import (
+    GOT_ANSWERS_FIBBING_IT,
     AnswerSubmittedFibbingIt,
     GetAnswersFibbingIt,
     GotAnswersFibbingIt,
@@ -17,44 +20,68 @@ from app.room.room_events_models import (
     VoteSubmittedFibbingIt,
 )
 from app.room.room_factory import get_room_service
+from app.room.room_models import RoomSummary
+
+SubmitAnswerResult = tuple[Union[AnswerSubmittedFibbingIt, Error], str]
 
 
 # TODO: check if all users have submitted answers, then move to next stage
 # TODO: refactor common code
-@error_handler(Exception, handle_error)
-@event_handler(input_model=SubmitAnswerFibbingIt)
-async def submit_answer_fibbing_it(
-    sid: str, submit_answer: SubmitAnswerFibbingIt
-) -> tuple[AnswerSubmittedFibbingIt | Error, str]:
+async def submit_answers_fibbing_it(
+    submissions: list[tuple[str, SubmitAnswerFibbingIt]]
+) -> list[SubmitAnswerResult | Exception]:
     logger = get_logger()
     game_state_service = get_game_state_service()
-    player_service = get_player_service()
     room_service = get_room_service()
-    player = await player_service.get(player_id=submit_answer.player_id)
-    room = await room_service.get(room_id=submit_answer.room_code)
+    room_code = submissions[0][1].room_code
+    room_context = await room_service.get_context(room_id=room_code)
 
-    for player in room.players:
-        if player.player_id == submit_answer.player_id:
-            break
-    else:
-        return Error(code="player_not_in_room", message="Player not in room"), sid
-
-    players = room.players
-    state = await game_state_service.get_game_state_by_room_id(room_id=submit_answer.room_code)
+    players = room_context.room.players
+    state = room_context.game_state
 
     fibbing_it = FibbingIt()
     player_ids = [player.player_id for player in players]
+    results: list[SubmitAnswerResult | Exception | None] = []
+    answers: dict[str, str] = {}
+    for sid, submit_answer in submissions:
+        if submit_answer.player_id not in player_ids:
+            results.append((Error(code="player_not_in_room", message="Player not in room"), sid))
+            continue
+
+        try:
+            fibbing_it.validate_answer(game_state=state, player_ids=player_ids, answer=submit_answer.answer)
+            answers[submit_answer.player_id] = submit_answer.answer
+            results.append(None)
+        except ActionTimedOut as e:
+            logger.exception("unable to submit answer, time has run out", now=e.now, completed_by=e.completed_by)
+            results.append((Error(code="time_run_out", message="Cannot submit answer, time has run out"), sid))
+        except Exception as e:
+            results.append(e)
+
+    if not answers:
+        # every submission was rejected, so each one already has a result
+        return [result for result in results if result]
+
+    response: AnswerSubmittedFibbingIt | Error
     try:
-        new_state = fibbing_it.submit_answers(
-            game_state=state, player_ids=player_ids, player_id=submit_answer.player_id, answer=submit_answer.answer
-        )
-
-        await game_state_service.update_state(game_state=state, state=new_state)
+        # all valid answers in the batch are saved with a single write
+        game_state = await game_state_service.submit_answers(room_id=room_code, answers=answers)
+        new_state = FibbingItState(**game_state.state.dict())  # type: ignore
         all_submitted = len(new_state.questions.current_answers) == len(players)
-        return AnswerSubmittedFibbingIt(all_players_submitted=all_submitted), sid
+        response = AnswerSubmittedFibbingIt(all_players_submitted=all_submitted)
     except ActionTimedOut as e:
         logger.exception("unable to submit answer, time has run out", now=e.now, completed_by=e.completed_by)
-        return Error(code="time_run_out", message="Cannot submit answer, time has run out"), sid
+        response = Error(code="time_run_out", message="Cannot submit answer, time has run out")
+    return [result or (response, sid) for result, (sid, _) in zip(results, submissions)]
+
+
+@error_handler(Exception, handle_error)
+@event_handler(input_model=SubmitAnswerFibbingIt, batch_handler=submit_answers_fibbing_it)
+async def submit_answer_fibbing_it(sid: str, submit_answer: SubmitAnswerFibbingIt) -> SubmitAnswerResult:
+    result = (await submit_answers_fibbing_it([(sid, submit_answer)]))[0]
+    if isinstance(result, Exception):
+        raise result
+    return result
 
 
 @error_handler(Exception, handle_error)
@@ -63,10 +90,9 @@ async def get_answers_fibbing_it(sid: str, get_answers: GetAnswersFibbingIt) ->
     logger = get_logger()
     logger.debug("Get all answers")
     game_state_service = get_game_state_service()
-    player_service = get_player_service()
     room_service = get_room_service()
-    player = await player_service.get(player_id=get_answers.player_id)
-    room = await room_service.get(room_id=get_answers.room_code)
+    room_context = await room_service.get_context(room_id=get_answers.room_code)
+    room = room_context.room
 
     for player in room.players:
         if player.player_id == get_answers.player_id:
@@ -75,7 +101,7 @@ async def get_answers_fibbing_it(sid: str, get_answers: GetAnswersFibbingIt) ->
         return Error(code="player_not_in_room", message="Player not in room"), sid
 
     players = room.players
-    state = await game_state_service.get_game_state_by_room_id(room_id=get_answers.room_code)
+    state = room_context.game_state
 
     fibbing_it = FibbingIt()
     player_ids = [player.player_id for player in players]
@@ -99,10 +125,8 @@ async def submit_vote_fibbing_it(
 ) -> tuple[VoteSubmittedFibbingIt | Error, str]:
     logger = get_logger()
     game_state_service = get_game_state_service()
-    player_service = get_player_service()
     room_service = get_room_service()
-    player = await player_service.get(player_id=submit_vote.player_id)
-    room = await room_service.get(room_id=submit_vote.room_code)
+    room = await room_service.get_summary(room_id=submit_vote.room_code)
 
     for player in room.players:
         if player.player_id == submit_vote.player_id:
@@ -116,17 +140,47 @@ async def submit_vote_fibbing_it(
     else:
         return Error(code="player_not_in_room", message="Player not in room"), sid
 
-    state = await game_state_service.get_game_state_by_room_id(room_id=submit_vote.room_code)
-
-    fibbing_it = FibbingIt()
     try:
-        new_state = fibbing_it.submit_vote(
-            game_state=state,
-            nickname=submit_vote.nickname,
-        )
-
-        await game_state_service.update_state(game_state=state, state=new_state)
+        game_state = await game_state_service.submit_vote(room_id=submit_vote.room_code, nickname=submit_vote.nickname)
+        new_state = FibbingItState(**game_state.state.dict())  # type: ignore
         return VoteSubmittedFibbingIt(votes=new_state.questions.votes), submit_vote.room_code
     except ActionTimedOut as e:
         logger.exception("unable to submit vote, time has run out", now=e.now, completed_by=e.completed_by)
         return Error(code="time_run_out", message="Cannot submit vote, time has run out"), sid
+
+
+async def complete_expired_action_fibbing_it(game_state: GameState, room: RoomSummary):
+    logger = get_logger()
+    game_state_service = get_game_state_service()
+    fibbing_it = FibbingIt()
+    if game_state.action == FibbingActions.submit_answers:
+        state = FibbingItState(**game_state.state.dict())  # type: ignore
+        new_state = fibbing_it.fill_missing_answers(
+            state=state, player_ids=[player.player_id for player in room.players]
+        )
+        game_state = await game_state_service.update_state(game_state=game_state, state=new_state)
+        timer = fibbing_it.get_timer(current_round=new_state.current_round, action=FibbingActions.vote_on_fibber)
+        await game_state_service.update_next_action(
+            next_action=FibbingActions.vote_on_fibber, timer=timer, game_state=game_state
+        )
+        answers = fibbing_it.get_player_answers(
+            state=new_state, player_map={player.player_id: player.nickname for player in room.players}
+        )
+        got_answers = GotAnswersFibbingIt(answers=answers, timer_in_seconds=timer)
+        await publish_event(event_name=GOT_ANSWERS_FIBBING_IT, event_body=got_answers, room=room.room_id)
+    elif game_state.action == FibbingActions.vote_on_fibber:
+        next_question = await game_state_service.get_next_question(
+            game_state=game_state, current_action=FibbingActions.show_question
+        )
+        event_responses = get_next_question_responses(
+            room_id=room.room_id, game_state=game_state, next_question=next_question, players=room.players
+        )
+        for event_response in event_responses:
+            await publish_event(
+                event_name=event_response.response_data.event_name,
+                event_body=event_response.response_data,
+                room=event_response.send_to,
+                skip_sid=event_response.skip_sid,
+            )
+    else:
+        logger.debug("no timed out transition for action", room_id=room.room_id, action=game_state.action.value)
@@ -1,5 +1,7 @@
 from omnibus.log.logger import get_logger
 
+from app.avatar.avatar_exceptions import InvalidAvatar
+from app.core.config import get_settings
 from app.event_manager import error_handler, event_handler, leave_room, publish_event
 from app.event_models import Error
 from app.exception_handlers import handle_error
@@ -20,8 +22,10 @@ from app.room.lobby.lobby_events_models import (
 )
 from app.room.room_exceptions import (
     NicknameExistsException,
+    RoomFullError,
     RoomInInvalidState,
     RoomNotFound,
+    RoomNotJoinableError,
 )
 from app.room.room_factory import get_game_api, get_lobby_service
 
@@ -40,13 +44,16 @@ async def create_room(sid: str, _: CreateRoom) -> tuple[RoomCreated, None]:
 async def join_room(sid, join_room: JoinRoom) -> tuple[RoomJoined | Error, str]:
     logger = get_logger()
     try:
+        config = get_settings()
         lobby_service = get_lobby_service()
         new_player = NewPlayer(
             avatar=join_room.avatar,  # type: ignore
             nickname=join_room.nickname,
             latest_sid=sid,
         )
-        room_players = await lobby_service.join(room_id=join_room.room_code, new_player=new_player)
+        room_players = await lobby_service.join(
+            room_id=join_room.room_code, new_player=new_player, maximum_players=config.MAXIMUM_PLAYERS_PER_ROOM
+        )
         room_joined = await enter_room_joined(sid, join_room.room_code, room_players)
         new_room_joined = NewRoomJoined(player_id=room_players.player_id)
         await publish_event(event_name=NEW_ROOM_JOINED, event_body=new_room_joined, room=sid)
@@ -59,6 +66,18 @@ async def join_room(sid, join_room: JoinRoom) -> tuple[RoomJoined | Error, str]:
         logger.exception("nickname already exists", room_code=join_room.room_code, nickname=e.nickname)
         error = Error(code="room_join_fail", message=f"nickname {e.nickname} already exists")
         return error, sid
+    except RoomNotJoinableError as e:
+        logger.exception("room is not joinable", room_code=e.room_id, room_state=e.room_state)
+        error = Error(code="room_join_fail", message="room is not joinable")
+        return error, sid
+    except RoomFullError as e:
+        logger.exception("room is full", room_code=e.room_id, maximum_players=e.maximum_players)
+        error = Error(code="room_join_fail", message="room is full")
+        return error, sid
+    except InvalidAvatar as e:
+        logger.exception("invalid avatar", room_code=join_room.room_code, reason=e.msg)
+        error = Error(code="room_join_fail", message=e.msg)
+        return error, sid
 
 
 @error_handler(Exception, handle_error)
@@ -73,7 +92,7 @@ async def kick_player(sid, kick_player: KickPlayer) -> tuple[PlayerKicked | Erro
             room_id=kick_player.room_code,
         )
         player_kicked = PlayerKicked(nickname=kicked_player.nickname)
-        leave_room(kicked_player.latest_sid, room=kick_player.room_code)
+        await leave_room(kicked_player.latest_sid, room=kick_player.room_code)
         return player_kicked, kick_player.room_code
     except RoomInInvalidState as e:
         logger.exception("Game has started playing cannot kick players", room_state=e.room_state)
@@ -2,12 +2,18 @@ from pydantic import parse_obj_as
 
 from app.event_manager import enter_room, publish_event
 from app.game_state.game_state_factory import get_game_state_service
+from app.game_state.game_state_models import GameState, NextQuestion
 from app.game_state.game_state_service import GameStateService
 from app.player.player_factory import get_player_service
-from app.player.player_models import RoomPlayers
+from app.player.player_models import PlayerSummary, RoomPlayers
 from app.room.games.game import get_game
 from app.room.lobby.lobby_events_models import Player, RoomJoined
-from app.room.room_events_models import GAME_UNPAUSED, GOT_NEXT_QUESTION, GameUnpaused
+from app.room.room_events_models import (
+    GAME_UNPAUSED,
+    GOT_NEXT_QUESTION,
+    EventResponse,
+    GameUnpaused,
+)
 
 
 async def get_next_question_helper(sid: str, player_id: str, room_code: str):
@@ -22,10 +28,19 @@ async def get_next_question_helper(sid: str, player_id: str, room_code: str):
     await publish_event(event_name=GOT_NEXT_QUESTION, event_body=got_next_question, room=sid)
 
 
+def get_next_question_responses(
+    room_id: str, game_state: GameState, next_question: NextQuestion, players: list[PlayerSummary]
+) -> list[EventResponse]:
+    game = get_game(game_name=game_state.game_name)
+    return game.got_next_question_responses(
+        room_id=room_id, players=players, game_state=game_state, next_question=next_question
+    )
+
+
 async def enter_room_joined(sid: str, room_code: str, room_players: RoomPlayers) -> RoomJoined:
     players = parse_obj_as(list[Player], room_players.players)
     room_joined = RoomJoined(players=players, host_player_nickname=room_players.host_player_nickname)
-    enter_room(sid, room_code)
+    await enter_room(sid, room_code)
     return room_joined
 
 
@@ -46,13 +46,7 @@ class JoinRoom(EventModel):
 
 class Player(BaseModel):
     nickname: str
-    avatar: str | bytes
-
-    @validator("avatar", pre=True)
-    def base64_bytes_to_string(cls, value):
-        if isinstance(value, bytes):
-            return value.decode()
-        return value
+    avatar_id: str
 
 
 class RoomJoined(EventModel):
@@ -6,14 +6,13 @@ from app.player.player_models import NewPlayer, Player, RoomPlayers
 from app.player.player_service import PlayerService
 from app.room.room_exceptions import (
     GameNotEnabled,
-    NicknameExistsException,
     RoomHasNoHostError,
     RoomInInvalidState,
     RoomNotJoinableError,
     TooFewPlayersInRoomError,
     TooManyPlayersInRoomError,
 )
-from app.room.room_models import Room, RoomState
+from app.room.room_models import Room, RoomState, RoomSummary
 from app.room.room_service import RoomService
 
 
@@ -29,39 +28,20 @@ class LobbyService:
         room = await self.room_service.create()
         return room
 
-    async def join(self, room_id: str, new_player: NewPlayer) -> RoomPlayers:
-        room = await self.room_service.get(room_id=room_id)
-        if not room.state.is_room_joinable:
-            raise RoomNotJoinableError(msg="room is not joinable", room_id=room.room_id, room_state=room.state)
-
-        existing_players = await self.player_service.get_all_in_room(room_id=room.room_id)
-        self._check_nickname_is_unique(new_player_nickname=new_player.nickname, existing_players=existing_players)
-
-        player = await self._add_new_player(new_player=new_player, room=room)
-        players = [*existing_players, player]
-
+    async def join(self, room_id: str, new_player: NewPlayer, maximum_players: int | None = None) -> RoomPlayers:
+        player, room = await self.player_service.join_room(
+            room_id=room_id, new_player=new_player, maximum_players=maximum_players
+        )
         if not room.host:
             raise RoomHasNoHostError(msg="room has no host", room_id=room.room_id)
 
         return self._get_players_in_room(
             room_host_player_id=room.host,
-            players=players,
+            players=room.players,
             player_id=player.player_id,
             room_code=room.room_id,
         )
 
-    @staticmethod
-    def _check_nickname_is_unique(new_player_nickname: str, existing_players: list[Player]):
-        matching_nickname = [player for player in existing_players if player.nickname == new_player_nickname]
-        if matching_nickname:
-            raise NicknameExistsException(msg="nickname already exists", nickname=new_player_nickname)
-
-    async def _add_new_player(self, new_player: NewPlayer, room: Room):
-        player = await self.player_service.create(room=room, new_player=new_player)
-        if room.host is None:
-            await self.room_service.update_host(room=room, player_id=player.player_id)
-        return player
-
     async def rejoin(self, player_id: str, latest_sid: str) -> RoomPlayers:
         await self.player_service.update_latest_sid(player_id=player_id, latest_sid=latest_sid)
         await self.player_service.update_disconnected_time(sid=latest_sid, disconnected_at=None)
@@ -95,7 +75,7 @@ class LobbyService:
         )
 
     async def kick_player(self, player_to_kick_nickname: str, player_attempting_kick: str, room_id: str) -> Player:
-        room = await self.room_service.get(room_id=room_id)
+        room = await self.room_service.get_summary(room_id=room_id)
         self.room_service.check_is_player_host(room=room, player_id=player_attempting_kick)
 
         if room.state != RoomState.CREATED:
@@ -104,7 +84,7 @@ class LobbyService:
         player = await self.player_service.remove_from_room(nickname=player_to_kick_nickname, room=room)
         return player
 
-    async def update_host(self, room: Room, old_host_id: str) -> Player:
+    async def update_host(self, room: Room | RoomSummary, old_host_id: str) -> Player:
         players = await self.player_service.get_all_in_room(room_id=room.room_id)
         for player in players:
             if player.player_id != old_host_id:
@@ -114,8 +94,8 @@ class LobbyService:
 
         raise NoOtherHostError(f"no other host found for room {room.room_id=}")
 
-    async def start_game(self, game_api: AsyncGamesApi, game_name: str, player_id: str, room_id: str) -> Room:
-        room = await self.room_service.get(room_id=room_id)
+    async def start_game(self, game_api: AsyncGamesApi, game_name: str, player_id: str, room_id: str) -> RoomSummary:
+        room = await self.room_service.get_summary(room_id=room_id)
         if room.state != RoomState.CREATED:
             raise RoomInInvalidState(msg=f"expected room state {RoomState.CREATED}", room_state=room.state)
 
@@ -129,7 +109,7 @@ class LobbyService:
         return room
 
     @staticmethod
-    def _check_game_is_valid(game_name: str, room: Room, game: GameOut):
+    def _check_game_is_valid(game_name: str, room: RoomSummary, game: GameOut):
         if not game.enabled:
             raise GameNotEnabled(f"{game_name} is not enabled")
         elif len(room.players) > game.maximum_players:
@@ -0,0 +1,110 @@
+import asyncio
+import contextlib
+
+from omnibus.log.logger import get_logger
+from redis.asyncio import Redis
+
+from app.core.cache import CacheStats, LRUCache
+from app.room.room_models import Room
+
+ROOM_INVALIDATED_CHANNEL = "banter_bus_core_api:room_invalidated"
+ALL_ROOMS = "*"
+
+
+class RoomCache:
+    def __init__(self, max_entries: int, ttl_in_seconds: float, redis_uri: str | None = None) -> None:
+        self.redis_uri = redis_uri
+        self._rooms: LRUCache[Room] = LRUCache(max_entries=max_entries, ttl_in_seconds=ttl_in_seconds)
+        self._room_ids_by_player_id: LRUCache[str] = LRUCache(
+            max_entries=max_entries * 10, ttl_in_seconds=ttl_in_seconds
+        )
+        # bumped on every invalidation, a read started before a room was invalidated must not cache what it read
+        self.generation = 0
+        self._cleared_at = 0
+        self._invalidated_at: LRUCache[int] = LRUCache(max_entries=max_entries * 10, ttl_in_seconds=ttl_in_seconds)
+        self._redis: Redis | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def get(self, room_id: str) -> Room | None:
+        room = self._rooms.get(room_id)
+        # services update rooms in place, so never hand out the cached instance
+        return room.copy(deep=True) if room else None
+
+    def get_by_player_id(self, player_id: str) -> Room | None:
+        room_id = self._room_ids_by_player_id.get(player_id)
+        if room_id is None:
+            return None
+
+        room = self.get(room_id)
+        if room is None or all(player.player_id != player_id for player in room.players):
+            return None
+        return room
+
+    def set(self, room: Room, read_at: int | None = None):
+        if read_at is not None and self._is_invalidated_since(room.room_id, read_at):
+            return
+
+        self._rooms.set(room.room_id, room.copy(deep=True))
+        for player in room.players:
+            self._room_ids_by_player_id.set(player.player_id, room.room_id)
+
+    async def invalidate(self, room_id: str = ALL_ROOMS):
+        self._evict(room_id)
+        if self._redis:
+            await self._redis.publish(ROOM_INVALIDATED_CHANNEL, room_id)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._rooms.stats
+
+    def start(self):
+        if self.redis_uri:
+            self._redis = Redis.from_url(self.redis_uri)
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._redis:
+            await self._redis.close()
+            self._redis = None
+
+    def _is_invalidated_since(self, room_id: str, generation: int) -> bool:
+        invalidated_at = self._invalidated_at.get(room_id) or 0
+        return max(invalidated_at, self._cleared_at) > generation
+
+    def _evict(self, room_id: str):
+        self.generation += 1
+        if room_id == ALL_ROOMS:
+            self._cleared_at = self.generation
+            self._rooms.clear()
+            self._room_ids_by_player_id.clear()
+        else:
+            self._invalidated_at.set(room_id, self.generation)
+            self._rooms.delete(room_id)
+
+    async def _listen(self):
+        while self._redis:
+            try:
+                await self._subscribe()
+            except Exception:
+                logger = get_logger()
+                logger.exception("room cache lost its invalidation subscription, clearing it")
+                await asyncio.sleep(1)
+            finally:
+                # we may have missed invalidations from other nodes
+                self._evict(ALL_ROOMS)
+
+    async def _subscribe(self):
+        if self._redis is None:
+            return
+
+        async with self._redis.pubsub() as pubsub:
+            await pubsub.subscribe(ROOM_INVALIDATED_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._evict(message["data"].decode())
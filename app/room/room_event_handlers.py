@@ -1,20 +1,27 @@
+from datetime import datetime
+
 from omnibus.log.logger import get_logger
 
 from app.core.config import get_settings
-from app.event_manager import error_handler, event_handler, leave_room
+from app.core.room_executor import get_room_executor
+from app.core.unit_of_work import unit_of_work
+from app.event_manager import error_handler, event_handler, leave_room, publish_event
 from app.event_models import Error
 from app.exception_handlers import handle_error
 from app.game_state.game_state_factory import get_game_state_service
 from app.player.player_exceptions import PlayerNotInRoom
 from app.player.player_factory import get_player_service
-from app.room.games.game import get_game
+from app.player.player_models import PlayerSummary
+from app.room.games.fibbing_it_event_handlers import complete_expired_action_fibbing_it
 from app.room.lobby.lobby_event_helpers import (
     enter_room_joined,
     get_next_question_helper,
+    get_next_question_responses,
     send_unpause_event_if_no_players_are_disconnected,
 )
 from app.room.lobby.lobby_events_models import RoomJoined
 from app.room.room_events_models import (
+    PERMANENTLY_DISCONNECTED_PLAYER,
     EventResponse,
     GamePaused,
     GameUnpaused,
@@ -46,7 +53,7 @@ async def permanently_disconnect_player(
             disconnect_timer_in_seconds=config.DISCONNECT_TIMER_IN_SECONDS,
         )
 
-        leave_room(disconnected_player.latest_sid, room=data.room_code)
+        await leave_room(disconnected_player.latest_sid, room=data.room_code)
         # TODO: remove from waiting for
         perm_disconnected_player = PermanentlyDisconnectedPlayer(nickname=data.nickname)
         return perm_disconnected_player, data.room_code
@@ -64,7 +71,7 @@ async def rejoin_room(sid: str, rejoin_room: RejoinRoom) -> tuple[RoomJoined | E
         room_players = await lobby_service.rejoin(player_id=rejoin_room.player_id, latest_sid=sid)
 
         room_service = get_room_service()
-        room = await room_service.get(room_id=room_players.room_code)
+        room = await room_service.get_summary(room_id=room_players.room_code)
         room_joined = await enter_room_joined(sid, room_players.room_code, room_players)
         if room.state.is_room_rejoinable_and_started:
             await get_next_question_helper(sid=sid, player_id=rejoin_room.player_id, room_code=room_players.room_code)
@@ -86,13 +93,12 @@ async def rejoin_room(sid: str, rejoin_room: RejoinRoom) -> tuple[RoomJoined | E
 async def get_next_question(_: str, get_next_question: GetNextQuestion) -> tuple[list[EventResponse], None]:
     logger = get_logger()
     game_state_service = get_game_state_service()
-    game_state = await game_state_service.get_game_state_by_room_id(room_id=get_next_question.room_code)
+    room_service = get_room_service()
+    room_context = await room_service.get_context(room_id=get_next_question.room_code)
+    game_state = room_context.game_state
     next_question = await game_state_service.get_next_question(game_state=game_state)
 
-    player_service = get_player_service()
-    room_service = get_room_service()
-    player = await player_service.get(player_id=get_next_question.player_id)
-    room = await room_service.get(room_id=get_next_question.room_code)
+    room = room_context.room
     for player in room.players:
         if player.player_id == get_next_question.player_id:
             break
@@ -100,12 +106,9 @@ async def get_next_question(_: str, get_next_question: GetNextQuestion) -> tuple
         logger.warning("Player getting next question not in room", get_next_question=get_next_question.dict())
         raise PlayerNotInRoom("player not in room, cannot get next question")
 
-    players = room.players
-    game = get_game(game_name=game_state.game_name)
-    event_responses: list[EventResponse] = []
-    for player in players:
-        got_next_question = game.got_next_question(player=player, game_state=game_state, next_question=next_question)
-        event_responses.append(EventResponse(send_to=player.latest_sid, response_data=got_next_question))
+    event_responses = get_next_question_responses(
+        room_id=room.room_id, game_state=game_state, next_question=next_question, players=room.players
+    )
     return event_responses, None
 
 
@@ -129,3 +132,48 @@ async def unpause_game(_: str, unpause_game: UnpauseGame) -> tuple[GameUnpaused,
         room_id=unpause_game.room_code, player_id=unpause_game.player_id, game_state_service=game_state_service
     )
     return GameUnpaused(), unpause_game.room_code
+
+
+async def action_expired(room_id: str, completed_by: datetime):
+    # the transition changes the same game state as the room's events, so it runs in turn with them
+    await get_room_executor().run(room_id, lambda: complete_expired_action(room_id, completed_by))
+
+
+async def complete_expired_action(room_id: str, completed_by: datetime):
+    with unit_of_work() as work:
+        await _complete_expired_action(room_id, completed_by)
+    logger = get_logger()
+    logger.debug("Database round trips", task="complete_expired_action", round_trips=work.round_trips)
+
+
+async def _complete_expired_action(room_id: str, completed_by: datetime):
+    logger = get_logger()
+    logger.debug("Action timed out", room_id=room_id, completed_by=completed_by)
+    game_state_service = get_game_state_service()
+    room_service = get_room_service()
+    room_context = await room_service.get_context(room_id=room_id)
+    game_state = room_context.game_state
+    if game_state.paused.is_paused:
+        logger.debug("Game paused, action will be rescheduled when unpaused", room_id=room_id)
+        return
+
+    claimed = await game_state_service.claim_expired_action(game_state=game_state)
+    if not claimed:
+        logger.debug("Expired action already completed", room_id=room_id, action=game_state.action.value)
+        return
+
+    # answers and votes can still be written until the action is claimed, so read them again
+    game_state = await game_state_service.get_game_state_by_room_id(room_id=room_id)
+    if game_state.game_name == "fibbing_it":
+        await complete_expired_action_fibbing_it(game_state=game_state, room=room_context.room)
+
+
+async def disconnected_players_removed(room_id: str, players: list[PlayerSummary]):
+    logger = get_logger()
+    logger.debug("Removed disconnected players", room_id=room_id, removed=len(players))
+    for player in players:
+        await leave_room(player.latest_sid, room=room_id)
+        perm_disconnected_player = PermanentlyDisconnectedPlayer(nickname=player.nickname)
+        await publish_event(
+            event_name=PERMANENTLY_DISCONNECTED_PLAYER, event_body=perm_disconnected_player, room=room_id
+        )
@@ -1,11 +1,24 @@
+from collections.abc import Callable, Coroutine
 from datetime import datetime
+from functools import wraps
+from typing import Any
 
 from omnibus.log.logger import get_logger
 
+from app.container import get_container
+from app.core.load_shedding import get_admission_controller, get_loop_lag_monitor
+from app.core.metrics import get_metrics
+from app.core.room_executor import get_room_executor
+from app.core.room_ownership import HashRing, get_room_router
+from app.core.unit_of_work import unit_of_work
+from app.event_manager import publish_event
+from app.event_models import ERROR, Error
+from app.game_state.action_timer import get_action_timer
 from app.game_state.game_state_factory import get_game_state_service
-from app.main import sio
+from app.main import application, sio
 from app.player.player_exceptions import PlayerNotFound
 from app.player.player_factory import get_player_service
+from app.player.player_sweeper import get_disconnected_player_sweeper
 from app.room.games.fibbing_it_event_handlers import (
     get_answers_fibbing_it,
     submit_answer_fibbing_it,
@@ -25,6 +38,8 @@ from app.room.lobby.lobby_events_models import (
     START_GAME,
 )
 from app.room.room_event_handlers import (
+    action_expired,
+    disconnected_players_removed,
     get_next_question,
     pause_game,
     permanently_disconnect_player,
@@ -49,6 +64,127 @@ from app.room.room_events_models import (
 from app.room.room_factory import get_lobby_service, get_room_service
 from app.room.room_models import RoomState
 
+DISCONNECT_PLAYER = "DISCONNECT_PLAYER"
+
+
+@application.on_event("startup")
+async def start_action_timer():
+    await schedule_pending_actions()
+    get_action_timer().start(on_expired=action_expired)
+
+
+@application.on_event("startup")
+async def start_disconnected_player_sweeper():
+    get_disconnected_player_sweeper().start(on_removed=disconnected_players_removed)
+
+
+@application.on_event("startup")
+async def start_loop_lag_monitor():
+    get_loop_lag_monitor().start()
+
+
+@application.on_event("startup")
+async def start_room_router():
+    room_router = get_room_router()
+    if room_router:
+        room_router.add_ownership_listener(hand_over_rooms)
+        room_router.add_handover_listener(take_over_rooms)
+        await room_router.start(dispatch=dispatch_forwarded)
+
+
+async def dispatch_forwarded(event_name: str, sid: str, data: Any):
+    # events raised by the server aren't registered with socket.io, so clients can't send them
+    if event_name == DISCONNECT_PLAYER:
+        await disconnect_player(sid, data)
+    else:
+        await sio.trigger_event(event_name, sid, data)
+
+
+async def hand_over_rooms(previous_ring: HashRing, ring: HashRing):
+    room_router = get_room_router()
+    repositories = get_container().in_memory_repositories
+    if room_router is None or not repositories:
+        return
+
+    node_id = room_router.node_id
+
+    def is_owner(room_id: str) -> bool:
+        return ring.owner(room_id) == node_id
+
+    def is_gained(room_id: str) -> bool:
+        return is_owner(room_id) and previous_ring.owner(room_id) != node_id
+
+    # the new owners read rooms from the database, so make sure it has everything this node changed
+    handed_over: set[str] = set()
+    for repository in repositories:
+        await repository.snapshot()
+        handed_over |= repository.evict(keep=is_owner)
+    await room_router.hand_over(handed_over)
+
+    gained_ranges = ring.gained_ranges(previous_ring, node_id=node_id)
+    for repository in repositories:
+        await repository.load(owns=is_gained, ranges=gained_ranges)
+    await schedule_pending_actions()
+
+
+async def take_over_rooms(room_ids: list[str]):
+    # the previous owner has written these rooms to the database, replace the copies loaded before it did
+    room_router = get_room_router()
+    repositories = get_container().in_memory_repositories
+    if room_router is None or not repositories:
+        return
+
+    for repository in repositories:
+        await repository.load(owns=room_router.is_owner, room_ids=room_ids)
+    await schedule_pending_actions()
+
+
+async def schedule_pending_actions():
+    logger = get_logger()
+    game_state_service = get_game_state_service()
+    with unit_of_work() as work:
+        pending = await game_state_service.schedule_pending_actions()
+    logger.debug("Scheduled pending actions", pending=pending, round_trips=work.round_trips)
+
+
+@application.on_event("shutdown")
+async def stop_action_timer():
+    await get_action_timer().stop()
+
+
+@application.on_event("shutdown")
+async def stop_disconnected_player_sweeper():
+    await get_disconnected_player_sweeper().stop()
+
+
+@application.on_event("shutdown")
+async def stop_loop_lag_monitor():
+    await get_loop_lag_monitor().stop()
+
+
+@application.on_event("shutdown")
+async def stop_room_router():
+    room_router = get_room_router()
+    if room_router:
+        await room_router.stop()
+
+
+def admit_new_sessions(func: Callable[[str, Any], Coroutine[Any, Any, None]]):
+    # when overloaded, turn away new rooms and players so games already in progress stay responsive
+    @wraps(func)
+    async def inner(sid: str, data: Any):
+        if get_admission_controller().should_admit():
+            return await func(sid, data)
+
+        logger = get_logger()
+        logger.warning("Server overloaded, rejecting event", event_name=func.__name__.upper(), sid=sid)
+        metrics = get_metrics()
+        metrics.event_errors.inc(event_name=func.__name__.upper(), error="server_overloaded")
+        error = Error(code="server_overloaded", message="server is busy, please try again later")
+        await publish_event(ERROR, error, room=sid)
+
+    return inner
+
 
 @sio.event
 async def connect(sid, environ, auth):
@@ -58,40 +194,61 @@ async def connect(sid, environ, auth):
 
 @sio.event
 async def disconnect(sid):
-    logger = get_logger()
-    logger.debug("Player disconnected", sid=sid)
-    player_service = get_player_service()
-    try:
-        await player_service.update_disconnected_time(sid=sid, disconnected_at=datetime.now())
-    except PlayerNotFound:
-        logger.warning("Failed to find player", sid=sid, exc_info=True)
+    # the client only leaves its rooms after this handler, so the room it's playing in is still known here
+    room_code = next((room for room in sio.rooms(sid) if room != sid), None)
+    if room_code is None:
+        await player_disconnected(sid)
+    else:
+        await disconnect_player(sid, {"room_code": room_code})
+
+
+async def disconnect_player(sid: str, data: dict[str, str]):
+    room_code = data["room_code"]
+    room_router = get_room_router()
+    if room_router and await room_router.forward(room_code, DISCONNECT_PLAYER, sid, data):
         return
 
-    player = await player_service.get_by_sid(sid=sid)
-    logger.debug("Player found", player=player.dict(exclude={"avatar"}))
-    player_disconnected = PlayerDisconnected(nickname=player.nickname, avatar=player.avatar)
-    room_service = get_room_service()
-    lobby_service = get_lobby_service()
-    room = await room_service.get_room_by_player_id(player_id=player.player_id)
-    if room.host and room.host == player.player_id:
-        new_host = await lobby_service.update_host(room=room, old_host_id=player.player_id)
-        host_disconnected = HostDisconnected(new_host_nickname=new_host.nickname)
-        await sio.emit(HOST_DISCONNECTED, host_disconnected.dict(), room=room.room_id)
+    await get_room_executor().run(room_code, lambda: player_disconnected(sid))
 
-    game_state_service = get_game_state_service()
-    if room.state == RoomState.PLAYING:
-        paused_for = await game_state_service.pause_game(
-            room_id=room.room_id,
-            player_disconnected=player.player_id,
-        )
-        game_paused = GamePaused(paused_for=paused_for, message=f"Player {player.nickname} disconnected, pausing game.")
-        await sio.emit(GAME_PAUSED, game_paused.dict(), room=room.room_id)
 
-    await sio.emit(PLAYER_DISCONNECTED, player_disconnected.dict(), room=room.room_id)
+async def player_disconnected(sid: str):
+    with unit_of_work():
+        logger = get_logger()
+        logger.debug("Player disconnected", sid=sid)
+        player_service = get_player_service()
+        try:
+            await player_service.update_disconnected_time(sid=sid, disconnected_at=datetime.now())
+        except PlayerNotFound:
+            logger.warning("Failed to find player", sid=sid, exc_info=True)
+            return
+
+        player = await player_service.get_by_sid(sid=sid)
+        logger.debug("Player found", player=player.dict())
+        player_disconnected = PlayerDisconnected(nickname=player.nickname, avatar_id=player.avatar_id)
+        room_service = get_room_service()
+        lobby_service = get_lobby_service()
+        room = await room_service.get_summary_by_player_id(player_id=player.player_id)
+        if room.host and room.host == player.player_id:
+            new_host = await lobby_service.update_host(room=room, old_host_id=player.player_id)
+            host_disconnected = HostDisconnected(new_host_nickname=new_host.nickname)
+            await sio.emit(HOST_DISCONNECTED, host_disconnected.dict(), room=room.room_id)
+
+        game_state_service = get_game_state_service()
+        if room.state == RoomState.PLAYING:
+            paused_for = await game_state_service.pause_game(
+                room_id=room.room_id,
+                player_disconnected=player.player_id,
+            )
+            game_paused = GamePaused(
+                paused_for=paused_for, message=f"Player {player.nickname} disconnected, pausing game."
+            )
+            await sio.emit(GAME_PAUSED, game_paused.dict(), room=room.room_id)
+
+        await sio.emit(PLAYER_DISCONNECTED, player_disconnected.dict(), room=room.room_id)
 
 
-sio.on(CREATE_ROOM, create_room)
-sio.on(JOIN_ROOM, join_room)
+sio.on(CREATE_ROOM, admit_new_sessions(create_room))
+sio.on(JOIN_ROOM, admit_new_sessions(join_room))
 sio.on(REJOIN_ROOM, rejoin_room)
 sio.on(KICK_PLAYER, kick_player)
 sio.on(PERMANENTLY_DISCONNECT_PLAYER, permanently_disconnect_player)
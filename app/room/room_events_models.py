@@ -1,4 +1,4 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel
 
 from app.event_models import EventModel
 from app.game_state.game_state_models import UpdateQuestionRoundState
@@ -32,13 +32,7 @@ class HostDisconnected(EventModel):
 
 class PlayerDisconnected(EventModel):
     nickname: str
-    avatar: str | bytes
-
-    @validator("avatar", pre=True)
-    def base64_bytes_to_string(cls, value):
-        if isinstance(value, bytes):
-            return value.decode()
-        return value
+    avatar_id: str
 
     @property
     def event_name(self):
@@ -193,3 +187,4 @@ class VoteSubmittedFibbingIt(EventModel):
 class EventResponse(BaseModel):
     send_to: str
     response_data: EventModel
+    skip_sid: str | None = None
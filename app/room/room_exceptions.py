@@ -36,6 +36,13 @@ class RoomNotJoinableError(Exception):
         self.room_state = room_state
 
 
+class RoomFullError(Exception):
+    def __init__(self, msg: str, room_id: str, maximum_players: int) -> None:
+        self.msg = msg
+        self.room_id = room_id
+        self.maximum_players = maximum_players
+
+
 class RoomHasNoHostError(Exception):
     def __init__(self, msg: str, room_id: str) -> None:
         self.msg = msg
@@ -0,0 +1,240 @@
+from collections.abc import Callable, Iterable, Sequence
+from datetime import datetime
+from typing import Any
+
+from app.core.room_ownership import RingRange, ring_range_query
+from app.core.snapshot import write_snapshot
+from app.game_state.game_state_repository import AbstractGameStateRepository
+from app.player.player_exceptions import PlayerNotFound
+from app.player.player_models import Player, PlayerSummary
+from app.room.room_exceptions import (
+    NicknameExistsException,
+    RoomExistsException,
+    RoomFullError,
+    RoomNotFound,
+    RoomNotJoinableError,
+)
+from app.room.room_models import Room, RoomContext, RoomState, RoomSummary
+from app.room.room_repository import RoomRepository
+
+
+class InMemoryRoomRepository(RoomRepository):
+    def __init__(self, game_state_repository: AbstractGameStateRepository) -> None:
+        super().__init__()
+        self._game_state_repository = game_state_repository
+        self._rooms: dict[str, Room] = {}
+        self._room_ids_by_player_id: dict[str, str] = {}
+        self._room_ids_by_sid: dict[str, str] = {}
+        self._player_ids_by_nickname: dict[tuple[str, str], str] = {}
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+
+    async def add(self, room: Room):
+        if room.room_id in self._rooms:
+            raise RoomExistsException(f"room {room.room_id=} already exists")
+        self._store(room)
+
+    async def add_player(self, room: Room, player: Player):
+        room.players.append(player)
+        self._modify(room.room_id, lambda stored_room: stored_room.players.append(player.copy()))
+
+    async def add_player_if_joinable(self, room_id: str, player: Player, maximum_players: int | None = None) -> Room:
+        room = self._get_stored(room_id)
+        if not room.state.is_room_joinable:
+            raise RoomNotJoinableError(msg="room is not joinable", room_id=room_id, room_state=room.state)
+        elif (room_id, player.nickname) in self._player_ids_by_nickname:
+            raise NicknameExistsException(msg="nickname already exists", nickname=player.nickname)
+        elif maximum_players and len(room.players) >= maximum_players:
+            raise RoomFullError(msg="room is full", room_id=room_id, maximum_players=maximum_players)
+
+        joined_room = room.copy(deep=True)
+        joined_room.players.append(player)
+        joined_room.host = joined_room.host or player.player_id
+        joined_room.updated_at = datetime.now()
+        self._store(joined_room)
+        return joined_room.copy(deep=True)
+
+    async def get(self, id_: str) -> Room:
+        return self._get_stored(id_).copy(deep=True)
+
+    async def get_room_by_player_id(self, player_id: str) -> Room:
+        room_id = self._room_ids_by_player_id.get(player_id)
+        if room_id is None:
+            raise RoomNotFound(msg="room not found using player id", id_=player_id)
+        return await self.get(id_=room_id)
+
+    async def get_summary(self, id_: str) -> RoomSummary:
+        return RoomSummary(**self._get_stored(id_).dict())
+
+    async def get_summary_by_player_id(self, player_id: str) -> RoomSummary:
+        room_id = self._room_ids_by_player_id.get(player_id)
+        if room_id is None:
+            raise RoomNotFound(msg="room not found using player id", id_=player_id)
+        return await self.get_summary(id_=room_id)
+
+    async def get_context(self, id_: str) -> RoomContext:
+        room = await self.get_summary(id_=id_)
+        game_state = await self._game_state_repository.get(id_=id_)
+        return RoomContext(room=room, game_state=game_state)
+
+    async def get_player(self, player_id: str) -> Player:
+        return self._find_player(self._room_ids_by_player_id.get(player_id), player_id)
+
+    async def get_all_players(self, room_id: str) -> list[Player]:
+        room = await self.get(id_=room_id)
+        return room.players
+
+    async def get_player_by_sid(self, sid: str) -> Player:
+        room_id = self._room_ids_by_sid.get(sid)
+        room = self._rooms.get(room_id or "")
+        for player in room.players if room else []:
+            if player.latest_sid == sid:
+                return player.copy()
+        raise PlayerNotFound("player not found")
+
+    async def get_player_by_nickname(self, room_id: str, nickname: str) -> Player:
+        return self._find_player(room_id, self._player_ids_by_nickname.get((room_id, nickname)))
+
+    async def remove_player(self, room: Room | RoomSummary, nickname: str) -> Player:
+        player = await self.get_player_by_nickname(room_id=room.room_id, nickname=nickname)
+        self._modify(room.room_id, lambda stored_room: self._remove_players(stored_room, [player.player_id]))
+        return player
+
+    async def remove_disconnected_players(
+        self, disconnected_before: datetime, limit: int
+    ) -> dict[str, list[PlayerSummary]]:
+        removed_players: dict[str, list[PlayerSummary]] = {}
+        for room in list(self._rooms.values()):
+            if len(removed_players) == limit:
+                break
+
+            disconnected_players = [
+                player
+                for player in room.players
+                if player.disconnected_at and player.disconnected_at <= disconnected_before
+            ]
+            if disconnected_players:
+                player_ids = [player.player_id for player in disconnected_players]
+                self._modify(room.room_id, lambda stored_room: self._remove_players(stored_room, player_ids))
+                removed_players[room.room_id] = [PlayerSummary(**player.dict()) for player in disconnected_players]
+        return removed_players
+
+    async def remove(self, id_: str):
+        room = self._rooms.pop(id_, None)
+        if room:
+            self._unindex(room)
+        self._dirty.discard(id_)
+        self._removed.add(id_)
+
+    async def update_host(self, room: Room | RoomSummary, player_id: str):
+        room.host = player_id
+        self._modify(room.room_id, lambda stored_room: setattr(stored_room, "host", player_id))
+
+    async def update_game_state(self, room: Room | RoomSummary, new_room_state: RoomState):
+        room.state = new_room_state
+        self._modify(room.room_id, lambda stored_room: setattr(stored_room, "state", new_room_state))
+
+    async def update_player_disconnected_at(self, sid: str, disconnected_at: datetime | None = None):
+        room_id = self._room_ids_by_sid.get(sid)
+        if room_id:
+            self._modify(
+                room_id,
+                lambda room: self._set_player_field(room, "latest_sid", sid, "disconnected_at", disconnected_at),
+            )
+
+    async def update_sid(self, player_id: str, sid: str):
+        room_id = self._room_ids_by_player_id.get(player_id)
+        if room_id:
+            self._modify(room_id, lambda room: self._set_player_field(room, "player_id", player_id, "latest_sid", sid))
+
+    async def restore(self):
+        await self.load(owns=lambda _: True)
+
+    async def load(
+        self,
+        owns: Callable[[str], bool],
+        room_ids: Iterable[str] | None = None,
+        ranges: Sequence[RingRange] | None = None,
+    ):
+        query: dict[str, Any] = {}
+        if room_ids is not None:
+            query = {"room_id": {"$in": list(room_ids)}}
+        elif ranges is not None:
+            if not ranges:
+                return
+            query = ring_range_query(ranges)
+
+        # rooms changed here since they were loaded are newer than the database, so they are kept
+        async for room in Room.find(query):
+            if owns(room.room_id) and room.room_id not in self._dirty:
+                self._store(room, dirty=False)
+
+    def evict(self, keep: Callable[[str], bool]) -> set[str]:
+        # only rooms already written to the database are evicted, so no changes are lost
+        evicted = {room_id for room_id in self._rooms if not keep(room_id) and room_id not in self._dirty}
+        for room_id in evicted:
+            self._unindex(self._rooms.pop(room_id))
+        return evicted
+
+    async def snapshot(self):
+        dirty, self._dirty = self._dirty, set()
+        removed, self._removed = self._removed, set()
+        try:
+            rooms = [self._rooms[room_id] for room_id in dirty if room_id in self._rooms]
+            await write_snapshot(Room, key="room_id", documents=rooms, removed=removed)
+        except Exception:
+            self._dirty |= dirty
+            self._removed |= removed - self._rooms.keys()
+            raise
+
+    def _get_stored(self, room_id: str) -> Room:
+        room = self._rooms.get(room_id)
+        if room is None:
+            raise RoomNotFound(msg="room not found using id", id_=room_id)
+        return room
+
+    def _find_player(self, room_id: str | None, player_id: str | None) -> Player:
+        room = self._rooms.get(room_id or "")
+        for player in room.players if room else []:
+            if player.player_id == player_id:
+                return player.copy()
+        raise PlayerNotFound("player not found")
+
+    def _modify(self, room_id: str, update: Callable[[Room], None]):
+        # rooms are stored as private copies, so readers never see a half applied update
+        room = self._get_stored(room_id).copy(deep=True)
+        update(room)
+        room.updated_at = datetime.now()
+        self._store(room, copy=False)
+
+    def _store(self, room: Room, copy: bool = True, dirty: bool = True):
+        previous_room = self._rooms.get(room.room_id)
+        if previous_room:
+            self._unindex(previous_room)
+
+        stored_room = room.copy(deep=True) if copy else room
+        self._rooms[room.room_id] = stored_room
+        for player in stored_room.players:
+            self._room_ids_by_player_id[player.player_id] = room.room_id
+            self._room_ids_by_sid[player.latest_sid] = room.room_id
+            self._player_ids_by_nickname[(room.room_id, player.nickname)] = player.player_id
+        if dirty:
+            self._dirty.add(room.room_id)
+        self._removed.discard(room.room_id)
+
+    def _unindex(self, room: Room):
+        for player in room.players:
+            self._room_ids_by_player_id.pop(player.player_id, None)
+            self._room_ids_by_sid.pop(player.latest_sid, None)
+            self._player_ids_by_nickname.pop((room.room_id, player.nickname), None)
+
+    @staticmethod
+    def _remove_players(room: Room, player_ids: list[str]):
+        room.players = [player for player in room.players if player.player_id not in player_ids]
+
+    @staticmethod
+    def _set_player_field(room: Room, match_field: str, match_value: str, field: str, value: object):
+        for player in room.players:
+            if getattr(player, match_field) == match_value:
+                setattr(player, field, value)
+                return
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
 from beanie import Document, Indexed
+from pydantic import BaseModel
+from pymongo import ASCENDING, IndexModel
 
-from app.player.player_models import Player
+from app.game_state.game_state_models import GameState
+from app.player.player_models import Player, PlayerSummary
 
 
 class RoomState(Enum):
@@ -39,3 +43,28 @@ class Room(Document):
 
     class Collection:
         name = "room"
+        indexes = [
+            IndexModel([("players.player_id", ASCENDING)]),
+            IndexModel([("players.latest_sid", ASCENDING)]),
+            IndexModel([("players.disconnected_at", ASCENDING)]),
+            IndexModel([("room_id", ASCENDING), ("players.nickname", ASCENDING)]),
+            # only set by snapshots of in-memory rooms, see write_snapshot
+            IndexModel([("ring_position", ASCENDING)], sparse=True),
+        ]
+
+
+class RoomSummary(BaseModel):
+    room_id: str
+    game_name: str | None = None
+    host: str | None = None
+    state: RoomState
+    created_at: datetime
+    updated_at: datetime
+    players: list[PlayerSummary] = []
+
+
+# a dataclass so the room and game state aren't copied, services update them in place
+@dataclass
+class RoomContext:
+    room: RoomSummary
+    game_state: GameState
@@ -1,57 +1,231 @@
 import abc
+import asyncio
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from typing import Any, NoReturn
 
 from omnibus.database.repository import AbstractRepository
+from pydantic import parse_obj_as
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 
+from app.core.unit_of_work import get_unit_of_work, record_round_trip
+from app.game_state.game_state_exceptions import GameStateNotFound
+from app.game_state.game_state_models import GameState
+from app.game_state.game_state_repository import AbstractGameStateRepository
 from app.player.player_exceptions import PlayerNotFound
-from app.player.player_models import Player
-from app.room.room_exceptions import RoomExistsException, RoomNotFound
-from app.room.room_models import Room, RoomState
+from app.player.player_models import Player, PlayerSummary
+from app.room.room_cache import RoomCache
+from app.room.room_exceptions import (
+    NicknameExistsException,
+    RoomExistsException,
+    RoomFullError,
+    RoomNotFound,
+    RoomNotJoinableError,
+)
+from app.room.room_models import Room, RoomContext, RoomState, RoomSummary
 
 
 class AbstractRoomRepository(AbstractRepository[Room]):
     @abc.abstractmethod
-    async def update_host(self, room: Room, player_id: str):
+    async def update_host(self, room: Room | RoomSummary, player_id: str):
         raise NotImplementedError
 
     @abc.abstractmethod
-    async def update_game_state(self, room: Room, new_room_state: RoomState):
+    async def update_game_state(self, room: Room | RoomSummary, new_room_state: RoomState):
         raise NotImplementedError
 
 
 class RoomRepository(AbstractRoomRepository):
+    def __init__(
+        self,
+        room_cache: RoomCache | None = None,
+        game_state_repository: AbstractGameStateRepository | None = None,
+    ) -> None:
+        self.room_cache = room_cache
+        # set when game states aren't stored in mongo, so they can't be joined onto the room
+        self.game_state_repository = game_state_repository
+
     async def add(self, room: Room):
         try:
+            record_round_trip()
             await Room.insert(room)
         except DuplicateKeyError as e:
             raise RoomExistsException(f"room {room.room_id=} already exists") from e
+        get_unit_of_work().add(room.room_id, room)
 
     async def add_player(self, room: Room, player: Player):
         room.players.append(player)
-        await room.save()
+        await self._update(room_id=room.room_id, update={"$push": {"players": player}})
+
+    async def add_player_if_joinable(self, room_id: str, player: Player, maximum_players: int | None = None) -> Room:
+        joinable_filter: dict[str, Any] = {
+            "room_id": room_id,
+            "state": RoomState.CREATED.value,
+            "players.nickname": {"$ne": player.nickname},
+        }
+        if maximum_players:
+            joinable_filter[f"players.{maximum_players - 1}"] = {"$exists": False}
+
+        record_round_trip()
+        room = await Room.get_motor_collection().find_one_and_update(
+            joinable_filter,
+            [
+                {
+                    "$set": {
+                        "players": {"$concatArrays": ["$players", [{"$literal": player.dict()}]]},
+                        "host": {"$ifNull": ["$host", player.player_id]},
+                        "updated_at": datetime.now(),
+                    }
+                }
+            ],
+            return_document=ReturnDocument.AFTER,
+        )
+        if room is None:
+            await self._raise_not_joinable(room_id=room_id, nickname=player.nickname, maximum_players=maximum_players)
+
+        await self._invalidate(room_id)
+        joined_room = Room.parse_obj(room)
+        unit_of_work = get_unit_of_work()
+        unit_of_work.evict(room_id)
+        unit_of_work.add(room_id, joined_room)
+        return joined_room
+
+    async def _raise_not_joinable(self, room_id: str, nickname: str, maximum_players: int | None) -> NoReturn:
+        get_unit_of_work().evict(room_id)
+        room = await self.get_summary(id_=room_id)
+        if not room.state.is_room_joinable:
+            raise RoomNotJoinableError(msg="room is not joinable", room_id=room_id, room_state=room.state)
+        elif any(player.nickname == nickname for player in room.players):
+            raise NicknameExistsException(msg="nickname already exists", nickname=nickname)
+        elif maximum_players and len(room.players) >= maximum_players:
+            raise RoomFullError(msg="room is full", room_id=room_id, maximum_players=maximum_players)
+        raise RoomNotJoinableError(msg="room changed while joining", room_id=room_id, room_state=room.state)
 
     async def get(self, id_: str) -> Room:
-        room = await Room.find_one(Room.room_id == id_)
+        unit_of_work = get_unit_of_work()
+        room = unit_of_work.get(Room, id_)
+        if room is None and self.room_cache:
+            room = self.room_cache.get(id_)
+        if room is None:
+            read_at = self.room_cache.generation if self.room_cache else 0
+            record_round_trip()
+            room = await Room.find_one(Room.room_id == id_)
+            if room and self.room_cache:
+                self.room_cache.set(room, read_at=read_at)
         if room is None:
             raise RoomNotFound(msg="room not found using id", id_=id_)
+
+        unit_of_work.add(id_, room)
         return room
 
     async def get_room_by_player_id(self, player_id: str) -> Room:
-        room = await Room.find_one({"players.player_id": player_id})
+        unit_of_work = get_unit_of_work()
+        room = unit_of_work.find(Room, lambda room: self._has_player(room, player_id))
+        if room is None and self.room_cache:
+            room = self.room_cache.get_by_player_id(player_id)
+        if room is None:
+            read_at = self.room_cache.generation if self.room_cache else 0
+            record_round_trip()
+            room = await Room.find_one({"players.player_id": player_id})
+            if room and self.room_cache:
+                self.room_cache.set(room, read_at=read_at)
         if room is None:
             raise RoomNotFound(msg="room not found using player id", id_=player_id)
+
+        unit_of_work.add(room.room_id, room)
+        return room
+
+    async def get_summary(self, id_: str) -> RoomSummary:
+        if self.room_cache:
+            full_room = await self.get(id_=id_)
+            return RoomSummary(**full_room.dict())
+
+        unit_of_work = get_unit_of_work()
+        room = self._get_cached_summary(lambda room: room.room_id == id_)
+        if room is None:
+            record_round_trip()
+            room = await Room.find_one(Room.room_id == id_, projection_model=RoomSummary)
+        if room is None:
+            raise RoomNotFound(msg="room not found using id", id_=id_)
+
+        unit_of_work.add(id_, room)
+        return room
+
+    async def get_summary_by_player_id(self, player_id: str) -> RoomSummary:
+        if self.room_cache:
+            full_room = await self.get_room_by_player_id(player_id=player_id)
+            return RoomSummary(**full_room.dict())
+
+        unit_of_work = get_unit_of_work()
+        room = self._get_cached_summary(lambda room: self._has_player(room, player_id))
+        if room is None:
+            record_round_trip()
+            room = await Room.find_one({"players.player_id": player_id}, projection_model=RoomSummary)
+        if room is None:
+            raise RoomNotFound(msg="room not found using player id", id_=player_id)
+
+        unit_of_work.add(room.room_id, room)
         return room
 
+    async def get_context(self, id_: str) -> RoomContext:
+        unit_of_work = get_unit_of_work()
+        room = self._get_cached_summary(lambda room: room.room_id == id_)
+        game_state = unit_of_work.get(GameState, id_)
+        if room is not None and game_state is not None:
+            return RoomContext(room=room, game_state=game_state)
+        elif self.game_state_repository:
+            summary, stored_game_state = await asyncio.gather(
+                self.get_summary(id_=id_), self.game_state_repository.get(id_=id_)
+            )
+            return RoomContext(room=summary, game_state=stored_game_state)
+
+        record_round_trip()
+        rooms = await (
+            Room.get_motor_collection()
+            .aggregate(
+                [
+                    {"$match": {"room_id": id_}},
+                    {"$limit": 1},
+                    {
+                        "$lookup": {
+                            "from": GameState.get_motor_collection().name,
+                            "localField": "room_id",
+                            "foreignField": "room_id",
+                            "as": "game_state",
+                        }
+                    },
+                ]
+            )
+            .to_list(length=1)
+        )
+        if not rooms:
+            raise RoomNotFound(msg="room not found using id", id_=id_)
+        elif not rooms[0]["game_state"]:
+            raise GameStateNotFound(msg="game state not found", room_identifier=id_)
+
+        room = RoomSummary.parse_obj(rooms[0])
+        game_state = GameState.parse_obj(rooms[0]["game_state"][0])
+        unit_of_work.add(id_, room)
+        unit_of_work.add(id_, game_state)
+        return RoomContext(room=room, game_state=game_state)
+
+    @staticmethod
+    def _get_cached_summary(predicate: Callable[[Room | RoomSummary], bool]) -> RoomSummary | None:
+        unit_of_work = get_unit_of_work()
+        room_summary = unit_of_work.find(RoomSummary, predicate)
+        if room_summary:
+            return room_summary
+
+        room = unit_of_work.find(Room, predicate)
+        return RoomSummary(**room.dict()) if room else None
+
+    @staticmethod
+    def _has_player(room: Room | RoomSummary, player_id: str) -> bool:
+        return any(player.player_id == player_id for player in room.players)
+
     async def get_player(self, player_id: str) -> Player:
-        if aggregate := await Room.aggregate(
-            [{"$unwind": "$players"}, {"$match": {"players.player_id": player_id}}]
-        ).to_list():
-            player = aggregate[0]["players"]
-            return Player(**player)
-        else:
-            raise PlayerNotFound("player not found")
+        return await self._get_player_by_field(field_name="player_id", field_value=player_id, extra_matches={})
 
     async def get_all_players(self, room_id: str) -> list[Player]:
         room = await self.get(id_=room_id)
@@ -66,34 +240,109 @@ class RoomRepository(AbstractRoomRepository):
         )
 
     async def _get_player_by_field(self, field_name: str, field_value: Any, extra_matches: dict[str, str]) -> Player:
-        if aggregate := await Room.aggregate(
-            [{"$unwind": "$players"}, {"$match": {f"players.{field_name}": field_value, **extra_matches}}]
-        ).to_list():
-            player = aggregate[0]["players"]
-            return Player(**player)
-        else:
+        for room_ in get_unit_of_work().identity_map.values():
+            if not isinstance(room_, Room) or any(getattr(room_, key) != value for key, value in extra_matches.items()):
+                continue
+
+            for player in room_.players:
+                if getattr(player, field_name) == field_value:
+                    return player
+
+        record_round_trip()
+        room = await Room.get_motor_collection().find_one(
+            {f"players.{field_name}": field_value, **extra_matches},
+            projection={"_id": 0, "players": {"$elemMatch": {field_name: field_value}}},
+        )
+        if room is None or not room.get("players"):
             raise PlayerNotFound("player not found")
 
-    async def remove_player(self, room: Room, nickname: str) -> Player:
+        return Player(**room["players"][0])
+
+    async def remove_player(self, room: Room | RoomSummary, nickname: str) -> Player:
         player = await self.get_player_by_nickname(room_id=room.room_id, nickname=nickname)
-        await room.update({"$pull": {"players": {"nickname": nickname}}})
+        await self._update(room_id=room.room_id, update={"$pull": {"players": {"nickname": nickname}}})
         return player
 
+    async def remove_disconnected_players(
+        self, disconnected_before: datetime, limit: int
+    ) -> dict[str, list[PlayerSummary]]:
+        get_unit_of_work().evict()
+        record_round_trip()
+        rooms = (
+            await Room.get_motor_collection()
+            .find({"players.disconnected_at": {"$lte": disconnected_before}}, projection={"_id": 0, "room_id": 1})
+            .limit(limit)
+            .to_list(length=None)
+        )
+
+        removed_players: dict[str, list[PlayerSummary]] = {}
+        for room in rooms:
+            players = await self._remove_disconnected_players(room["room_id"], disconnected_before=disconnected_before)
+            if players:
+                removed_players[room["room_id"]] = players
+        return removed_players
+
+    async def _remove_disconnected_players(self, room_id: str, disconnected_before: datetime) -> list[PlayerSummary]:
+        # a player may rejoin after the room was found, so only report the players this update actually pulled
+        record_round_trip()
+        room = await Room.get_motor_collection().find_one_and_update(
+            {"room_id": room_id, "players.disconnected_at": {"$lte": disconnected_before}},
+            {
+                "$pull": {"players": {"disconnected_at": {"$lte": disconnected_before}}},
+                "$set": {"updated_at": datetime.now()},
+            },
+            projection={"_id": 0, "players": 1},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if room is None:
+            return []
+
+        await self._invalidate(room_id)
+        removed_players = [
+            player
+            for player in room["players"]
+            if player.get("disconnected_at") and player["disconnected_at"] <= disconnected_before
+        ]
+        return parse_obj_as(list[PlayerSummary], removed_players)
+
     async def remove(self, id_: str):
-        return await super().remove(id_)
+        get_unit_of_work().evict(id_)
+        record_round_trip()
+        removed = await super().remove(id_)
+        await self._invalidate(id_)
+        return removed
 
-    async def update_host(self, room: Room, player_id: str):
+    async def update_host(self, room: Room | RoomSummary, player_id: str):
         room.host = player_id
-        await room.save()
+        await self._update(room_id=room.room_id, update={"$set": {"host": player_id}})
 
-    async def update_game_state(self, room: Room, new_room_state: RoomState):
+    async def update_game_state(self, room: Room | RoomSummary, new_room_state: RoomState):
         room.state = new_room_state
-        await room.save()
+        await self._update(room_id=room.room_id, update={"$set": {"state": new_room_state}})
 
-    async def update_player_disconnected_at(self, sid: str, disconnected_at: datetime | None = None):
-        await Room.find_one({"players.latest_sid": sid}).update(
-            {"$set": {"players.$.disconnected_at": disconnected_at}}
+    async def _update(self, room_id: str, update: dict[str, Any]):
+        now = datetime.now()
+        set_ = {**update.get("$set", {}), "updated_at": now}
+        get_unit_of_work().evict(room_id)
+        record_round_trip()
+        await Room.find_one(Room.room_id == room_id).update({**update, "$set": set_})
+        await self._invalidate(room_id)
+
+    async def _update_player(self, player_filter: dict[str, Any], update: dict[str, Any]):
+        get_unit_of_work().evict()
+        record_round_trip()
+        room = await Room.get_motor_collection().find_one_and_update(
+            player_filter, update, projection={"_id": 0, "room_id": 1}
         )
+        if room:
+            await self._invalidate(room["room_id"])
+
+    async def _invalidate(self, room_id: str):
+        if self.room_cache:
+            await self.room_cache.invalidate(room_id)
+
+    async def update_player_disconnected_at(self, sid: str, disconnected_at: datetime | None = None):
+        await self._update_player({"players.latest_sid": sid}, {"$set": {"players.$.disconnected_at": disconnected_at}})
 
     async def update_sid(self, player_id: str, sid: str):
-        await Room.find_one({"players.player_id": player_id}).update({"$set": {"players.$.latest_sid": sid}})
+        await self._update_player({"players.player_id": player_id}, {"$set": {"players.$.latest_sid": sid}})
@@ -1,5 +1,119 @@
+import contextlib
+import pickle
+from contextvars import ContextVar
+from typing import Any, Literal
+
 import socketio
 from fastapi import FastAPI
+from socketio import packet
+
+JSONEncoder = Literal["json", "orjson"]
+PacketSerializer = Literal["default", "msgpack"]
+
+
+class OrjsonModule:
+    # socket.io calls `json.dumps(data, separators=...)` and expects a `str` back
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any, **_: Any) -> str:
+        return self._orjson.dumps(obj).decode()
+
+    def loads(self, data: str | bytes, **_: Any) -> Any:
+        return self._orjson.loads(data)
+
+
+def get_json_module(json_encoder: JSONEncoder) -> OrjsonModule | None:
+    if json_encoder == "orjson":
+        return OrjsonModule()
+    return None
+
+
+# encodings of the packet currently being sent to every participant of a room, only set while that emit runs
+_room_emit_encodings: ContextVar[dict[tuple[Any, ...], Any] | None] = ContextVar("room_emit_encodings", default=None)
+
+
+def get_packet_class(serializer: PacketSerializer) -> type[packet.Packet]:
+    if serializer == "msgpack":
+        from socketio.msgpack_packet import MsgPackPacket
+
+        return encode_once_per_room_emit(MsgPackPacket)
+    return encode_once_per_room_emit(packet.Packet)
+
+
+@contextlib.contextmanager
+def room_emit():
+    token = _room_emit_encodings.set({})
+    try:
+        yield
+    finally:
+        _room_emit_encodings.reset(token)
+
+
+def encode_once_per_room_emit(packet_class: type[packet.Packet]) -> type[packet.Packet]:
+    # a room emit encodes the same event and payload once per participant, reuse the first encoding instead
+    class RoomEmitPacket(packet_class):  # type: ignore
+        def encode(self):
+            encodings = _room_emit_encodings.get()
+            if encodings is None or self.packet_type not in [packet.EVENT, packet.BINARY_EVENT]:
+                return super().encode()
+
+            # only the ack id can differ between the participants of one emit
+            key = (self.packet_type, self.namespace, self.id)
+            if key not in encodings:
+                encodings[key] = super().encode()
+            return encodings[key]
+
+    return RoomEmitPacket
+
+
+class RoomEmitRedisManager(socketio.AsyncRedisManager):
+    async def _handle_emit(self, message):
+        # emits published on redis are sent to the local participants here, each emit gets its own encodings
+        with room_emit():
+            await super()._handle_emit(message)
+
+
+class RoomAffinityRedisManager(RoomEmitRedisManager):
+    # the node handling an event for a room may not be the one the client is connected to, so room changes for
+    # remote clients are published on the same channel as emits, which keeps them in order with later emits
+    async def enter_room_on_any_node(self, sid: str, namespace: str, room: str):
+        if self.is_connected(sid, namespace):
+            self.enter_room(sid, namespace, room)
+        else:
+            await self._publish({"method": "enter_room", "sid": sid, "namespace": namespace, "room": room})
+
+    async def leave_room_on_any_node(self, sid: str, namespace: str, room: str):
+        if self.is_connected(sid, namespace):
+            self.leave_room(sid, namespace, room)
+        else:
+            await self._publish({"method": "leave_room", "sid": sid, "namespace": namespace, "room": room})
+
+    async def _listen(self):
+        async for message in super()._listen():
+            try:
+                data = pickle.loads(message)
+            except Exception:
+                data = None
+
+            if isinstance(data, dict) and data.get("method") in ("enter_room", "leave_room"):
+                self._handle_room_change(data)
+            elif isinstance(data, dict):
+                # the pubsub manager accepts messages already decoded, so they aren't unpickled twice
+                yield data
+            else:
+                yield message
+
+    def _handle_room_change(self, data: dict[str, Any]):
+        sid, namespace, room = data["sid"], data["namespace"], data["room"]
+        if not self.is_connected(sid, namespace):
+            return
+        elif data["method"] == "enter_room":
+            self.enter_room(sid, namespace, room)
+        else:
+            self.leave_room(sid, namespace, room)
 
 
 class SocketManager:
@@ -11,11 +125,19 @@ class SocketManager:
         socketio_path: str = "socket.io",
         cors_allowed_origins: str | list[str] = "*",
         async_mode: str = "asgi",
+        json_encoder: JSONEncoder = "json",
+        serializer: PacketSerializer = "default",
+        room_affinity: bool = False,
     ) -> None:
         # TODO: Change Cors policy based on fastapi cors Middleware
-        mgr = socketio.AsyncRedisManager(redis_uri)
+        manager_class = RoomAffinityRedisManager if room_affinity else RoomEmitRedisManager
+        mgr = manager_class(redis_uri)
         self._sio = socketio.AsyncServer(
-            client_manager=mgr, async_mode=async_mode, cors_allowed_origins=cors_allowed_origins
+            client_manager=mgr,
+            async_mode=async_mode,
+            cors_allowed_origins=cors_allowed_origins,
+            serializer=get_packet_class(serializer),
+            json=get_json_module(json_encoder),
         )
         self._app = socketio.ASGIApp(socketio_server=self._sio, socketio_path=socketio_path)
 
@@ -92,3 +214,26 @@ class SocketManager:
     @property
     def leave_room(self):
         return self._sio.leave_room
+
+    @property
+    def rooms(self):
+        return self._sio.rooms
+
+    async def enter_room_on_any_node(self, sid: str, room: str, namespace: str = "/"):
+        manager = self._sio.manager
+        if isinstance(manager, RoomAffinityRedisManager):
+            await manager.enter_room_on_any_node(sid, namespace, room)
+        else:
+            self._sio.enter_room(sid, room, namespace=namespace)
+
+    async def leave_room_on_any_node(self, sid: str, room: str, namespace: str = "/"):
+        manager = self._sio.manager
+        if isinstance(manager, RoomAffinityRedisManager):
+            await manager.leave_room_on_any_node(sid, namespace, room)
+        else:
+            self._sio.leave_room(sid, room, namespace=namespace)
+
+    async def trigger_event(self, event: str, sid: str, data: Any, namespace: str = "/"):
+        handler = self._sio.handlers.get(namespace, {}).get(event)
+        if handler:
+            await handler(sid, data)
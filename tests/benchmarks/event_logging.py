@@ -0,0 +1,67 @@
+"""Compare the old eager response logging with `log_response` for a `RoomJoined` event with 10 players.
+
+The logger is configured at INFO, like production, so debug response logs are dropped. The eager version still builds
+the exclude dict and dumps the event every time, the lazy version should cost close to nothing:
+
+    python -m tests.benchmarks.event_logging
+"""
+import argparse
+import hashlib
+import logging
+import statistics
+import time
+from collections.abc import Callable
+
+import structlog
+
+from app.core.config import get_settings
+from app.core.event_log import log_response
+from app.event_models import EventModel
+from app.room.lobby.lobby_events_models import Player, RoomJoined
+
+PLAYERS_IN_ROOM = 10
+
+
+def _make_room_joined() -> RoomJoined:
+    players = [
+        Player(nickname=f"player-{index}", avatar_id=hashlib.sha256(str(index).encode()).hexdigest())
+        for index in range(PLAYERS_IN_ROOM)
+    ]
+    return RoomJoined(host_player_nickname=players[0].nickname, players=players)
+
+
+def _log_response_eagerly(response: EventModel):
+    exclude = {}
+    settings = get_settings()
+    for attribute, ignore_fields in settings.LOG_RESPONSE_EXCLUDE_ATTR["list"].items():
+        if hasattr(response, attribute):
+            list_ = len(getattr(response, attribute))
+            exclude_index = {index: ignore_fields for index in range(list_)}
+            exclude[attribute] = exclude_index
+
+    logger = structlog.get_logger()
+    logger.debug(response.event_name, data=response.dict(exclude=exclude))
+
+
+def _time(name: str, log: Callable[[EventModel], None], room_joined: RoomJoined, iterations: int):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        log(room_joined)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+
+    print(f"{name:<10} median={statistics.median(timings):>9.3f}us max={max(timings):>9.3f}us")
+
+
+def main(iterations: int):
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+    room_joined = _make_room_joined()
+    _time("eager", _log_response_eagerly, room_joined, iterations)
+    _time("lazy", log_response, room_joined, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,70 @@
+"""Compare socket.io packet encoders for a `RoomJoined` event with 10 players.
+
+Each iteration converts the event to a dict once and encodes it for every player in the room, like a room emit.
+"once per emit" packets encode the payload for the first participant and reuse it for the rest.
+orjson and msgpack are skipped if not installed:
+
+    python -m tests.benchmarks.socket_serializers
+"""
+import argparse
+import hashlib
+import statistics
+import time
+from typing import Any
+
+from socketio import packet
+
+from app.room.lobby.lobby_events_models import Player, RoomJoined
+from app.socket_manager import OrjsonModule, get_packet_class, room_emit
+
+PLAYERS_IN_ROOM = 10
+
+
+def _make_room_joined() -> RoomJoined:
+    players = [
+        Player(nickname=f"player-{index}", avatar_id=hashlib.sha256(str(index).encode()).hexdigest())
+        for index in range(PLAYERS_IN_ROOM)
+    ]
+    return RoomJoined(host_player_nickname=players[0].nickname, players=players)
+
+
+def _time(name: str, packet_class: type[packet.Packet], room_joined: RoomJoined, iterations: int):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        payload = room_joined.dict()
+        with room_emit():
+            for _ in range(PLAYERS_IN_ROOM):
+                packet_class(packet.EVENT, data=[room_joined.event_name, payload]).encode()
+        timings.append((time.perf_counter() - start) * 1_000)
+
+    print(f"{name:<24} median={statistics.median(timings):>9.3f}ms max={max(timings):>9.3f}ms")
+
+
+def _get_encoders() -> dict[str, type[packet.Packet]]:
+    uncached_json: Any = type("JSONPacket", (packet.Packet,), {})
+    encoders = {"json": uncached_json, "json (once per emit)": get_packet_class("default")}
+    try:
+        orjson_packet: Any = type("OrjsonPacket", (get_packet_class("default"),), {"json": OrjsonModule()})
+        encoders["orjson (once per emit)"] = orjson_packet
+    except ImportError:
+        print("orjson not installed, skipping")
+
+    try:
+        encoders["msgpack (once per emit)"] = get_packet_class("msgpack")
+    except ImportError:
+        print("msgpack not installed, skipping")
+    return encoders
+
+
+def main(iterations: int):
+    room_joined = _make_room_joined()
+    for name, packet_class in _get_encoders().items():
+        _time(name, packet_class, room_joined, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -24,33 +24,33 @@ rooms: list[Room] = [
             Player(
                 player_id="52dcb730-93ad-4364-917a-8760ee50d0f5",
                 nickname="Majiy",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAAAAEAAAAAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="094b7ee3ab31e4469908837b2d0ef4781c57908a9c0e92acc94932fcfb1ab519",
                 latest_sid="123456",
             ),
             Player(
                 player_id="66dcb730-93de-4364-917a-8760ee50d0ff",
                 nickname="CanIHaseeburger",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAAAAEAACAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="0ffac5f71d4b488cf71e0de070d1db0ce93963cd05d99bf5739ee05fbb9e6428",
                 latest_sid="654321",
             ),
             Player(
                 player_id="778cb730-93de-4364-917a-8760ee50d0ff",
                 nickname="AnotherPlayer",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAAAAEABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="06849a40a03f418919bbdda563d4f78c4ed7e8be96af91dcb4ef706660e5ecad",
                 latest_sid="ABCDEFG",
                 disconnected_at=datetime.now() - timedelta(minutes=10),
             ),
             Player(
                 player_id="8760ee50d0ff-93de-4364-917a-778cb730",
                 nickname="PlayerV2",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="b7e6b6e12c04d9a2e70726bdb79b605b03d39b1747baf7100bfe81de00895685",
                 latest_sid="HHHJJJKKKK",
                 disconnected_at=datetime.now() - timedelta(minutes=6),
             ),
             Player(
                 player_id="99acb730-93de-4364-917a-8760ee50d0gg",
                 nickname="DisconnectedPlayer",
-                avatar=b"iVBORw0KGgoAAAANSUhEAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="887ad8c81881b078de22d321d567152bcdecad7123bfc15570b173be1bb5c345",
                 latest_sid="GfAVCD",
                 disconnected_at=datetime.now() - timedelta(minutes=3),
             ),
@@ -67,25 +67,25 @@ rooms: list[Room] = [
             Player(
                 player_id="8cdc1984-e832-48c7-9d89-1d724665bef1",
                 nickname="Majiy",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="b7e6b6e12c04d9a2e70726bdb79b605b03d39b1747baf7100bfe81de00895685",
                 latest_sid="123456",
             ),
             Player(
                 player_id="02b38b51-3926-4b11-829a-54aa848f992f",
                 nickname="AnotherPlayer",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAAAAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="5c0813475bd5d28900152f7508d4d4ea25e3f4ab87387878139e790874c5fd46",
                 latest_sid="65371",
             ),
             Player(
                 player_id="49e810c5-c0ae-4443-88da-9fa4788541f2",
                 nickname="Lima",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAAAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="71ac78ed710d5f4b424056592c4b7472c9063fb494390a9257af7ff064646a29",
                 latest_sid="abcd1234",
             ),
             Player(
                 player_id="63fd683c-570a-49ac-b2bb-b1f306296ea7",
                 nickname="YAP",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAAAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="71ac78ed710d5f4b424056592c4b7472c9063fb494390a9257af7ff064646a29",
                 latest_sid="zxcvb980",
             ),
         ],
@@ -101,13 +101,13 @@ rooms: list[Room] = [
             Player(
                 player_id="aacd1fa2-404b-4dfc-ac06-7355e99b5117",
                 nickname="xoxoProSniperzxoxo",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAAAAEAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="5f0cf8dc048926f4ad425a33b62c01ac612a88de1b7fe147e0505ab19ca7e540",
                 latest_sid="654321",
             ),
             Player(
                 player_id="509fe727-a4f6-4d91-ac46-c1e2d5ff6810",
                 nickname="Majiy",
-                avatar=b"iVBORw0KGgoAAAANSUhEUgAAAAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg",
+                avatar_id="5c0813475bd5d28900152f7508d4d4ea25e3f4ab87387878139e790874c5fd46",
                 latest_sid="123456",
             ),
         ],
@@ -7,6 +7,7 @@ from omnibus.tests.uvicorn_test_server import UvicornTestServer
 from socketio.asyncio_client import AsyncClient
 
 from app import app  # type: ignore
+from app.avatar.avatar_models import Avatar
 from app.game_state.game_state_models import GameState
 
 HOST = "127.0.0.1"
@@ -61,3 +62,4 @@ async def setup_and_teardown(startup_and_shutdown_server):
     yield
     await Room.delete_all()
     await GameState.delete_all()
+    await Avatar.delete_all()
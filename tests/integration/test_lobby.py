@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import hashlib
 
 import pytest
 from socketio.asyncio_client import AsyncClient
@@ -51,7 +52,7 @@ async def test_empty_room_joined(client: AsyncClient):
     room_joined: RoomJoined = future.result()
     player = room_joined.players[0]
     assert player.nickname == join_room.nickname
-    assert player.avatar == avatar
+    assert player.avatar_id == hashlib.sha256(base64.b64decode(avatar)).hexdigest()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,19 @@
+from app.avatar.avatar_exceptions import AvatarNotFound
+from app.avatar.avatar_models import Avatar
+from app.avatar.avatar_repository import AvatarRepository
+
+
+class FakeAvatarRepository(AvatarRepository):
+    def __init__(self, avatars: list[Avatar]):
+        self.avatars = avatars
+
+    async def add(self, avatar: Avatar):
+        if any(existing_avatar.avatar_id == avatar.avatar_id for existing_avatar in self.avatars):
+            return
+        self.avatars.append(avatar)
+
+    async def get(self, id_: str) -> Avatar:
+        for avatar in self.avatars:
+            if avatar.avatar_id == id_:
+                return avatar
+        raise AvatarNotFound(msg="avatar not found", avatar_id=id_)
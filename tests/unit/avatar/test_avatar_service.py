@@ -0,0 +1,68 @@
+import base64
+import hashlib
+
+import pytest
+from pytest_mock import MockFixture
+
+from app.avatar.avatar_exceptions import AvatarNotFound, InvalidAvatar
+from app.avatar.avatar_service import AvatarService
+from tests.unit.avatar.fake_avatar_repository import FakeAvatarRepository
+from tests.unit.factories import avatar
+
+
+@pytest.fixture(autouse=True)
+def mock_beanie_document(mocker: MockFixture):
+    mocker.patch("beanie.odm.documents.Document.get_settings")
+
+
+@pytest.mark.asyncio
+async def test_should_add_base64_avatar():
+    avatar_repository = FakeAvatarRepository(avatars=[])
+    avatar_service = AvatarService(avatar_repository=avatar_repository)
+
+    avatar_id = await avatar_service.add(avatar=base64.b64encode(avatar))
+    assert avatar_id == hashlib.sha256(avatar).hexdigest()
+
+    stored_avatar = await avatar_service.get(avatar_id=avatar_id)
+    assert stored_avatar.data == avatar
+    assert stored_avatar.content_type == "image/png"
+
+
+@pytest.mark.asyncio
+async def test_should_add_same_avatar_once():
+    avatar_repository = FakeAvatarRepository(avatars=[])
+    avatar_service = AvatarService(avatar_repository=avatar_repository)
+
+    first_avatar_id = await avatar_service.add(avatar=avatar)
+    second_avatar_id = await avatar_service.add(avatar=b"data:image/png;base64," + base64.b64encode(avatar))
+    assert first_avatar_id == second_avatar_id
+    assert len(avatar_repository.avatars) == 1
+
+
+@pytest.mark.asyncio
+async def test_should_not_get_avatar_not_found():
+    avatar_service = AvatarService(avatar_repository=FakeAvatarRepository(avatars=[]))
+
+    with pytest.raises(AvatarNotFound):
+        await avatar_service.get(avatar_id="not-found")
+
+
+@pytest.mark.asyncio
+async def test_should_not_trust_client_content_type():
+    avatar_repository = FakeAvatarRepository(avatars=[])
+    avatar_service = AvatarService(avatar_repository=avatar_repository)
+
+    avatar_id = await avatar_service.add(avatar=b"data:text/html;base64," + base64.b64encode(avatar))
+    assert (await avatar_service.get(avatar_id=avatar_id)).content_type == "image/png"
+
+    with pytest.raises(InvalidAvatar):
+        await avatar_service.add(avatar=b"data:image/png;base64," + base64.b64encode(b"<script>alert(1)</script>"))
+    assert len(avatar_repository.avatars) == 1
+
+
+@pytest.mark.asyncio
+async def test_should_not_add_avatar_too_large():
+    avatar_service = AvatarService(avatar_repository=FakeAvatarRepository(avatars=[]), maximum_size_in_bytes=10)
+
+    with pytest.raises(InvalidAvatar):
+        await avatar_service.add(avatar=base64.b64encode(avatar))
@@ -0,0 +1,43 @@
+import pytest
+from pytest_mock import MockFixture
+
+from app.clients.client_factory import (
+    close_management_api_client,
+    get_management_api_client,
+)
+from app.core.config import get_settings
+
+
+@pytest.fixture(autouse=True)
+async def clear_management_api_client():
+    get_management_api_client.cache_clear()
+    yield
+    await close_management_api_client()
+
+
+@pytest.mark.asyncio
+async def test_should_share_management_api_client():
+    api_client = get_management_api_client()
+    assert get_management_api_client() is api_client
+
+    await close_management_api_client()
+    assert get_management_api_client() is not api_client
+
+
+@pytest.mark.asyncio
+async def test_should_build_management_api_client_from_settings(mocker: MockFixture):
+    settings = get_settings().copy(
+        update={
+            "MANAGEMENT_API_MAX_CONNECTIONS": 7,
+            "MANAGEMENT_API_MAX_KEEPALIVE_CONNECTIONS": 3,
+            "MANAGEMENT_API_HTTP2": True,
+        }
+    )
+    mocker.patch("app.clients.client_factory.get_settings", return_value=settings)
+
+    api_client = get_management_api_client()
+
+    pool = api_client._async_client._transport._pool
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert pool._http2
@@ -0,0 +1,35 @@
+from pytest_mock import MockFixture
+
+from app.core.cache import LRUCache
+
+
+def test_should_evict_least_recently_used():
+    cache: LRUCache[int] = LRUCache(max_entries=2, ttl_in_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    stats = cache.stats
+    assert stats.size == 2
+    assert stats.hits == 3
+    assert stats.misses == 1
+    assert stats.evictions == 1
+
+
+def test_should_expire_entries(mocker: MockFixture):
+    monotonic = mocker.patch("app.core.cache.time.monotonic", return_value=100)
+    cache: LRUCache[int] = LRUCache(max_entries=2, ttl_in_seconds=10)
+    cache.set("a", 1)
+
+    monotonic.return_value = 109
+    assert cache.get("a") == 1
+
+    monotonic.return_value = 110
+    assert cache.get("a") is None
+    assert cache.stats.evictions == 1
+    assert len(cache) == 0
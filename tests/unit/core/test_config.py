@@ -0,0 +1,15 @@
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+
+
+@pytest.mark.parametrize("backend", ["ROOM_BACKEND", "GAME_STATE_BACKEND"])
+def test_should_only_keep_state_in_memory_with_room_affinity(backend: str):
+    required = {"MANAGEMENT_API_URL": "http://localhost", "MESSAGE_QUEUE_HOST": "localhost"}
+
+    with pytest.raises(ValidationError, match="ROOM_AFFINITY_ENABLED"):
+        Settings(**required, **{backend: "memory"}, ROOM_AFFINITY_ENABLED=False)
+
+    settings = Settings(**required, **{backend: "memory"}, ROOM_AFFINITY_ENABLED=True)
+    assert getattr(settings, backend) == "memory"
@@ -0,0 +1,22 @@
+from app.core.event_log import EventLogSampler, LazyEventLog
+from app.room.lobby.lobby_events_models import Player, RoomJoined
+
+
+def test_should_render_event_log_with_exclusions():
+    room_joined = RoomJoined(
+        host_player_nickname="host",
+        players=[Player(nickname="host", avatar_id="a"), Player(nickname="b", avatar_id="b")],
+    )
+    event_log = LazyEventLog(room_joined, exclude={"players": {"__all__": {"avatar_id"}}})
+
+    assert event_log.__structlog__() == {
+        "host_player_nickname": "host",
+        "players": [{"nickname": "host"}, {"nickname": "b"}],
+    }
+
+
+def test_should_sample_one_in_n_per_event():
+    sampler = EventLogSampler(sample_rate=3)
+
+    assert [sampler.should_log("ROOM_JOINED") for _ in range(4)] == [True, False, False, True]
+    assert sampler.should_log("GOT_NEXT_QUESTION")
@@ -0,0 +1,44 @@
+import pytest
+
+from app.core.load_shedding import AdmissionController, LoopLagMonitor
+from app.core.metrics import get_metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    get_metrics.cache_clear()
+    yield
+    get_metrics.cache_clear()
+
+
+def test_should_get_loop_lag_percentiles():
+    lag_monitor = LoopLagMonitor(interval_in_seconds=0.5, window_size=10)
+    for lag in range(20):
+        lag_monitor.record(lag / 100)
+
+    assert lag_monitor.percentile(0.5) == 0.15
+    assert lag_monitor.percentile(0.99) == 0.19
+
+
+def test_should_not_admit_when_loop_is_lagging():
+    lag_monitor = LoopLagMonitor(interval_in_seconds=0.5, window_size=10)
+    admission_controller = AdmissionController(
+        lag_monitor=lag_monitor, max_loop_lag_in_seconds=0.25, max_events_in_flight=0
+    )
+    assert admission_controller.should_admit()
+
+    for _ in range(10):
+        lag_monitor.record(0.3)
+    assert not admission_controller.should_admit()
+
+
+def test_should_not_admit_with_too_many_events_in_flight():
+    lag_monitor = LoopLagMonitor(interval_in_seconds=0.5, window_size=10)
+    admission_controller = AdmissionController(
+        lag_monitor=lag_monitor, max_loop_lag_in_seconds=0, max_events_in_flight=2
+    )
+    metrics = get_metrics()
+    metrics.events_in_flight.inc(event_name="SUBMIT_ANSWER_FIBBING_IT")
+    metrics.events_in_flight.inc(event_name="GET_NEXT_QUESTION", amount=2)
+
+    assert not admission_controller.should_admit()
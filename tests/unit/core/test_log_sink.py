@@ -0,0 +1,44 @@
+import io
+
+import structlog
+
+from app.core.log_sink import QueuedLogSink
+
+
+def test_should_write_queued_log_records_in_background():
+    stream = io.StringIO()
+    log_sink = QueuedLogSink([structlog.processors.KeyValueRenderer()], max_queue_size=10, batch_size=5, stream=stream)
+    log_sink.start(previous_processors=structlog.get_config()["processors"])
+
+    for index in range(3):
+        try:
+            log_sink(None, "info", {"event": "hello", "index": index})
+        except structlog.DropEvent:
+            pass
+    log_sink.stop()
+
+    assert stream.getvalue().splitlines() == [
+        "event='hello' index=0",
+        "event='hello' index=1",
+        "event='hello' index=2",
+    ]
+
+
+def test_should_drop_log_records_when_queue_is_full():
+    stream = io.StringIO()
+    log_sink = QueuedLogSink([structlog.processors.KeyValueRenderer()], max_queue_size=2, batch_size=5, stream=stream)
+
+    for index in range(3):
+        try:
+            log_sink(None, "info", {"event": "hello", "index": index})
+        except structlog.DropEvent:
+            pass
+    log_sink.start(previous_processors=structlog.get_config()["processors"])
+    log_sink.stop()
+
+    assert log_sink.dropped == 1
+    assert stream.getvalue().splitlines() == [
+        "event='hello' index=0",
+        "event='hello' index=1",
+        "dropped 1 log records, log queue was full",
+    ]
@@ -0,0 +1,46 @@
+import json
+
+from app.core.metrics import Counter, Histogram, estimate_size
+
+
+def test_should_render_histogram_buckets_cumulatively():
+    histogram = Histogram("event_duration_seconds", "Event duration.", ("event_name",), buckets=(0.1, 1))
+    histogram.observe(0.05, event_name="JOIN_ROOM")
+    histogram.observe(0.1, event_name="JOIN_ROOM")
+    histogram.observe(2, event_name="JOIN_ROOM")
+
+    assert list(histogram.render()) == [
+        "# HELP event_duration_seconds Event duration.",
+        "# TYPE event_duration_seconds histogram",
+        'event_duration_seconds_bucket{event_name="JOIN_ROOM",le="0.1"} 2',
+        'event_duration_seconds_bucket{event_name="JOIN_ROOM",le="1"} 2',
+        'event_duration_seconds_bucket{event_name="JOIN_ROOM",le="+Inf"} 3',
+        'event_duration_seconds_sum{event_name="JOIN_ROOM"} 2.15',
+        'event_duration_seconds_count{event_name="JOIN_ROOM"} 3',
+    ]
+
+
+def test_should_escape_label_values():
+    counter = Counter("event_errors_total", "Event errors.", ("error",))
+    counter.inc(error='bad "value"')
+    counter.inc(error='bad "value"')
+
+    assert list(counter.render())[-1] == 'event_errors_total{error="bad \\"value\\""} 2'
+
+
+def test_should_render_collected_totals_as_counter():
+    counter = Counter("room_cache_lookups_total", "Room cache lookups.", ("result",))
+    counter.set(3, result="hit")
+    counter.set(5, result="hit")
+
+    assert list(counter.render()) == [
+        "# HELP room_cache_lookups_total Room cache lookups.",
+        "# TYPE room_cache_lookups_total counter",
+        'room_cache_lookups_total{result="hit"} 5',
+    ]
+
+
+def test_should_estimate_json_size():
+    payload = {"room_code": "abc", "avatar": "a" * 1000, "players": [{"score": 1}, None]}
+
+    assert abs(estimate_size(payload) - len(json.dumps(payload, separators=(",", ":")))) <= 32
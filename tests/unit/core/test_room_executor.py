@@ -0,0 +1,46 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from app.core.room_executor import RoomExecutor
+
+
+@pytest.mark.asyncio
+async def test_should_run_events_for_the_same_room_one_at_a_time():
+    room_executor = RoomExecutor(max_batch_size=10)
+    running: list[str] = []
+    overlapped: list[str] = []
+
+    async def handle(room_id: str):
+        if room_id in running:
+            overlapped.append(room_id)
+        running.append(room_id)
+        await asyncio.sleep(0.01)
+        running.remove(room_id)
+
+    await asyncio.gather(*(room_executor.run(room_id, partial(handle, room_id)) for room_id in ["a", "a", "b", "b"]))
+
+    assert overlapped == []
+
+
+@pytest.mark.asyncio
+async def test_should_apply_queued_events_in_batches():
+    room_executor = RoomExecutor(max_batch_size=10)
+    batches: list[list[int]] = []
+
+    async def apply_batch(items: list[int]):
+        batches.append(items)
+        return [ValueError("odd") if item % 2 else item * 10 for item in items]
+
+    results = await asyncio.gather(
+        room_executor.run(room_id="a", func=lambda: asyncio.sleep(0.01)),
+        *(room_executor.run_batched("a", batch_key="answer", item=item, apply_batch=apply_batch) for item in range(4)),
+        return_exceptions=True,
+    )
+
+    assert batches == [[0, 1, 2, 3]]
+    assert results[1] == 0
+    assert results[3] == 20
+    assert isinstance(results[2], ValueError)
+    assert isinstance(results[4], ValueError)
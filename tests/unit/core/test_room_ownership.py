@@ -0,0 +1,56 @@
+import json
+
+import pytest
+from pytest_mock import MockFixture
+
+from app.core.room_ownership import NODE_CHANNEL, HashRing, RoomRouter, ring_position
+
+
+def test_should_give_every_room_an_owner():
+    hash_ring = HashRing(["node-a", "node-b", "node-c"])
+
+    owners = {hash_ring.owner(f"room-{index}") for index in range(100)}
+
+    assert owners == {"node-a", "node-b", "node-c"}
+    assert HashRing([]).owner("room-1") is None
+
+
+def test_should_only_move_rooms_owned_by_the_node_that_left():
+    hash_ring = HashRing(["node-a", "node-b", "node-c"])
+    hash_ring_without_c = HashRing(["node-a", "node-b"])
+
+    for index in range(1000):
+        room_id = f"room-{index}"
+        if hash_ring.owner(room_id) != "node-c":
+            assert hash_ring_without_c.owner(room_id) == hash_ring.owner(room_id)
+
+
+@pytest.mark.parametrize("previous_nodes", [["node-a", "node-b", "node-c"], []])
+def test_should_only_gain_ranges_of_rooms_that_moved(previous_nodes: list[str]):
+    previous_ring = HashRing(previous_nodes)
+    ring = HashRing(["node-a", "node-b"])
+
+    gained_ranges = ring.gained_ranges(previous_ring, node_id="node-a")
+
+    for index in range(1000):
+        room_id = f"room-{index}"
+        position = ring_position(room_id)
+        is_gained = any(start <= position and (end is None or position < end) for start, end in gained_ranges)
+        assert is_gained == (ring.owner(room_id) == "node-a" and previous_ring.owner(room_id) != "node-a")
+
+
+@pytest.mark.asyncio
+async def test_should_tell_new_owners_which_rooms_were_handed_over(mocker: MockFixture):
+    redis = mocker.AsyncMock()
+    room_router = RoomRouter(redis=redis, heartbeat_interval_in_seconds=1, node_ttl_in_seconds=3)
+    room_router.ring = HashRing([room_router.node_id, "node-a", "node-b"])
+    room_ids = [f"room-{index}" for index in range(100)]
+
+    await room_router.hand_over(room_ids)
+
+    handed_over = {
+        channel: json.loads(message)["handed_over"] for (channel, message), _ in redis.publish.await_args_list
+    }
+    assert handed_over.keys() == {f"{NODE_CHANNEL}:node-a", f"{NODE_CHANNEL}:node-b"}
+    for channel, owned_room_ids in handed_over.items():
+        assert all(f"{NODE_CHANNEL}:{room_router.ring.owner(room_id)}" == channel for room_id in owned_room_ids)
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from app.core.tasks import gather_or_cancel
+
+
+@pytest.mark.asyncio
+async def test_should_gather_results_in_order():
+    async def return_after(value: int, delay: float) -> int:
+        await asyncio.sleep(delay)
+        return value
+
+    results = await gather_or_cancel(return_after(1, 0.02), return_after(2, 0), timeout=1)
+    assert results == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_should_cancel_pending_on_timeout():
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(asyncio.TimeoutError):
+        await gather_or_cancel(slow(), timeout=0.01)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_should_cancel_pending_on_exception():
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        await gather_or_cancel(slow(), fail(), timeout=1)
+    assert cancelled.is_set()
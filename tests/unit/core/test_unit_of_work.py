@@ -0,0 +1,72 @@
+import pytest
+from pytest_mock import MockFixture
+
+from app.core.unit_of_work import get_unit_of_work, record_round_trip, unit_of_work
+from app.room.room_models import Room, RoomSummary
+from app.room.room_repository import RoomRepository
+from tests.unit.factories import RoomFactory
+
+
+@pytest.fixture(autouse=True)
+def mock_beanie_document(mocker: MockFixture):
+    mocker.patch("beanie.odm.documents.Document.get_settings")
+
+
+def test_should_only_cache_documents_within_unit_of_work():
+    room: Room = RoomFactory.build()
+    with unit_of_work() as work:
+        get_unit_of_work().add(room.room_id, room)
+        assert work.get(Room, room.room_id) is room
+        assert work.get(RoomSummary, room.room_id) is None
+
+    with unit_of_work() as work:
+        assert work.get(Room, room.room_id) is None
+
+
+def test_should_not_use_repositories_outside_unit_of_work():
+    with pytest.raises(RuntimeError):
+        get_unit_of_work()
+
+    with pytest.raises(RuntimeError):
+        record_round_trip()
+
+
+def test_should_evict_every_document_with_key():
+    room: Room = RoomFactory.build()
+    other_room: Room = RoomFactory.build()
+    with unit_of_work() as work:
+        work.add(room.room_id, room)
+        work.add(room.room_id, RoomSummary(**room.dict()))
+        work.add(other_room.room_id, other_room)
+
+        work.evict(room.room_id)
+        assert work.identity_map == {(Room, other_room.room_id): other_room}
+
+        work.evict()
+        assert work.identity_map == {}
+
+
+def test_should_count_round_trips_within_unit_of_work():
+    with unit_of_work() as work:
+        record_round_trip()
+        record_round_trip()
+
+    assert work.round_trips == 2
+
+
+@pytest.mark.asyncio
+async def test_should_load_room_once_per_unit_of_work(mocker: MockFixture):
+    room: Room = RoomFactory.build()
+    player = room.players[0]
+    find_one = mocker.patch.object(Room, "find_one", mocker.AsyncMock(return_value=room))
+    room_repository = RoomRepository()
+
+    with unit_of_work() as work:
+        assert await room_repository.get_room_by_player_id(player_id=player.player_id) is room
+        assert await room_repository.get_room_by_player_id(player_id=player.player_id) is room
+        room_summary = await room_repository.get_summary_by_player_id(player_id=player.player_id)
+        assert await room_repository.get_player(player_id=player.player_id) == player
+
+    assert room_summary.room_id == room.room_id
+    assert work.round_trips == 1
+    find_one.assert_awaited_once()
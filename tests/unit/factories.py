@@ -1,4 +1,5 @@
 import base64
+import hashlib
 from datetime import datetime
 
 import factory
@@ -15,6 +16,10 @@ from app.room.room_models import Room, RoomState
 from tests.unit.data.data import starting_state
 
 game_names = ["quibly", "fibbing_it", "drawlosseum"]
+avatar = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+avatar_id = hashlib.sha256(avatar).hexdigest()
 
 
 class PlayerFactory(factory.Factory):
@@ -22,10 +27,8 @@ class PlayerFactory(factory.Factory):
         model = Player
 
     player_id = factory.Faker("uuid4")
-    avatar = base64.b64decode(
-        "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
-    )
-    nickname = factory.Faker("first_name")
+    avatar_id = factory.Faker("sha256")
+    nickname = factory.Sequence(lambda n: f"player{n}")
     room_id = factory.Faker("uuid4")
     latest_sid = factory.Faker(
         "lexify", text="??????????????", letters="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
@@ -59,6 +62,6 @@ class GameStateFactory(factory.Factory):
     action_completed_by = None
 
 
-def get_new_player() -> NewPlayer:
-    player: Player = PlayerFactory.build()
-    return NewPlayer(**player.dict())
+def get_new_player(**kwargs) -> NewPlayer:
+    player: Player = PlayerFactory.build(**kwargs)
+    return NewPlayer(avatar=avatar, **player.dict(exclude={"avatar_id"}))
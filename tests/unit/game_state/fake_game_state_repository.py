@@ -57,3 +57,33 @@ class FakeGameStateRepository(AbstractGameStateRepository):
     async def update_paused(self, game_state: GameState, game_paused: GamePaused) -> GameState:
         game_state.paused = game_paused
         return game_state
+
+    async def add_answers(self, room_id: str, answers: dict[str, str]) -> GameState:
+        game_state = await self.get(room_id)
+        self.check_action_is_open(game_state=game_state, action=FibbingActions.submit_answers, now=datetime.now())
+        game_state.state.questions.current_answers.update(answers)
+        return game_state
+
+    async def add_vote(self, room_id: str, nickname: str) -> GameState:
+        game_state = await self.get(room_id)
+        self.check_action_is_open(game_state=game_state, action=FibbingActions.vote_on_fibber, now=datetime.now())
+        votes = game_state.state.questions.votes
+        votes[nickname] = votes.get(nickname, 0) + 1
+        return game_state
+
+    async def claim_expired_action(
+        self, room_id: str, action: FibbingActions | QuiblyActions | DrawlossuemActions, now: datetime
+    ) -> bool:
+        game_state = await self.get(room_id)
+        if game_state.action != action or not game_state.action_completed_by or game_state.action_completed_by > now:
+            return False
+
+        game_state.action_completed_by = None
+        return True
+
+    async def get_pending_actions(self) -> list[tuple[str, datetime]]:
+        return [
+            (game_state.room_id, game_state.action_completed_by)
+            for game_state in self.game_states
+            if game_state.action_completed_by
+        ]
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -7,6 +8,7 @@ from mergedeep import merge
 from pytest_httpx import HTTPXMock
 from pytest_mock import MockFixture
 
+from app.core.metrics import get_metrics
 from app.game_state.game_state_exceptions import ActionTimedOut
 from app.game_state.game_state_models import (
     FibbingActions,
@@ -19,6 +21,7 @@ from app.game_state.game_state_models import (
     PlayerScore,
 )
 from app.game_state.games.exceptions import InvalidAnswer
+from app.game_state.question_pool import QuestionPool
 from app.player.player_models import Player
 from app.room.room_models import Room
 from tests.unit.data.data import (
@@ -384,3 +387,32 @@ def _get_game_state(
             current_round=round_,
         ),
     )
+
+
+@pytest.mark.asyncio
+async def test_should_get_starting_state_from_question_pool(httpx_mock: HTTPXMock):
+    fibbing_it = get_fibbing_it_game()
+    mock_get_questions(httpx_mock)
+    question_client = get_question_api_client()
+    question_pool = QuestionPool(question_client=question_client, pool_size=3)
+    for round_, grouped in [("opinion", True), ("likely", False), ("free_form", True)]:
+        await question_pool.refill(game_name="fibbing_it", round_=round_, grouped=grouped)
+
+    players = await _create_players()
+    state = await fibbing_it.get_starting_state(
+        question_client=question_client, players=players, question_pool=question_pool
+    )
+    # taking the questions empties each pool, which starts a background refill back to `pool_size`
+    await asyncio.gather(*question_pool._refills.values())
+    await question_pool.close()
+
+    rounds = [state.questions.rounds.opinion, state.questions.rounds.likely, state.questions.rounds.free_form]
+    for questions in rounds:
+        assert len(questions) == 3
+
+    for stats in question_pool.stats().values():
+        assert stats.hit_rate == 1
+        assert stats.size == 3
+
+    refill_durations = "\n".join(get_metrics().question_pool_refill_duration.render())
+    assert 'banter_bus_question_pool_refill_duration_seconds_count{pool="fibbing_it:opinion"}' in refill_durations
@@ -0,0 +1,64 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.game_state.action_timer import ActionTimer
+
+
+@pytest.mark.asyncio
+async def test_should_fire_expired_actions_in_order():
+    expired: list[str] = []
+    done = asyncio.Event()
+
+    async def on_expired(room_id: str, _: datetime):
+        expired.append(room_id)
+        if len(expired) == 2:
+            done.set()
+
+    action_timer = ActionTimer()
+    action_timer.start(on_expired=on_expired)
+    now = datetime.now()
+    action_timer.schedule(room_id="second", fire_at=now + timedelta(milliseconds=50))
+    action_timer.schedule(room_id="first", fire_at=now + timedelta(milliseconds=10))
+
+    await asyncio.wait_for(done.wait(), timeout=1)
+    await action_timer.stop()
+    assert expired == ["first", "second"]
+    assert len(action_timer) == 0
+
+
+@pytest.mark.asyncio
+async def test_should_only_fire_latest_deadline():
+    expired: list[datetime] = []
+
+    async def on_expired(_: str, completed_by: datetime):
+        expired.append(completed_by)
+
+    action_timer = ActionTimer()
+    action_timer.start(on_expired=on_expired)
+    now = datetime.now()
+    latest = now + timedelta(milliseconds=30)
+    action_timer.schedule(room_id="room", fire_at=now + timedelta(milliseconds=10))
+    action_timer.schedule(room_id="room", fire_at=latest)
+
+    await asyncio.sleep(0.1)
+    await action_timer.stop()
+    assert expired == [latest]
+
+
+@pytest.mark.asyncio
+async def test_should_not_fire_cancelled_action():
+    expired: list[str] = []
+
+    async def on_expired(room_id: str, _: datetime):
+        expired.append(room_id)
+
+    action_timer = ActionTimer()
+    action_timer.start(on_expired=on_expired)
+    action_timer.schedule(room_id="room", fire_at=datetime.now() + timedelta(milliseconds=10))
+    action_timer.cancel(room_id="room")
+
+    await asyncio.sleep(0.05)
+    await action_timer.stop()
+    assert expired == []
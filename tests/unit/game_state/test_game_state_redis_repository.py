@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+import pytest
+from pytest_mock import MockFixture
+from redis.asyncio import Redis
+
+from app.core.unit_of_work import unit_of_work
+from app.game_state.game_state_models import FibbingActions, GamePaused, GameState
+from app.game_state.game_state_redis_repository import RedisGameStateRepository
+from tests.unit.data.data import starting_state
+from tests.unit.factories import GameStateFactory
+
+
+@pytest.fixture(autouse=True)
+def mock_beanie_document(mocker: MockFixture):
+    mocker.patch("beanie.odm.documents.Document.get_settings")
+
+
+def test_should_store_answers_and_votes_in_their_own_hashes():
+    state = starting_state.copy(deep=True)
+    state.questions.current_answers = {"player-1": "an answer"}
+    state.questions.votes = {"player.one": 2}
+    game_state: GameState = GameStateFactory.build(
+        game_name="fibbing_it",
+        state=state,
+        action=FibbingActions.vote_on_fibber,
+        action_completed_by=datetime.now() + timedelta(seconds=60),
+        paused=GamePaused(is_paused=True, paused_stopped_at=datetime.now(), waiting_for_players=["player-1"]),
+    )
+    repository = RedisGameStateRepository(redis=Redis(decode_responses=True))
+
+    fields, answers, votes = repository._to_hashes(game_state)
+    assert answers == {"player-1": "an answer"}
+    assert votes == {"player.one": 2}
+    assert "current_answers" not in fields["state"]
+
+    stored_votes = {nickname: str(count) for nickname, count in votes.items()}
+    stored_game_state = repository._from_hashes(fields=fields, answers=answers, votes=stored_votes)
+    # beanie gives every new document its own revision id, which is not part of the stored state
+    assert stored_game_state.dict(exclude={"revision_id"}) == game_state.dict(exclude={"revision_id"})
+
+
+@pytest.mark.asyncio
+async def test_should_add_to_answers_when_updating_state(mocker: MockFixture):
+    redis = mocker.MagicMock()
+    pipeline = redis.pipeline.return_value
+    pipeline.execute = mocker.AsyncMock()
+    repository = RedisGameStateRepository(redis=redis)
+    state = starting_state.copy(deep=True)
+    state.questions.current_answers = {"player-1": "an answer"}
+    game_state: GameState = GameStateFactory.build(game_name="fibbing_it", state=state)
+
+    with unit_of_work():
+        await repository.update_state(game_state=game_state, state=state)
+
+    _, answers_key, votes_key = repository._keys(game_state.room_id)
+    pipeline.hset.assert_any_call(answers_key, mapping={"player-1": "an answer"})
+    pipeline.delete.assert_called_once_with(votes_key)
@@ -5,7 +5,9 @@ from pytest_httpx import HTTPXMock
 from pytest_mock import MockFixture
 
 from app.core.exceptions import GameNotFound
+from app.game_state.action_timer import ActionTimer
 from app.game_state.game_state_exceptions import (
+    ActionTimedOut,
     GameIsPaused,
     GameStateAlreadyPaused,
     GameStateNotPaused,
@@ -19,6 +21,8 @@ from app.game_state.game_state_models import (
     GameState,
     UpdateQuestionRoundState,
 )
+from app.game_state.games.exceptions import InvalidAction
+from tests.unit.data.data import starting_state
 from tests.unit.factories import GameStateFactory
 from tests.unit.get_services import get_game_state_service, get_player_service
 from tests.unit.mocks import mock_get_questions
@@ -155,3 +159,144 @@ async def test_should_remove_player_from_waiting_for_players_list():
 
     await game_state_service.unpause_game(room_id=game_state.room_id, player_reconnected="me")
     assert game_state.paused.waiting_for_players == []
+
+
+@pytest.mark.asyncio
+async def test_should_submit_answer():
+    game_state = GameStateFactory.build(
+        game_name="fibbing_it",
+        state=starting_state.copy(deep=True),
+        action=FibbingActions.submit_answers,
+        action_completed_by=datetime.now() + timedelta(minutes=5),
+    )
+    game_state_service = get_game_state_service(game_states=[game_state])
+
+    new_game_state = await game_state_service.submit_answer(room_id=game_state.room_id, player_id="abc", answer="lame")
+    assert new_game_state.state.questions.current_answers["abc"] == "lame"  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_should_submit_answers():
+    game_state = GameStateFactory.build(
+        game_name="fibbing_it",
+        state=starting_state.copy(deep=True),
+        action=FibbingActions.submit_answers,
+        action_completed_by=datetime.now() + timedelta(minutes=5),
+    )
+    game_state_service = get_game_state_service(game_states=[game_state])
+
+    new_game_state = await game_state_service.submit_answers(
+        room_id=game_state.room_id, answers={"abc": "lame", "def": "cool"}
+    )
+    assert new_game_state.state.questions.current_answers["abc"] == "lame"  # type: ignore
+    assert new_game_state.state.questions.current_answers["def"] == "cool"  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_should_not_submit_answer_timed_out():
+    game_state = GameStateFactory.build(
+        game_name="fibbing_it",
+        state=starting_state.copy(deep=True),
+        action=FibbingActions.submit_answers,
+        action_completed_by=datetime.now() - timedelta(minutes=5),
+    )
+    game_state_service = get_game_state_service(game_states=[game_state])
+
+    with pytest.raises(ActionTimedOut):
+        await game_state_service.submit_answer(room_id=game_state.room_id, player_id="abc", answer="lame")
+
+
+@pytest.mark.asyncio
+async def test_should_not_submit_answer_once_action_claimed():
+    game_state = GameStateFactory.build(
+        game_name="fibbing_it",
+        state=starting_state.copy(deep=True),
+        action=FibbingActions.submit_answers,
+        action_completed_by=datetime.now() - timedelta(seconds=1),
+    )
+    game_state_service = get_game_state_service(game_states=[game_state])
+    assert await game_state_service.claim_expired_action(game_state=game_state)
+
+    with pytest.raises(ActionTimedOut):
+        await game_state_service.submit_answer(room_id=game_state.room_id, player_id="abc", answer="lame")
+
+
+@pytest.mark.asyncio
+async def test_should_submit_vote():
+    game_state = GameStateFactory.build(
+        game_name="fibbing_it",
+        state=starting_state.copy(deep=True),
+        action=FibbingActions.vote_on_fibber,
+        action_completed_by=datetime.now() + timedelta(minutes=5),
+    )
+    game_state_service = get_game_state_service(game_states=[game_state])
+
+    await game_state_service.submit_vote(room_id=game_state.room_id, nickname="Majiy")
+    new_game_state = await game_state_service.submit_vote(room_id=game_state.room_id, nickname="Majiy")
+    assert new_game_state.state.questions.votes["Majiy"] == 2  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_should_not_submit_vote_invalid_action():
+    game_state = GameStateFactory.build(
+        game_name="fibbing_it",
+        state=starting_state.copy(deep=True),
+        action=FibbingActions.submit_answers,
+        action_completed_by=datetime.now() + timedelta(minutes=5),
+    )
+    game_state_service = get_game_state_service(game_states=[game_state])
+
+    with pytest.raises(InvalidAction):
+        await game_state_service.submit_vote(room_id=game_state.room_id, nickname="Majiy")
+
+
+@pytest.mark.asyncio
+async def test_should_schedule_next_action():
+    game_state = GameStateFactory.build(game_name="fibbing_it", state=starting_state.copy(deep=True))
+    action_timer = ActionTimer()
+    game_state_service = get_game_state_service(game_states=[game_state], action_timer=action_timer)
+
+    await game_state_service.update_next_action(
+        next_action=FibbingActions.submit_answers, timer=60, game_state=game_state
+    )
+    assert len(action_timer) == 1
+
+
+@pytest.mark.asyncio
+async def test_should_claim_expired_action_once():
+    game_state = GameStateFactory.build(
+        game_name="fibbing_it",
+        state=starting_state.copy(deep=True),
+        action=FibbingActions.submit_answers,
+        action_completed_by=datetime.now() - timedelta(seconds=1),
+    )
+    game_state_service = get_game_state_service(game_states=[game_state])
+
+    assert await game_state_service.claim_expired_action(game_state=game_state)
+    assert not await game_state_service.claim_expired_action(game_state=game_state)
+
+
+@pytest.mark.asyncio
+async def test_should_not_claim_action_not_expired():
+    game_state = GameStateFactory.build(
+        game_name="fibbing_it",
+        state=starting_state.copy(deep=True),
+        action=FibbingActions.submit_answers,
+        action_completed_by=datetime.now() + timedelta(minutes=5),
+    )
+    game_state_service = get_game_state_service(game_states=[game_state])
+
+    assert not await game_state_service.claim_expired_action(game_state=game_state)
+
+
+@pytest.mark.asyncio
+async def test_should_schedule_pending_actions():
+    game_states = GameStateFactory.build_batch(
+        3, game_name="fibbing_it", action_completed_by=datetime.now() + timedelta(minutes=5)
+    )
+    action_timer = ActionTimer()
+    game_state_service = get_game_state_service(game_states=game_states, action_timer=action_timer)
+
+    pending = await game_state_service.schedule_pending_actions()
+    assert pending == 3
+    assert len(action_timer) == 3
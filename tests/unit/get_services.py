@@ -1,6 +1,8 @@
+from app.avatar.avatar_service import AvatarService
 from app.clients.management_api.api.games_api import AsyncGamesApi
 from app.clients.management_api.api.questions_api import AsyncQuestionsApi
 from app.clients.management_api.api_client import ApiClient
+from app.game_state.action_timer import ActionTimer
 from app.game_state.game_state_models import GameState
 from app.game_state.game_state_service import GameStateService
 from app.game_state.games.fibbing_it.fibbing_it import FibbingIt
@@ -8,6 +10,7 @@ from app.player.player_service import PlayerService
 from app.room.lobby.lobby_service import LobbyService
 from app.room.room_models import Room
 from app.room.room_service import RoomService
+from tests.unit.avatar.fake_avatar_repository import FakeAvatarRepository
 from tests.unit.factories import GameStateFactory, RoomFactory
 from tests.unit.game_state.fake_game_state_repository import FakeGameStateRepository
 from tests.unit.room.fake_room_repository import FakeRoomRepository
@@ -22,10 +25,17 @@ def get_player_service(rooms: list[Room] | None = None, num: int = 1, **kwargs)
         existing_room = []
 
     room_repository = FakeRoomRepository(rooms=existing_room)
-    return PlayerService(room_repository=room_repository)
+    return PlayerService(room_repository=room_repository, avatar_service=get_avatar_service())
 
 
-def get_room_service(rooms: list[Room] | None = None, num: int = 1, **kwargs) -> RoomService:
+def get_avatar_service() -> AvatarService:
+    avatar_repository = FakeAvatarRepository(avatars=[])
+    return AvatarService(avatar_repository=avatar_repository)
+
+
+def get_room_service(
+    rooms: list[Room] | None = None, num: int = 1, game_states: list[GameState] | None = None, **kwargs
+) -> RoomService:
     if rooms:
         existing_room = rooms
     elif num:
@@ -33,7 +43,7 @@ def get_room_service(rooms: list[Room] | None = None, num: int = 1, **kwargs) ->
     else:
         existing_room = []
 
-    room_repository = FakeRoomRepository(rooms=existing_room)
+    room_repository = FakeRoomRepository(rooms=existing_room, game_states=game_states)
     return RoomService(room_repository=room_repository)
 
 
@@ -46,7 +56,9 @@ def get_lobby_service(
     return LobbyService(room_service=room_service, player_service=player_service, game_state_service=game_state_service)
 
 
-def get_game_state_service(game_states: list[GameState] | None = None, num: int = 1, **kwargs) -> GameStateService:
+def get_game_state_service(
+    game_states: list[GameState] | None = None, num: int = 1, action_timer: ActionTimer | None = None, **kwargs
+) -> GameStateService:
     if game_states:
         existing_game_states = game_states
     elif num:
@@ -56,7 +68,9 @@ def get_game_state_service(game_states: list[GameState] | None = None, num: int
 
     question_client = get_question_api_client()
     game_state_repository = FakeGameStateRepository(game_states=existing_game_states)
-    return GameStateService(game_state_repository=game_state_repository, question_client=question_client)
+    return GameStateService(
+        game_state_repository=game_state_repository, question_client=question_client, action_timer=action_timer
+    )
 
 
 def get_game_api_client() -> AsyncGamesApi:
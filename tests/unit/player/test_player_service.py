@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime, timedelta
 
 import pytest
@@ -23,7 +24,11 @@ async def test_should_create_new_player():
     new_player = get_new_player()
 
     player = await player_service.create(room=room, new_player=new_player)
-    expected_player = Player(**new_player.dict(), player_id=player.player_id)
+    expected_player = Player(
+        **new_player.dict(exclude={"avatar"}),
+        avatar_id=hashlib.sha256(new_player.avatar).hexdigest(),
+        player_id=player.player_id,
+    )
     assert player == expected_player
 
 
@@ -145,3 +150,18 @@ async def test_should_not_disconnect_player_not_found():
         await player_service.disconnect_player(
             nickname=first_player.nickname, room_id="room-id_not_found", disconnect_timer_in_seconds=300
         )
+
+
+@pytest.mark.asyncio
+async def test_should_remove_disconnected_players():
+    existing_players: list[Player] = PlayerFactory.build_batch(3)
+    existing_room: Room = RoomFactory.build(players=existing_players)
+    player_service = get_player_service(rooms=[existing_room])
+
+    first_player, second_player, third_player = existing_players
+    first_player.disconnected_at = datetime.now() - timedelta(minutes=6)
+    second_player.disconnected_at = datetime.now() - timedelta(minutes=3)
+    removed_players = await player_service.remove_disconnected_players(disconnect_timer_in_seconds=300, batch_size=10)
+
+    assert [player.nickname for player in removed_players[existing_room.room_id]] == [first_player.nickname]
+    assert existing_room.players == [second_player, third_player]
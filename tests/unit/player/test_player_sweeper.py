@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+from functools import partial
+
+import pytest
+from pytest_mock import MockFixture
+
+from app.core.room_ownership import HashRing, RoomRouter
+from app.player.player_models import Player
+from app.player.player_sweeper import SWEEPER_KEY, DisconnectedPlayerSweeper
+from app.room.room_models import Room
+from tests.unit.factories import PlayerFactory, RoomFactory
+from tests.unit.get_services import get_player_service
+
+
+@pytest.fixture(autouse=True)
+def mock_beanie_document(mocker: MockFixture):
+    mocker.patch("beanie.odm.documents.Document.get_settings")
+
+
+@pytest.mark.asyncio
+async def test_should_sweep_disconnected_players_on_one_node(mocker: MockFixture):
+    existing_players: list[Player] = PlayerFactory.build_batch(2)
+    existing_room: Room = RoomFactory.build(players=existing_players)
+    existing_players[0].disconnected_at = datetime.now() - timedelta(minutes=6)
+    player_service = get_player_service(rooms=[existing_room])
+    mocker.patch("app.player.player_sweeper.get_player_service", return_value=player_service)
+
+    node_a = RoomRouter(redis=mocker.AsyncMock(), heartbeat_interval_in_seconds=1, node_ttl_in_seconds=3)
+    node_b = RoomRouter(redis=mocker.AsyncMock(), heartbeat_interval_in_seconds=1, node_ttl_in_seconds=3)
+    node_a.ring = node_b.ring = HashRing([node_a.node_id, node_b.node_id])
+    on_removed = mocker.AsyncMock()
+    for node in (node_a, node_b):
+        sweeper = DisconnectedPlayerSweeper(
+            disconnect_timer_in_seconds=300,
+            interval_in_seconds=10,
+            batch_size=10,
+            should_sweep=partial(node.is_owner, SWEEPER_KEY),
+        )
+        sweeper._on_removed = on_removed
+        await sweeper.sweep()
+
+    on_removed.assert_awaited_once()
+    room_id, removed_players = on_removed.await_args.args
+    assert room_id == existing_room.room_id
+    assert [player.nickname for player in removed_players] == [existing_players[0].nickname]
+    assert existing_room.players == [existing_players[1]]
@@ -1,15 +1,24 @@
 from datetime import datetime
 
+from app.game_state.game_state_exceptions import GameStateNotFound
+from app.game_state.game_state_models import GameState
 from app.player.player_exceptions import PlayerNotFound
-from app.player.player_models import Player
-from app.room.room_exceptions import RoomExistsException, RoomNotFound
-from app.room.room_models import Room, RoomState
+from app.player.player_models import Player, PlayerSummary
+from app.room.room_exceptions import (
+    NicknameExistsException,
+    RoomExistsException,
+    RoomFullError,
+    RoomNotFound,
+    RoomNotJoinableError,
+)
+from app.room.room_models import Room, RoomContext, RoomState, RoomSummary
 from app.room.room_repository import RoomRepository
 
 
 class FakeRoomRepository(RoomRepository):
-    def __init__(self, rooms: list[Room]):
+    def __init__(self, rooms: list[Room], game_states: list[GameState] | None = None):
         self.rooms = rooms
+        self.game_states = game_states or []
 
     async def add(self, new_room: Room):
         for room in self.rooms:
@@ -21,6 +30,20 @@ class FakeRoomRepository(RoomRepository):
     async def add_player(self, room: Room, player: Player):
         room.players.append(player)
 
+    async def add_player_if_joinable(self, room_id: str, player: Player, maximum_players: int | None = None) -> Room:
+        room = await self.get(id_=room_id)
+        if not room.state.is_room_joinable:
+            raise RoomNotJoinableError(msg="room is not joinable", room_id=room_id, room_state=room.state)
+        elif any(existing_player.nickname == player.nickname for existing_player in room.players):
+            raise NicknameExistsException(msg="nickname already exists", nickname=player.nickname)
+        elif maximum_players and len(room.players) >= maximum_players:
+            raise RoomFullError(msg="room is full", room_id=room_id, maximum_players=maximum_players)
+
+        # like the conditional update, hand back a new document rather than mutating the caller's room
+        updated_room = room.copy(update={"players": [*room.players, player], "host": room.host or player.player_id})
+        self.rooms = [updated_room if r.room_id == room_id else r for r in self.rooms]
+        return updated_room
+
     async def get(self, id_: str) -> Room:
         for room in self.rooms:
             if room.room_id == id_:
@@ -34,6 +57,21 @@ class FakeRoomRepository(RoomRepository):
                     return room
         raise RoomNotFound("room not found using player id", id_=player_id)
 
+    async def get_summary(self, id_: str) -> RoomSummary:
+        room = await self.get(id_=id_)
+        return RoomSummary(**room.dict())
+
+    async def get_summary_by_player_id(self, player_id: str) -> RoomSummary:
+        room = await self.get_room_by_player_id(player_id=player_id)
+        return RoomSummary(**room.dict())
+
+    async def get_context(self, id_: str) -> RoomContext:
+        room = await self.get_summary(id_=id_)
+        for game_state in self.game_states:
+            if game_state.room_id == id_:
+                return RoomContext(room=room, game_state=game_state)
+        raise GameStateNotFound(msg="game state not found", room_identifier=id_)
+
     async def get_player(self, player_id: str) -> Player:
         for room in self.rooms:
             for player in room.players:
@@ -59,20 +97,41 @@ class FakeRoomRepository(RoomRepository):
                     return player
         raise PlayerNotFound("player not found")
 
+    async def remove_disconnected_players(
+        self, disconnected_before: datetime, limit: int
+    ) -> dict[str, list[PlayerSummary]]:
+        removed_players: dict[str, list[PlayerSummary]] = {}
+        for room in self.rooms:
+            if len(removed_players) == limit:
+                break
+
+            disconnected_players = [
+                player
+                for player in room.players
+                if player.disconnected_at and player.disconnected_at <= disconnected_before
+            ]
+            if disconnected_players:
+                room.players = [player for player in room.players if player not in disconnected_players]
+                removed_players[room.room_id] = [PlayerSummary(**player.dict()) for player in disconnected_players]
+        return removed_players
+
     async def remove(self, id_: str):
         return await super().remove(id_)
 
-    async def remove_player(self, room: Room, nickname: str) -> Player:
+    async def remove_player(self, room: Room | RoomSummary, nickname: str) -> Player:
         player = await self.get_player_by_nickname(room_id=room.room_id, nickname=nickname)
-        room.players = [player for player in room.players if player.nickname != nickname]
+        existing_room = await self.get(id_=room.room_id)
+        existing_room.players = [player for player in existing_room.players if player.nickname != nickname]
         return player
 
-    async def update_host(self, room: Room, player_id: str):
+    async def update_host(self, room: Room | RoomSummary, player_id: str):
+        room.host = player_id
         for r in self.rooms:
             if r.room_id == room.room_id:
                 r.host = player_id
 
-    async def update_game_state(self, room: Room, new_room_state: RoomState):
+    async def update_game_state(self, room: Room | RoomSummary, new_room_state: RoomState):
+        room.state = new_room_state
         for r in self.rooms:
             if r.room_id == room.room_id:
                 r.state = new_room_state
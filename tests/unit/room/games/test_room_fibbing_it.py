@@ -0,0 +1,54 @@
+import pytest
+from pytest_mock import MockFixture
+
+from app.game_state.game_state_models import (
+    FibbingItQuestion,
+    NextQuestion,
+    UpdateQuestionRoundState,
+)
+from app.player.player_models import PlayerSummary
+from app.room.games.fibbing_it import FibbingIt
+from tests.unit.data.data import starting_state
+from tests.unit.factories import GameStateFactory, PlayerFactory
+
+next_question = NextQuestion(
+    updated_round=UpdateQuestionRoundState(round_changed=False),
+    next_question=FibbingItQuestion(fibber_question="fibber question", question="question"),
+    timer_in_seconds=30,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_beanie_document(mocker: MockFixture):
+    mocker.patch("beanie.odm.documents.Document.get_settings")
+
+
+def test_should_send_next_question_to_room_and_fibber():
+    players = [PlayerSummary(**player.dict()) for player in PlayerFactory.build_batch(3)]
+    state = starting_state.copy(deep=True)
+    state.current_fibber_id = players[1].player_id
+    game_state = GameStateFactory.build(game_name="fibbing_it", state=state)
+
+    room_response, fibber_response = FibbingIt().got_next_question_responses(
+        room_id="room_id", players=players, game_state=game_state, next_question=next_question
+    )
+
+    assert room_response.send_to == "room_id"
+    assert room_response.skip_sid == players[1].latest_sid
+    assert room_response.response_data.question.question == "question"  # type: ignore
+    assert fibber_response.send_to == players[1].latest_sid
+    assert fibber_response.response_data.question.is_fibber is True  # type: ignore
+    assert fibber_response.response_data.question.question == "fibber question"  # type: ignore
+
+
+def test_should_send_next_question_to_room_without_fibber():
+    players = [PlayerSummary(**player.dict()) for player in PlayerFactory.build_batch(3)]
+    game_state = GameStateFactory.build(game_name="fibbing_it", state=starting_state.copy(deep=True))
+
+    event_responses = FibbingIt().got_next_question_responses(
+        room_id="room_id", players=players, game_state=game_state, next_question=next_question
+    )
+
+    assert len(event_responses) == 1
+    assert event_responses[0].send_to == "room_id"
+    assert event_responses[0].skip_sid is None
@@ -2,14 +2,15 @@ import pytest
 from pytest_mock import MockFixture
 
 from app.player.player_exceptions import PlayerNotFound
-from app.player.player_models import NewPlayer, Player
+from app.player.player_models import Player
 from app.room.room_exceptions import (
     NicknameExistsException,
+    RoomFullError,
     RoomHasNoHostError,
     RoomNotJoinableError,
 )
 from app.room.room_models import Room, RoomState
-from tests.unit.factories import PlayerFactory, RoomFactory, get_new_player
+from tests.unit.factories import PlayerFactory, RoomFactory, avatar_id, get_new_player
 from tests.unit.get_services import get_lobby_service, get_room_service
 
 
@@ -26,7 +27,9 @@ async def test_should_join_empty_room():
     new_player = get_new_player()
     room_players = await lobby_service.join(room_id=existing_room.room_id, new_player=new_player)
 
-    expected_player = Player(**new_player.dict(), player_id=room_players.player_id)
+    expected_player = Player(
+        **new_player.dict(exclude={"avatar"}), avatar_id=avatar_id, player_id=room_players.player_id
+    )
     assert room_players.players == [*existing_room.players, expected_player]
     assert room_players.host_player_nickname == expected_player.nickname
 
@@ -53,7 +56,9 @@ async def test_should_join_non_empty_room():
     new_player = get_new_player()
     room_players = await lobby_service.join(room_id=existing_room.room_id, new_player=new_player)
 
-    expected_player = Player(**new_player.dict(), player_id=room_players.player_id)
+    expected_player = Player(
+        **new_player.dict(exclude={"avatar"}), avatar_id=avatar_id, player_id=room_players.player_id
+    )
     expected_players = [expected_player, *existing_players]
     assert _sort_list_by_player_id(room_players.players) == _sort_list_by_player_id(expected_players)
     assert room_players.host_player_nickname != expected_player.nickname
@@ -67,13 +72,24 @@ async def test_should_not_join_room_nickname_exists():
     lobby_service = get_lobby_service(rooms=[existing_room])
     existing_room.host = existing_players[0].player_id
 
-    player: Player = PlayerFactory.build(nickname=existing_players[0].nickname)
-    new_player = NewPlayer(**player.dict())
+    new_player = get_new_player(nickname=existing_players[0].nickname)
 
     with pytest.raises(NicknameExistsException):
         await lobby_service.join(room_id=existing_room.room_id, new_player=new_player)
 
 
+@pytest.mark.asyncio
+async def test_should_not_join_full_room():
+    existing_players: list[Player] = PlayerFactory.build_batch(3)
+    existing_room: Room = RoomFactory.build(state=RoomState.CREATED, players=existing_players)
+
+    lobby_service = get_lobby_service(rooms=[existing_room])
+    existing_room.host = existing_players[0].player_id
+
+    with pytest.raises(RoomFullError):
+        await lobby_service.join(room_id=existing_room.room_id, new_player=get_new_player(), maximum_players=3)
+
+
 @pytest.mark.asyncio
 async def test_should_rejoin_room():
     existing_players: list[Player] = PlayerFactory.build_batch(3)
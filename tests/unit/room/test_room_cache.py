@@ -0,0 +1,51 @@
+import pytest
+from pytest_mock import MockFixture
+
+from app.room.room_cache import RoomCache
+from app.room.room_models import Room
+from tests.unit.factories import PlayerFactory, RoomFactory
+
+
+@pytest.fixture(autouse=True)
+def mock_beanie_document(mocker: MockFixture):
+    mocker.patch("beanie.odm.documents.Document.get_settings")
+
+
+@pytest.mark.asyncio
+async def test_should_get_cached_room_by_player_id():
+    room: Room = RoomFactory.build()
+    room_cache = RoomCache(max_entries=10, ttl_in_seconds=60)
+    room_cache.set(room)
+
+    cached_room = room_cache.get_by_player_id(player_id=room.players[0].player_id)
+    assert cached_room == room
+    assert cached_room is not room
+
+    cached_room.players.append(PlayerFactory.build())
+    assert room_cache.get(room.room_id) == room
+
+    await room_cache.invalidate(room.room_id)
+    assert room_cache.get(room.room_id) is None
+    assert room_cache.get_by_player_id(player_id=room.players[0].player_id) is None
+    assert room_cache.stats.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_should_not_cache_room_read_before_invalidation():
+    room: Room = RoomFactory.build()
+    room_cache = RoomCache(max_entries=10, ttl_in_seconds=60)
+
+    read_at = room_cache.generation
+    await room_cache.invalidate(room.room_id)
+    room_cache.set(room, read_at=read_at)
+    assert room_cache.get(room.room_id) is None
+
+    read_at = room_cache.generation
+    await room_cache.invalidate(RoomFactory.build().room_id)
+    room_cache.set(room, read_at=read_at)
+    assert room_cache.get(room.room_id) == room
+
+    read_at = room_cache.generation
+    await room_cache.invalidate()
+    room_cache.set(room, read_at=read_at)
+    assert room_cache.get(room.room_id) is None
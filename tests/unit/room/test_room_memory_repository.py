@@ -0,0 +1,139 @@
+from datetime import datetime
+
+import pytest
+from pytest_mock import MockFixture
+
+from app.game_state.game_state_memory_repository import InMemoryGameStateRepository
+from app.player.player_exceptions import PlayerNotFound
+from app.player.player_models import Player
+from app.room.room_exceptions import (
+    NicknameExistsException,
+    RoomFullError,
+    RoomNotFound,
+)
+from app.room.room_memory_repository import InMemoryRoomRepository
+from app.room.room_models import Room, RoomState
+from tests.unit.factories import GameStateFactory, PlayerFactory, RoomFactory
+
+
+@pytest.fixture(autouse=True)
+def mock_beanie_document(mocker: MockFixture):
+    mocker.patch("beanie.odm.documents.Document.get_settings")
+
+
+@pytest.mark.asyncio
+async def test_should_index_players_joining_room():
+    room: Room = RoomFactory.build(state=RoomState.CREATED, players=[])
+    room_repository = InMemoryRoomRepository(game_state_repository=InMemoryGameStateRepository())
+    await room_repository.add(room)
+
+    player: Player = PlayerFactory.build()
+    joined_room = await room_repository.add_player_if_joinable(room_id=room.room_id, player=player, maximum_players=2)
+    assert joined_room.host == player.player_id
+
+    with pytest.raises(NicknameExistsException):
+        await room_repository.add_player_if_joinable(room_id=room.room_id, player=player, maximum_players=2)
+
+    await room_repository.update_sid(player_id=player.player_id, sid="new_sid")
+    assert await room_repository.get_player_by_sid(sid="new_sid") == player.copy(update={"latest_sid": "new_sid"})
+    with pytest.raises(PlayerNotFound):
+        await room_repository.get_player_by_sid(sid=player.latest_sid)
+
+    second_player = PlayerFactory.build(nickname=f"{player.nickname}_2")
+    await room_repository.add_player_if_joinable(room_id=room.room_id, player=second_player, maximum_players=2)
+    with pytest.raises(RoomFullError):
+        third_player = PlayerFactory.build(nickname=f"{player.nickname}_3")
+        await room_repository.add_player_if_joinable(room_id=room.room_id, player=third_player, maximum_players=2)
+
+
+@pytest.mark.asyncio
+async def test_should_not_share_stored_rooms():
+    room: Room = RoomFactory.build()
+    room_repository = InMemoryRoomRepository(game_state_repository=InMemoryGameStateRepository())
+    await room_repository.add(room)
+
+    room.host = "someone else"
+    stored_room = await room_repository.get(id_=room.room_id)
+    stored_room.players = []
+    assert (await room_repository.get(id_=room.room_id)).host is None
+    assert len(await room_repository.get_all_players(room_id=room.room_id)) == len(room.players)
+
+
+@pytest.mark.asyncio
+async def test_should_remove_disconnected_players():
+    player: Player = PlayerFactory.build(disconnected_at=datetime(2022, 1, 1))
+    room: Room = RoomFactory.build(players=[player, PlayerFactory.build(nickname=f"{player.nickname}_2")])
+    room_repository = InMemoryRoomRepository(game_state_repository=InMemoryGameStateRepository())
+    await room_repository.add(room)
+
+    removed_players = await room_repository.remove_disconnected_players(disconnected_before=datetime.now(), limit=10)
+    assert [removed.player_id for removed in removed_players[room.room_id]] == [player.player_id]
+    with pytest.raises(PlayerNotFound):
+        await room_repository.get_player_by_nickname(room_id=room.room_id, nickname=player.nickname)
+
+
+@pytest.mark.asyncio
+async def test_should_get_room_context():
+    room: Room = RoomFactory.build()
+    game_state_repository = InMemoryGameStateRepository()
+    await game_state_repository.add(GameStateFactory.build(room_id=room.room_id))
+    room_repository = InMemoryRoomRepository(game_state_repository=game_state_repository)
+    await room_repository.add(room)
+
+    room_context = await room_repository.get_context(id_=room.room_id)
+    assert room_context.room.room_id == room_context.game_state.room_id == room.room_id
+
+
+@pytest.mark.asyncio
+async def test_should_only_evict_rooms_written_to_the_database(mocker: MockFixture):
+    room: Room = RoomFactory.build()
+    changed_room: Room = RoomFactory.build()
+    room_repository = InMemoryRoomRepository(game_state_repository=InMemoryGameStateRepository())
+    await room_repository.add(room)
+    await room_repository.add(changed_room)
+    mocker.patch("app.room.room_memory_repository.write_snapshot")
+    await room_repository.snapshot()
+    await room_repository.update_host(room=changed_room, player_id=changed_room.players[0].player_id)
+
+    assert room_repository.evict(keep=lambda _: False) == {room.room_id}
+    with pytest.raises(RoomNotFound):
+        await room_repository.get(id_=room.room_id)
+    with pytest.raises(PlayerNotFound):
+        await room_repository.get_player(player_id=room.players[0].player_id)
+    assert (await room_repository.get(id_=changed_room.room_id)).host == changed_room.players[0].player_id
+
+
+@pytest.mark.asyncio
+async def test_should_load_rooms_owned_by_this_node(mocker: MockFixture):
+    room: Room = RoomFactory.build()
+    other_room: Room = RoomFactory.build()
+    changed_room: Room = RoomFactory.build()
+    room_repository = InMemoryRoomRepository(game_state_repository=InMemoryGameStateRepository())
+    await room_repository.add(changed_room)
+
+    async def find(*_):
+        for stored_room in (room, other_room, changed_room.copy(update={"host": "someone else"})):
+            yield stored_room
+
+    mocker.patch.object(Room, "find", find)
+    await room_repository.load(owns=lambda room_id: room_id != other_room.room_id)
+
+    assert await room_repository.get_player(player_id=room.players[0].player_id) == room.players[0]
+    with pytest.raises(RoomNotFound):
+        await room_repository.get(id_=other_room.room_id)
+    assert (await room_repository.get(id_=changed_room.room_id)).host == changed_room.host
+
+
+@pytest.mark.asyncio
+async def test_should_only_query_rooms_in_gained_ranges(mocker: MockFixture):
+    room_repository = InMemoryRoomRepository(game_state_repository=InMemoryGameStateRepository())
+    find = mocker.patch.object(Room, "find", return_value=mocker.MagicMock())
+    find.return_value.__aiter__.return_value = []
+
+    await room_repository.load(owns=lambda _: True, ranges=[])
+    find.assert_not_called()
+
+    await room_repository.load(owns=lambda _: True, ranges=[("00", "80"), ("c0", None)])
+    find.assert_called_once_with(
+        {"$or": [{"ring_position": {"$gte": "00", "$lt": "80"}}, {"ring_position": {"$gte": "c0"}}]}
+    )
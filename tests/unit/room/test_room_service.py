@@ -3,11 +3,17 @@ from datetime import datetime, timedelta
 import pytest
 from pytest_mock import MockFixture
 
+from app.core.room_ownership import NODE_CHANNEL, HashRing, RoomRouter
+from app.game_state.game_state_exceptions import GameStateNotFound
+from app.game_state.game_state_memory_repository import InMemoryGameStateRepository
 from app.game_state.game_state_models import GamePaused
 from app.player.player_exceptions import PlayerNotHostError
+from app.player.player_models import Player
 from app.room.room_exceptions import RoomInInvalidState, RoomNotFound
+from app.room.room_memory_repository import InMemoryRoomRepository
 from app.room.room_models import Room, RoomState
-from tests.unit.factories import GameStateFactory, RoomFactory
+from app.room.room_service import RoomService
+from tests.unit.factories import GameStateFactory, PlayerFactory, RoomFactory
 from tests.unit.get_services import get_game_state_service, get_room_service
 
 
@@ -33,6 +39,37 @@ async def test_should_get_room():
     assert room == existing_room
 
 
+@pytest.mark.asyncio
+async def test_should_get_room_summary_without_avatars():
+    existing_room: Room = RoomFactory.build()
+    room_service = get_room_service(rooms=[existing_room])
+
+    room = await room_service.get_summary(room_id=existing_room.room_id)
+    assert room.room_id == existing_room.room_id
+    assert [player.player_id for player in room.players] == [player.player_id for player in existing_room.players]
+    assert all(not hasattr(player, "avatar") for player in room.players)
+
+
+@pytest.mark.asyncio
+async def test_should_get_room_context():
+    existing_room: Room = RoomFactory.build()
+    existing_game_state = GameStateFactory.build(room_id=existing_room.room_id)
+    room_service = get_room_service(rooms=[existing_room], game_states=[existing_game_state])
+
+    room_context = await room_service.get_context(room_id=existing_room.room_id)
+    assert room_context.room.room_id == existing_room.room_id
+    assert room_context.game_state == existing_game_state
+
+
+@pytest.mark.asyncio
+async def test_should_not_get_room_context_without_game_state():
+    existing_room: Room = RoomFactory.build()
+    room_service = get_room_service(rooms=[existing_room])
+
+    with pytest.raises(GameStateNotFound):
+        await room_service.get_context(room_id=existing_room.room_id)
+
+
 @pytest.mark.asyncio
 async def test_should_not_get_room_not_found():
     room_service = get_room_service()
@@ -137,3 +174,25 @@ async def test_should_not_unpause_room_invalid_state():
             player_id=existing_room.host or "",
             game_state_service=game_state_service,
         )
+
+
+@pytest.mark.asyncio
+async def test_should_create_room_owned_by_this_node(mocker: MockFixture):
+    node_a = RoomRouter(redis=mocker.AsyncMock(), heartbeat_interval_in_seconds=1, node_ttl_in_seconds=3)
+    node_b = RoomRouter(redis=mocker.AsyncMock(), heartbeat_interval_in_seconds=1, node_ttl_in_seconds=3)
+    node_a.ring = node_b.ring = HashRing([node_a.node_id, node_b.node_id])
+    node_b.redis.publish.return_value = 1
+    room_repository = InMemoryRoomRepository(game_state_repository=InMemoryGameStateRepository())
+    room_service = RoomService(room_repository=room_repository, is_owner=node_a.is_owner)
+
+    for _ in range(20):
+        room = await room_service.create()
+        player: Player = PlayerFactory.build()
+        join_room = {"room_code": room.room_id, "nickname": player.nickname, "avatar": ""}
+
+        assert await node_b.forward(room.room_id, "JOIN_ROOM", player.latest_sid, join_room)
+        channel, _ = node_b.redis.publish.await_args.args
+        assert channel == f"{NODE_CHANNEL}:{node_a.node_id}"
+        assert not await node_a.forward(room.room_id, "JOIN_ROOM", player.latest_sid, join_room)
+        joined_room = await room_repository.add_player_if_joinable(room_id=room.room_id, player=player)
+        assert joined_room.players == [player]
@@ -0,0 +1,73 @@
+import pickle
+
+import pytest
+import socketio
+from pytest_mock import MockFixture
+from socketio import packet
+
+from app.socket_manager import RoomAffinityRedisManager, get_packet_class, room_emit
+
+
+def test_should_encode_a_room_emit_once():
+    packet_class = get_packet_class("default")
+    payload = {"nickname": "player"}
+
+    with room_emit():
+        first = packet_class(packet.EVENT, data=["ROOM_JOINED", payload]).encode()
+        second = packet_class(packet.EVENT, data=["ROOM_JOINED", payload]).encode()
+
+    assert first is second
+
+
+def test_should_not_reuse_encodings_across_emits():
+    packet_class = get_packet_class("default")
+    payload = {"nickname": "player"}
+
+    with room_emit():
+        first = packet_class(packet.EVENT, data=["ROOM_JOINED", payload]).encode()
+    payload["nickname"] = "another player"
+    with room_emit():
+        second = packet_class(packet.EVENT, data=["ROOM_JOINED", payload]).encode()
+
+    assert first != second
+    assert "another player" in second
+
+
+@pytest.mark.asyncio
+async def test_should_decode_pubsub_messages_once(mocker: MockFixture):
+    emit = {"method": "emit", "event": "ROOM_JOINED", "data": {"nickname": "player"}, "namespace": "/"}
+    enter_room = {"method": "enter_room", "sid": "sid", "namespace": "/", "room": "room"}
+
+    async def listen(_):
+        for message in (pickle.dumps(emit), pickle.dumps(enter_room), b"not pickled"):
+            yield message
+
+    mocker.patch.object(socketio.AsyncRedisManager, "_listen", listen)
+    manager = RoomAffinityRedisManager("redis://localhost")
+    mocker.patch.object(manager, "is_connected", return_value=True)
+    manager_enter_room = mocker.patch.object(manager, "enter_room")
+
+    messages = [message async for message in manager._listen()]
+
+    assert messages == [emit, b"not pickled"]
+    manager_enter_room.assert_called_once_with("sid", "/", "room")
+
+
+@pytest.mark.asyncio
+async def test_should_enter_room_on_node_client_is_connected_to(mocker: MockFixture):
+    manager = RoomAffinityRedisManager("redis://localhost")
+    publish = mocker.patch.object(manager, "_publish", mocker.AsyncMock())
+    manager_enter_room = mocker.patch.object(manager, "enter_room")
+    manager_leave_room = mocker.patch.object(manager, "leave_room")
+
+    mocker.patch.object(manager, "is_connected", return_value=True)
+    await manager.enter_room_on_any_node("sid", "/", "room")
+    await manager.leave_room_on_any_node("sid", "/", "room")
+    manager_enter_room.assert_called_once_with("sid", "/", "room")
+    manager_leave_room.assert_called_once_with("sid", "/", "room")
+    publish.assert_not_awaited()
+
+    mocker.patch.object(manager, "is_connected", return_value=False)
+    await manager.enter_room_on_any_node("sid", "/", "room")
+    await manager.leave_room_on_any_node("sid", "/", "room")
+    assert [call.args[0]["method"] for call in publish.await_args_list] == ["enter_room", "leave_room"]